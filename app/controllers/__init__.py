@@ -3,19 +3,42 @@ Controller package exports.
 
 This file exists to make controller modules discoverable to static analysis
 (PyCharm inspections) and to provide a stable import surface.
+
+Exports are resolved lazily (PEP 562) so importing a single submodule such as
+`app.controllers.block_manager` does not pull in the whole controller graph
+via MainWindowController.
 """
 
-# Canonical controllers
-from .main_window_controller import MainWindowController  # noqa: F401
-from .pronunciation_controller import PronunciationController  # noqa: F401
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .main_window_controller import MainWindowController  # noqa: F401
+    from .pronunciation_controller import PronunciationController  # noqa: F401
 
-# Legacy compatibility:
-# Some older code expected `app.controllers.block_manager` to be a module.
-# That functionality now lives in main_window_controller.
-from . import main_window_controller as block_manager  # noqa: F401
+# Canonical controllers, by defining submodule.
+_LAZY_EXPORTS = {
+    "MainWindowController": ".main_window_controller",
+    "PronunciationController": ".pronunciation_controller",
+}
 
 __all__ = [
     "MainWindowController",
     "PronunciationController",
     "block_manager",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "block_manager":
+        # BlockManager lives in its own module again; this used to alias
+        # main_window_controller for older callers.
+        return importlib.import_module(".block_manager", __name__)
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -20,18 +20,15 @@ class BlockManager:
     """Caches one BlockContainer per BlockType and preserves per-type state."""
 
     def __init__(self) -> None:
-        self._containers = {
-            BlockType.A_RightBranch: BlockContainer(BlockType.A_RightBranch),
-            BlockType.B_TopBranch: BlockContainer(BlockType.B_TopBranch),
-            BlockType.C_BottomBranch: BlockContainer(BlockType.C_BottomBranch),
-            BlockType.D_Horizontal: BlockContainer(BlockType.D_Horizontal),
-        }
+        # Filled on first use by _container(); most sessions touch only a few types.
+        self._containers: dict[BlockType, BlockContainer] = {}
         self._order = [
             BlockType.A_RightBranch,
             BlockType.B_TopBranch,
             BlockType.C_BottomBranch,
             BlockType.D_Horizontal,
         ]
+        self._order_index = {bt: i for i, bt in enumerate(self._order)}
         self._current_index = 0  # start on Type A
         self._names = [
             "Type A — Right-branching",
@@ -40,6 +37,12 @@ class BlockManager:
             "Type D — Horizontal",
         ]
 
+    def _container(self, block_type: BlockType) -> BlockContainer:
+        container = self._containers.get(block_type)
+        if container is None:
+            container = self._containers[block_type] = BlockContainer(block_type)
+        return container
+
     def current_type(self) -> BlockType:
         return self._order[self._current_index]
 
@@ -57,7 +60,7 @@ class BlockManager:
         syll_label: Optional[QLabel] = None,
     ) -> None:
         # Use A_RightBranch container for a stable consonant-only view
-        container = self._containers[BlockType.A_RightBranch]
+        container = self._container(BlockType.A_RightBranch)
         container.consonant_only(stacked, consonant)
         self._current_index = 0
         if type_label is not None:
@@ -73,7 +76,7 @@ class BlockManager:
         syll_label: Optional[QLabel] = None,
     ) -> None:
         ctype = self.current_type()
-        container = self._containers[ctype]
+        container = self._container(ctype)
         container.attach(stacked)
         try:
             _glyph = select_syllable_for_block(ctype)
@@ -100,11 +103,8 @@ class BlockManager:
         syll_label: Optional[QLabel] = None,
     ) -> None:
         bt = block_type_for_pair(consonant, vowel)
-        try:
-            self._current_index = self._order.index(bt)
-        except ValueError:
-            self._current_index = 0
-        container = self._containers[bt]
+        self._current_index = self._order_index.get(bt, 0)
+        container = self._container(bt)
         glyph = compose_cv(consonant, vowel) or ""
         if _DEBUG_BLOCK_MANAGER:
             logger.info(
@@ -130,11 +130,8 @@ class BlockManager:
         type_label: Optional[QLabel] = None,
         syll_label: Optional[QLabel] = None,
     ) -> None:
-        try:
-            self._current_index = self._order.index(block_type)
-        except ValueError:
-            self._current_index = 0
-        container = self._containers[block_type]
+        self._current_index = self._order_index.get(block_type, 0)
+        container = self._container(block_type)
         glyph = compose_cv(consonant, vowel) or ""
         container.attach(stacked, consonant=consonant, vowel=vowel, glyph=glyph)
         if type_label is not None:
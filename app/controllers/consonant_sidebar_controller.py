@@ -9,6 +9,20 @@ from app.controllers.study_item_repository import StudyItemRepository
 from app.ui.utils.qt_find import find_child
 
 
+def _set_sidebar_state(label: QLabel, state: str) -> None:
+    """Select one of the sidebar label rules in the main window stylesheet (form.ui).
+
+    Only the dynamic property changes, so no stylesheet text is re-parsed, and
+    labels already in the requested state are left alone.
+    """
+    if label.property("sidebarState") == state:
+        return
+    label.setProperty("sidebarState", state)
+    style = label.style()
+    style.unpolish(label)
+    style.polish(label)
+
+
 class ConsonantSidebarController:
     """Show a faint consonant-major sidebar with the current consonant highlighted."""
 
@@ -52,7 +66,7 @@ class ConsonantSidebarController:
             self._container.setVisible(True)
             for label in self._labels:
                 label.setText("")
-                label.setStyleSheet("color: transparent;")
+                _set_sidebar_state(label, "hidden")
             return
         self._container.setVisible(True)
         if not self._consonants:
@@ -67,15 +81,10 @@ class ConsonantSidebarController:
         start = max(0, min(current_index - window // 2, total - window))
         visible = self._consonants[start : start + window]
 
-        for label in self._labels:
-            label.setText("")
-            label.setStyleSheet("color: #bbbbbb;")
-
-        for idx, glyph in enumerate(visible):
-            label = self._labels[idx]
+        for idx, label in enumerate(self._labels):
+            glyph = visible[idx] if idx < len(visible) else ""
             label.setText(glyph)
-            if glyph == consonant:
-                label.setStyleSheet("color: #222222; font-weight: 600;")
+            _set_sidebar_state(label, "current" if glyph and glyph == consonant else "dim")
 
     def _build_labels(self) -> None:
         if self._layout is None:
@@ -93,6 +102,6 @@ class ConsonantSidebarController:
         for _ in range(count):
             label = QLabel("", self._container)
             label.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignVCenter)
-            label.setStyleSheet("color: #bbbbbb;")
+            _set_sidebar_state(label, "dim")
             self._layout.addWidget(label)
             self._labels.append(label)
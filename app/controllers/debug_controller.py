@@ -18,6 +18,6 @@ class DebugController:
         if str(os.getenv("HANGUL_DEBUG_JAMO", "")).strip().lower() not in ("1", "true", "yes", "on"):
             return
         try:
-            self._jamo_block.debug_dump_current_template(prefix="[DEBUG]")
+            self._jamo_block.debug_dump_current_template(prefix="[DEBUG]", force=True)
         except Exception:
             pass
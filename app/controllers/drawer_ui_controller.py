@@ -7,6 +7,7 @@ from PyQt6.QtWidgets import QFrame, QMainWindow, QPushButton, QToolBar, QWidget
 
 from app.controllers.drawer_controller import DrawerController
 from app.ui.icons import build_hamburger_icon
+from app.ui.utils.qt_find import find_child
 
 
 class DrawerUiController:
@@ -17,7 +18,7 @@ class DrawerUiController:
         self._drawer_controller: Optional[DrawerController] = None
 
     def wire(self) -> None:
-        drawer = self._window.findChild(QFrame, "drawerLeft")
+        drawer = find_child(self._window, QFrame, "drawerLeft")
         self._drawer_controller = DrawerController(drawer)
         if self._drawer_controller is None:
             return
@@ -25,7 +26,7 @@ class DrawerUiController:
         if drawer is not None:
             self._drawer_controller.hide()
 
-        close_btn = self._window.findChild(QPushButton, "buttonCloseDrawer")
+        close_btn = find_child(self._window, QPushButton, "buttonCloseDrawer")
         if close_btn is not None:
             try:
                 close_btn.clicked.connect(self._drawer_controller.hide)
@@ -35,7 +36,7 @@ class DrawerUiController:
         if isinstance(self._window, QMainWindow):
             self._wire_toolbar_action()
 
-        button_hamburger = self._window.findChild(QPushButton, "buttonHamburger")
+        button_hamburger = find_child(self._window, QPushButton, "buttonHamburger")
         if button_hamburger is not None:
             try:
                 button_hamburger.clicked.connect(self._drawer_controller.toggle)
@@ -54,7 +55,7 @@ class DrawerUiController:
             pass
 
         try:
-            toolbar = self._window.findChild(QToolBar, "mainToolbar")
+            toolbar = find_child(self._window, QToolBar, "mainToolbar")
             if toolbar is None:
                 toolbar = QToolBar("MainToolbar", self._window)
                 toolbar.setObjectName("mainToolbar")
@@ -15,6 +15,7 @@ logger = logging.getLogger(__name__)
 from app.controllers.examples_selector import ExamplesSelector
 from app.controllers.examples_repository import ExampleItem
 from app.services.tts_pronouncer import play_wav
+from app.ui.utils.qt_find import find_child
 
 
 class ExamplesUiController:
@@ -45,12 +46,12 @@ class ExamplesUiController:
         self.btn_hear: Optional[QPushButton] = None
 
     def wire(self) -> None:
-        self.label_hangul = self._window.findChild(QLabel, "labelExampleHangul")
-        self.label_hangul_plain = self._window.findChild(QLabel, "labelExampleHangulPlain")
-        self.label_rr = self._window.findChild(QLabel, "labelExampleRR")
-        self.label_gloss = self._window.findChild(QLabel, "labelExampleGloss")
-        self.label_image = self._window.findChild(QLabel, "labelExampleImage")
-        self.btn_hear = self._window.findChild(QPushButton, "btnExampleHear")
+        self.label_hangul = find_child(self._window, QLabel, "labelExampleHangul")
+        self.label_hangul_plain = find_child(self._window, QLabel, "labelExampleHangulPlain")
+        self.label_rr = find_child(self._window, QLabel, "labelExampleRR")
+        self.label_gloss = find_child(self._window, QLabel, "labelExampleGloss")
+        self.label_image = find_child(self._window, QLabel, "labelExampleImage")
+        self.btn_hear = find_child(self._window, QPushButton, "btnExampleHear")
         if self.btn_hear is not None:
             self.btn_hear.clicked.connect(self._on_hear_clicked)
         try:
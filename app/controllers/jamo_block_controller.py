@@ -7,7 +7,7 @@ from PyQt6.QtWidgets import QLabel, QFrame, QLayout, QStackedWidget, QWidget
 
 from app.controllers.block_manager import BlockManager
 from app.controllers.template_navigator import TemplateNavigator
-from app.ui.utils.qt_find import require_child
+from app.ui.utils.qt_find import find_child, require_child
 from app.ui.widgets.jamo_block import JamoBlock
 
 
@@ -41,29 +41,24 @@ class JamoBlockController:
         cast(QLayout, layout).addWidget(jamo_block)
 
         self.jamo_block = jamo_block
-        setattr(self._window, "_jamo_block", jamo_block)
+        self._window._jamo_block = jamo_block
 
-        stacked = require_child(jamo_block, QStackedWidget, "stackedTemplates")
+        stacked = jamo_block.stacked
         self.stacked = stacked
         self.template_nav = TemplateNavigator(stacked)
 
         self.block_manager = BlockManager()
-        setattr(self._window, "_block_manager", self.block_manager)
+        self._window._block_manager = self.block_manager
 
-        syll_label = self._window.findChild(QLabel, "labelSyllableRight")
+        syll_label = find_child(self._window, QLabel, "labelSyllableRight")
         self.syllable_label = syll_label
         if syll_label is not None:
             syll_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             syll_label.setText("")
 
+        # The first render is left to the caller (NavigationController), which
+        # knows the active mode; rendering here would only be overwritten.
         self._current_pair = (initial_consonant, initial_vowel)
-        self.block_manager.show_pair(
-            stacked=stacked,
-            consonant=initial_consonant,
-            vowel=initial_vowel,
-            syll_label=syll_label,
-            type_label=None,
-        )
 
     def go_next_template(self) -> None:
         """Cycle the template page (block type) and re-render on that page."""
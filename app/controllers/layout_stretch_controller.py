@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from PyQt6.QtWidgets import QHBoxLayout, QWidget
 
+from app.ui.utils.qt_find import find_child
+
 
 class LayoutStretchController:
     """Apply stretch factors to a named QHBoxLayout."""
@@ -12,7 +14,7 @@ class LayoutStretchController:
         self._stretches = stretches
 
     def wire(self) -> None:
-        layout = self._window.findChild(QHBoxLayout, self._layout_name)
+        layout = find_child(self._window, QHBoxLayout, self._layout_name)
         if layout is None:
             return
         if layout.count() < len(self._stretches):
@@ -162,7 +162,8 @@ class MainWindowController:
             get_mode_text=self._current_mode_text,
             compose_cv=compose_cv,
         )
-        self._navigation.render_current()
+        # No render here: _wire_controls() calls on_mode_changed() once the mode
+        # selector is wired, which renders the current item for the real mode.
         if self._playback_adapter is not None:
             self._playback_adapter.set_navigation(self._navigation)
             self._playback_adapter.set_syllable_label(self.syllable_label)
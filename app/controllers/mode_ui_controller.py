@@ -6,6 +6,7 @@ from PyQt6.QtWidgets import QComboBox, QWidget
 
 from app.controllers.mode_controller import ModeController
 from app.controllers.navigation_controller import NavigationController
+from app.ui.utils.qt_find import find_child
 
 
 class ModeUiController:
@@ -44,7 +45,7 @@ class ModeUiController:
 
     def _find_combo(self) -> QComboBox | None:
         for name in self._combo_names:
-            combo = self._window.findChild(QComboBox, name)
+            combo = find_child(self._window, QComboBox, name)
             if isinstance(combo, QComboBox):
                 return combo
         return None
@@ -5,6 +5,7 @@ from typing import Callable, Optional
 from PyQt6.QtWidgets import QLabel, QGroupBox, QWidget
 
 from app.domain.hangul_compose import compose_cv
+from app.ui.utils.qt_find import find_child
 
 
 class NotesUiController:
@@ -24,8 +25,8 @@ class NotesUiController:
         self._panel: Optional[QGroupBox] = None
 
     def wire(self) -> None:
-        self._label = self._window.findChild(QLabel, "labelNotesPlaceholder")
-        self._panel = self._window.findChild(QGroupBox, "groupNotesPanel")
+        self._label = find_child(self._window, QLabel, "labelNotesPlaceholder")
+        self._panel = find_child(self._window, QGroupBox, "groupNotesPanel")
         self.update()
 
     def update(self) -> None:
@@ -5,6 +5,8 @@ from typing import Optional, cast
 
 from PyQt6.QtWidgets import QWidget
 
+from app.ui.utils.qt_find import find_child
+
 
 class PlayChipState(Enum):
     PLAY = auto()
@@ -41,7 +43,7 @@ def set_controls_for_repeats_locked(window: QWidget, locked: bool) -> None:
 
         for name in names:
             try:
-                w = cast(Optional[QWidget], window.findChild(QWidget, name))
+                w = cast(Optional[QWidget], find_child(window, QWidget, name))
                 if w is not None:
                     w.setEnabled(is_enabled)
             except Exception:
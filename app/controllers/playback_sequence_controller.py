@@ -28,6 +28,18 @@ class PlaybackSequenceController(QObject):
         self._running = False
         self._on_finished: Optional[Callable[[], None]] = None
 
+        # Per-run state, set by start().
+        self._glyph = ""
+        self._reps_left = 0
+        self._delays = DelaysConfig()
+        self._auto_mode = False
+
+        # One reusable timer drives every delay; _next_step is what it runs.
+        self._next_step: Optional[Callable[[], None]] = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timeout)
+
     def is_running(self) -> bool:
         return self._running
 
@@ -36,6 +48,8 @@ class PlaybackSequenceController(QObject):
 
     def cancel(self) -> None:
         self._gen += 1
+        self._timer.stop()
+        self._next_step = None
         if self._running:
             self._running = False
             cb = self._on_finished
@@ -49,80 +63,85 @@ class PlaybackSequenceController(QObject):
 
     def start(self, glyph: str, repeat_count: int, delays: DelaysConfig, auto_mode: bool = False) -> None:
         self.cancel()
-        token = self._gen
         self._running = True
+        self._glyph = glyph
+        self._reps_left = max(1, int(repeat_count))
+        self._delays = delays
+        self._auto_mode = auto_mode
 
-        def _valid() -> bool:
-            return self._running and token == self._gen
-
-        def _finish() -> None:
-            if not _valid():
-                return
-            self._running = False
-            cb = self._on_finished
-            if cb is not None:
-                try:
-                    cb()
-                except Exception:
-                    pass
+        if delays.pre_first_ms > 0:
+            self._schedule(self._gen, delays.pre_first_ms, self._play_one)
+        else:
+            self._play_one()
+
+    # ------------------------------------------------------------
+    # Sequence steps: play x N -> hints -> extras -> (auto-advance) -> finish
+    #
+    # Every step that runs a callback (TTS, reveals, auto-advance) captures the
+    # run token first: the callback may cancel and start a new run, and the old
+    # run must then neither queue its next step nor finish the new run.
+    # ------------------------------------------------------------
+
+    def _current(self, token: int) -> bool:
+        return self._running and token == self._gen
+
+    def _schedule(self, token: int, delay_ms: int, step: Callable[[], None]) -> None:
+        if not self._current(token):
+            return
+        self._next_step = step
+        self._timer.start(max(0, int(delay_ms)))
+
+    def _on_timeout(self) -> None:
+        step, self._next_step = self._next_step, None
+        if step is not None and self._running:
+            step()
+
+    def _play_one(self) -> None:
+        token = self._gen
+        try:
+            self._tts_play(self._glyph, lambda: self._after_one(token))
+        except Exception:
+            self._schedule(token, 0, lambda: self._after_one(token))
+
+    def _after_one(self, token: int) -> None:
+        if not self._current(token):
+            return
+        if self._reps_left > 1:
+            self._reps_left -= 1
+            self._schedule(token, self._delays.between_reps_ms, self._play_one)
+        else:
+            self._schedule(token, self._delays.before_hints_ms, self._do_hints)
 
-        def _play_n(n_left: int) -> None:
-            if not _valid():
-                return
+    def _do_hints(self) -> None:
+        token = self._gen
+        try:
+            self._on_reveal_hints()
+        finally:
+            self._schedule(token, self._delays.before_extras_ms, self._do_extras)
 
-            def _after_one() -> None:
-                if not _valid():
-                    return
-                if n_left > 1:
-                    QTimer.singleShot(max(0, int(delays.between_reps_ms)), lambda: _play_n(n_left - 1))
-                else:
-                    _after_repeats()
+    def _do_extras(self) -> None:
+        token = self._gen
+        try:
+            self._on_reveal_extras()
+        finally:
+            if self._auto_mode:
+                self._schedule(token, self._delays.auto_advance_ms, self._do_autoadvance)
+            else:
+                self._finish(token)
+
+    def _do_autoadvance(self) -> None:
+        # on_autoadvance may start the next run; only finish if it did not.
+        token = self._gen
+        self._on_autoadvance()
+        self._finish(token)
 
+    def _finish(self, token: int) -> None:
+        if not self._current(token):
+            return
+        self._running = False
+        cb = self._on_finished
+        if cb is not None:
             try:
-                self._tts_play(glyph, _after_one)
+                cb()
             except Exception:
-                QTimer.singleShot(0, _after_one)
-
-        def _after_repeats() -> None:
-            if not _valid():
-                return
-
-            def _do_hints() -> None:
-                if not _valid():
-                    return
-                try:
-                    self._on_reveal_hints()
-                finally:
-                    _after_hints()
-
-            QTimer.singleShot(max(0, int(delays.before_hints_ms)), _do_hints)
-
-        def _after_hints() -> None:
-            if not _valid():
-                return
-
-            def _do_extras() -> None:
-                if not _valid():
-                    return
-                try:
-                    self._on_reveal_extras()
-                finally:
-                    _after_extras()
-
-            QTimer.singleShot(max(0, int(delays.before_extras_ms)), _do_extras)
-
-        def _after_extras() -> None:
-            if not _valid():
-                return
-            if auto_mode:
-                QTimer.singleShot(
-                    max(0, int(delays.auto_advance_ms)),
-                    lambda: (self._on_autoadvance(), _finish()),
-                )
-                return
-            _finish()
-
-        if delays.pre_first_ms > 0:
-            QTimer.singleShot(int(delays.pre_first_ms), lambda: _play_n(max(1, int(repeat_count))))
-        else:
-            _play_n(max(1, int(repeat_count)))
+                pass
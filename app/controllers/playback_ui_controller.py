@@ -7,6 +7,7 @@ from PyQt6.QtWidgets import QPushButton, QWidget
 from app.controllers.playback_controls_controller import PlayChipState, set_controls_for_repeats_locked
 from app.controllers.playback_sequence_controller import PlaybackSequenceController
 from app.domain.enums import DelaysConfig
+from app.ui.utils.qt_find import find_child
 
 
 class PlaybackUiController:
@@ -133,7 +134,7 @@ class PlaybackUiController:
             "chipAuto": True if keep_auto_enabled else enabled,
         }
         for name, state in states.items():
-            btn = self._window.findChild(QPushButton, name)
+            btn = find_child(self._window, QPushButton, name)
             if btn is None:
                 continue
             try:
@@ -152,7 +153,7 @@ class PlaybackUiController:
             self._set_bottom_chips_enabled(False, keep_listen_enabled=True, keep_auto_enabled=False)
 
     def _init_auto_chip(self) -> None:
-        btn = self._window.findChild(QPushButton, "chipAuto")
+        btn = find_child(self._window, QPushButton, "chipAuto")
         if btn is None:
             return
         try:
@@ -163,7 +164,7 @@ class PlaybackUiController:
         self._set_auto_chip_style(False)
 
     def _set_auto_chip_style(self, on: bool) -> None:
-        btn = self._window.findChild(QPushButton, "chipAuto")
+        btn = find_child(self._window, QPushButton, "chipAuto")
         if btn is None:
             return
         try:
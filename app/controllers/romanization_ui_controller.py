@@ -7,6 +7,7 @@ from PyQt6.QtWidgets import QLabel, QPushButton, QRadioButton, QWidget
 
 from app.domain.romanization_rr import romanize_cv, romanize_text
 from app.domain.rr_hint_data import consonant_rr, vowel_rr
+from app.ui.utils.qt_find import find_child
 
 
 class RomanizationUiController:
@@ -32,10 +33,10 @@ class RomanizationUiController:
         self.radio_cues: Optional[QRadioButton] = None
 
     def wire(self) -> None:
-        self.label_value = self._window.findChild(QLabel, "labelRRValue")
-        self.label_hint = self._window.findChild(QLabel, "labelRRHint")
-        self.btn_hear = self._window.findChild(QPushButton, "btnRRHear")
-        self.radio_cues = self._window.findChild(QRadioButton, "radioRRCues")
+        self.label_value = find_child(self._window, QLabel, "labelRRValue")
+        self.label_hint = find_child(self._window, QLabel, "labelRRHint")
+        self.btn_hear = find_child(self._window, QPushButton, "btnRRHear")
+        self.radio_cues = find_child(self._window, QRadioButton, "radioRRCues")
         if self.btn_hear is not None:
             self.btn_hear.clicked.connect(self._on_hear)
         if self.radio_cues is not None:
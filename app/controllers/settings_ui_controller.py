@@ -8,6 +8,7 @@ from app.controllers.pronunciation_controller import PronunciationController
 from app.controllers.settings_controller import SettingsController
 from app.controllers.wpm_controller import WpmController
 from app.services.settings_store import SettingsStore
+from app.ui.utils.qt_find import find_child
 
 
 class SettingsUiController:
@@ -22,6 +23,8 @@ class SettingsUiController:
             pronouncer=None,
             settings_store=settings_store,
         )
+        # objectName -> QSpinBox, built on first use; see _spin_index().
+        self._spins: dict[str, QSpinBox] | None = None
 
     @property
     def settings_controller(self) -> SettingsController:
@@ -35,12 +38,12 @@ class SettingsUiController:
         self._wpm_controller.set_pronouncer(pronouncer)
 
     def wire(self) -> None:
-        spin_repeats = self._window.findChild(QSpinBox, "spinRepeats")
-        spin_pre_first = self._window.findChild(QSpinBox, "spinDelayPreFirst")
-        spin_between = self._window.findChild(QSpinBox, "spinDelayBetweenReps")
-        spin_before_hints = self._window.findChild(QSpinBox, "spinDelayBeforeHints")
-        spin_before_extras = self._window.findChild(QSpinBox, "spinDelayBeforeExtras")
-        spin_auto_advance = self._window.findChild(QDoubleSpinBox, "spinDelayAutoAdvance")
+        spin_repeats = find_child(self._window, QSpinBox, "spinRepeats")
+        spin_pre_first = find_child(self._window, QSpinBox, "spinDelayPreFirst")
+        spin_between = find_child(self._window, QSpinBox, "spinDelayBetweenReps")
+        spin_before_hints = find_child(self._window, QSpinBox, "spinDelayBeforeHints")
+        spin_before_extras = find_child(self._window, QSpinBox, "spinDelayBeforeExtras")
+        spin_auto_advance = find_child(self._window, QDoubleSpinBox, "spinDelayAutoAdvance")
 
         self._settings_controller.bind_repeats_spinbox(spin_repeats)
         self._settings_controller.bind_delay_spinboxes(
@@ -63,11 +66,13 @@ class SettingsUiController:
         repeats = data.get("repeats")
         delays = data.get("delays", {}) if isinstance(data.get("delays", {}), dict) else {}
 
+        spins = self._spin_index()
+
         def _set(names: list[str], value: Any) -> None:
             if value is None:
                 return
             for name in names:
-                widget = self._window.findChild(QSpinBox, name)
+                widget = spins.get(name)
                 if widget is not None:
                     widget.setValue(int(value))
 
@@ -77,3 +82,17 @@ class SettingsUiController:
         _set(["spinDelayBeforeHints", "spinBeforeHints"], delays.get("before_hints"))
         _set(["spinDelayBeforeExtras", "spinBeforeExtras"], delays.get("before_extras"))
         _set(["spinDelayAutoAdvance", "spinAutoAdvance"], delays.get("auto_advance"))
+
+    def _spin_index(self) -> dict[str, QSpinBox]:
+        """Return the window's spin boxes by objectName, walking the tree only once.
+
+        Entries drop out when their widget is destroyed, so a reload never
+        touches a deleted spin box.
+        """
+        if self._spins is None:
+            self._spins = {}
+            for sb in self._window.findChildren(QSpinBox):
+                name = sb.objectName()
+                self._spins[name] = sb
+                sb.destroyed.connect(lambda _=None, n=name: self._spins.pop(n, None))
+        return self._spins
@@ -6,6 +6,7 @@ from PyQt6.QtWidgets import QRadioButton, QPushButton, QWidget
 
 from app.services.settings_store import SettingsStore
 from app.controllers.pronunciation_controller import PronunciationController
+from app.ui.utils.qt_find import find_child
 
 
 class WpmController:
@@ -32,10 +33,10 @@ class WpmController:
     def wire_wpm_controls(self) -> None:
         if self._settings_store is None:
             return
-        radio_40 = self._window.findChild(QRadioButton, "radioWpm40")
-        radio_80 = self._window.findChild(QRadioButton, "radioWpm80")
-        radio_120 = self._window.findChild(QRadioButton, "radioWpm120")
-        radio_160 = self._window.findChild(QRadioButton, "radioWpm160")
+        radio_40 = find_child(self._window, QRadioButton, "radioWpm40")
+        radio_80 = find_child(self._window, QRadioButton, "radioWpm80")
+        radio_120 = find_child(self._window, QRadioButton, "radioWpm120")
+        radio_160 = find_child(self._window, QRadioButton, "radioWpm160")
 
         radios = {
             40: radio_40,
@@ -66,7 +67,7 @@ class WpmController:
             _apply_wpm(120, persist=False)
 
     def init_slow_chip(self) -> None:
-        btn = self._window.findChild(QPushButton, "chipSlow")
+        btn = find_child(self._window, QPushButton, "chipSlow")
         if btn is None:
             return
         try:
@@ -104,7 +105,7 @@ class WpmController:
                 pass
         if persist and self._settings_store is not None:
             self._settings_store.set_wpm(int(val))
-        radio = self._window.findChild(QRadioButton, "radioWpm{}".format(val))
+        radio = find_child(self._window, QRadioButton, "radioWpm{}".format(val))
         if radio is not None:
             try:
                 if not radio.isChecked():
@@ -115,7 +116,7 @@ class WpmController:
                 pass
 
     def _set_slow_chip_style(self, on: bool) -> None:
-        btn = self._window.findChild(QPushButton, "chipSlow")
+        btn = find_child(self._window, QPushButton, "chipSlow")
         if btn is None:
             return
         try:
@@ -65,6 +65,13 @@ _CHO_MAP: Final[dict[str, int]] = {j: i for i, j in enumerate(CHOSEONG)}
 _JUNG_MAP: Final[dict[str, int]] = {j: i for i, j in enumerate(JUNGSEONG)}
 _JONG_MAP: Final[dict[str, int]] = {j: i for i, j in enumerate(JONGSEONG)}
 
+# All 19 x 21 open (no-final) syllables, precomposed for compose_cv.
+_CV_TABLE: Final[dict[tuple[str, str], str]] = {
+    (c, v): chr(0xAC00 + (li * 21 + vi) * 28)
+    for li, c in enumerate(CHOSEONG)
+    for vi, v in enumerate(JUNGSEONG)
+}
+
 
 # -----------------------------------------------------------------------------
 # Domain logic
@@ -112,4 +119,8 @@ def compose_lvt(lead: str, vowel: str, tail: str = "") -> str:
 
 def compose_cv(lead: str, vowel: str) -> str:
     """Compose a Hangul syllable from a leading consonant and a vowel."""
+    syllable = _CV_TABLE.get((lead, vowel))
+    if syllable is not None:
+        return syllable
+    # Untrimmed, empty or invalid input: keep compose_lvt's normalisation.
     return compose_lvt(lead, vowel, "")
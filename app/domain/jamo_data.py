@@ -39,9 +39,8 @@ _YAML_CACHE_PATH: Path | None = None
 _YAML_CACHE_MTIME_NS: int | None = None
 
 
-def _project_root() -> Path:
-    # app/domain/jamo_data.py -> app/domain -> app -> <project_root>
-    return Path(__file__).resolve().parents[2]
+# app/domain/jamo_data.py -> app/domain -> app -> <project_root>; resolved once.
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
 
 def _load_yaml() -> dict[str, Any]:
@@ -54,7 +53,7 @@ def _load_yaml() -> dict[str, Any]:
     global _YAML_CACHE, _YAML_CACHE_PATH, _YAML_CACHE_MTIME_NS
 
     try:
-        path = _project_root() / "data" / "jamo_order.yaml"
+        path = _PROJECT_ROOT / "data" / "jamo_order.yaml"
         if not path.exists():
             _YAML_CACHE = {}
             _YAML_CACHE_PATH = path
@@ -8,13 +8,11 @@ import yaml
 _CACHE: dict[str, dict[str, dict[str, str]]] = {}
 _CACHE_MTIME_NS: dict[str, int] = {}
 
-
-def _project_root() -> Path:
-    return Path(__file__).resolve().parents[2]
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
 
 def _load_yaml(name: str) -> dict[str, Any]:
-    path = _project_root() / "data" / name
+    path = _PROJECT_ROOT / "data" / name
     try:
         if not path.exists():
             return {}
@@ -17,6 +17,8 @@ Expected YAML shape (flexible):
 - Or a mapping keyed by short letters ("A", "B", "C", "D") to a list of syllables
 """
 
+import json
+import os
 from pathlib import Path
 from typing import Any, Final
 
@@ -28,6 +30,8 @@ from typing import Any, Final
 _YAML_CACHE: dict[str, Any] | None = None
 _YAML_CACHE_PATH: Path | None = None
 _YAML_CACHE_MTIME_NS: int | None = None
+# block_type name -> consonant -> (consonant, vowel, glyph), rebuilt with _YAML_CACHE.
+_SYLL_INDEX: dict[str, dict[str, tuple[str, str, str]]] = {}
 
 _SYLLABLES_FILENAME: Final[str] = "syllables.yaml"
 
@@ -36,60 +40,136 @@ _SYLLABLES_FILENAME: Final[str] = "syllables.yaml"
 # Path helpers
 # -----------------------------------------------------------------------------
 
-def _project_root() -> Path:
-    """Return the project root directory.
-
-    Assumes this file lives at: <root>/app/domain/syllables.py
-    so we walk up two levels.
-    """
-    try:
-        return Path(__file__).resolve().parents[2]
-    except Exception:
-        return Path.cwd()
+# Project root, resolved once. Assumes this file lives at
+# <root>/app/domain/syllables.py, so we walk up two levels.
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
 
 def _syllables_yaml_path() -> Path:
-    return _project_root() / "data" / _SYLLABLES_FILENAME
+    return _PROJECT_ROOT / "data" / _SYLLABLES_FILENAME
 
 
 # -----------------------------------------------------------------------------
 # YAML loading
 # -----------------------------------------------------------------------------
 
+def _json_sidecar_path(yaml_path: Path) -> Path:
+    return yaml_path.with_suffix(".json")
+
+
+def _read_json_sidecar(yaml_path: Path, source: list[int]) -> Any:
+    """Return the sidecar's data if it was written from this exact YAML, else None.
+
+    `source` is the YAML's [st_mtime_ns, st_size]; the sidecar records the
+    pair it was built from, and anything but an exact match counts as stale
+    (an older mtime is no proof of freshness after a checkout or `cp -p`).
+    """
+    json_path = _json_sidecar_path(yaml_path)
+    try:
+        with json_path.open("rb") as f:
+            doc = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(doc, dict) or doc.get("source") != source:
+        return None
+    return doc.get("data")
+
+
+def _json_exact(obj: Any) -> bool:
+    """True if `obj` survives a JSON round trip unchanged (str keys, JSON scalars)."""
+    if isinstance(obj, dict):
+        return all(isinstance(k, str) and _json_exact(v) for k, v in obj.items())
+    if isinstance(obj, list):
+        return all(_json_exact(v) for v in obj)
+    return obj is None or isinstance(obj, (str, int, float, bool))
+
+
+def _write_json_sidecar(yaml_path: Path, source: list[int], data: dict[str, Any]) -> None:
+    """Write `data` next to the YAML as JSON (tmp file + replace). Best-effort.
+
+    Skipped when the data would not round-trip exactly (e.g. non-string keys
+    or dates), so the sidecar never serves something the YAML would not.
+    """
+    if not _json_exact(data):
+        return
+    json_path = _json_sidecar_path(yaml_path)
+    tmp = json_path.with_suffix(json_path.suffix + ".tmp")
+    try:
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump({"source": source, "data": data}, f, ensure_ascii=False)
+        os.replace(str(tmp), str(json_path))
+    except (OSError, TypeError, ValueError):
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
 def _load_syllables_yaml() -> dict[str, Any]:
     """Load syllables YAML if present.
 
     Failure is non-fatal; returns an empty mapping.
-    Uses a small mtime-based cache to avoid repeated disk reads.
+    Uses a small mtime-based cache to avoid repeated disk reads. The cached
+    mapping is returned as-is; callers must treat it as read-only.
+
+    A JSON copy (data/syllables.json) is written after each YAML parse and
+    preferred while the YAML's mtime and size match the ones it was built
+    from, since json is much cheaper to load than YAML.
     """
-    global _YAML_CACHE, _YAML_CACHE_PATH, _YAML_CACHE_MTIME_NS
+    global _YAML_CACHE, _YAML_CACHE_PATH, _YAML_CACHE_MTIME_NS, _SYLL_INDEX
 
     try:
         path = _syllables_yaml_path()
-        if not path.exists():
+        # One stat() both checks existence and yields the cache key.
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             _YAML_CACHE = {}
+            _SYLL_INDEX = {}
             _YAML_CACHE_PATH = path
             _YAML_CACHE_MTIME_NS = None
-            return {}
+            return _YAML_CACHE
 
-        mtime_ns = path.stat().st_mtime_ns
+        mtime_ns = st.st_mtime_ns
         if _YAML_CACHE is not None and _YAML_CACHE_PATH == path and _YAML_CACHE_MTIME_NS == mtime_ns:
-            return dict(_YAML_CACHE)
+            return _YAML_CACHE
 
-        import yaml
+        source = [mtime_ns, st.st_size]
+        loaded = _read_json_sidecar(path, source)
+        if loaded is None:
+            import yaml
 
-        with path.open("r", encoding="utf-8") as f:
-            loaded = yaml.safe_load(f)
-            parsed = loaded if isinstance(loaded, dict) else {}
+            with path.open("r", encoding="utf-8") as f:
+                # LibYAML's C loader when PyYAML was built with it; same safe semantics.
+                loaded = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+            if isinstance(loaded, dict):
+                _write_json_sidecar(path, source, loaded)
+        parsed = loaded if isinstance(loaded, dict) else {}
 
         _YAML_CACHE = dict(parsed)
+        _SYLL_INDEX = _build_syllable_index(_YAML_CACHE)
         _YAML_CACHE_PATH = path
         _YAML_CACHE_MTIME_NS = mtime_ns
-        return dict(_YAML_CACHE)
+        return _YAML_CACHE
     except Exception:
         return {}
 
 
+def _build_syllable_index(data: dict[str, Any]) -> dict[str, dict[str, tuple[str, str, str]]]:
+    """Index the `syllables:` list by block type, then consonant (first entry wins)."""
+    index: dict[str, dict[str, tuple[str, str, str]]] = {}
+    items = data.get("syllables")
+    if not isinstance(items, list):
+        return index
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        bt, c, v, g = (item.get(k) for k in ("block_type", "consonant", "vowel", "glyph"))
+        if isinstance(bt, str) and isinstance(c, str) and isinstance(v, str) and isinstance(g, str):
+            index.setdefault(bt, {}).setdefault(c, (c, v, g))
+    return index
+
+
 # -----------------------------------------------------------------------------
 # Selection
 # -----------------------------------------------------------------------------
@@ -140,3 +220,27 @@ def select_syllable_for_block(block_type: object) -> str:
         return "그"
 
     return "가"
+
+
+# Fallback (consonant, vowel, glyph) per block family when the YAML has no match.
+_FALLBACK_CV: Final[dict[str, tuple[str, str, str]]] = {
+    "A": ("ㄱ", "ㅏ", "가"),
+    "B": ("ㄱ", "ㅗ", "고"),
+    "C": ("ㄱ", "ㅜ", "구"),
+    "D": ("ㄱ", "ㅡ", "그"),
+}
+
+
+def select_cv_for_block(block_type: object, prefer_consonant: str | None = None) -> tuple[str, str, str]:
+    """Return a (consonant, vowel, glyph) triple from syllables.yaml for the BlockType.
+
+    Uses the entry for `prefer_consonant` when the block type has one, else the
+    block type's first entry, else a stable per-family fallback.
+    """
+    _load_syllables_yaml()
+    full, short = _normalise_key(block_type)
+    bucket = _SYLL_INDEX.get(full)
+    if bucket:
+        hit = bucket.get(prefer_consonant) if prefer_consonant else None
+        return hit or next(iter(bucket.values()))
+    return _FALLBACK_CV.get(short, _FALLBACK_CV["A"])
@@ -11,6 +11,10 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Prefer LibYAML's C loader/dumper when PyYAML was built with it; same safe semantics.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class SettingsStore:
     """YAML-backed settings store.
@@ -31,6 +35,8 @@ class SettingsStore:
             self._path = project_root / "settings.yaml"
         else:
             self._path = Path(settings_path)
+        # (payload, mtime_ns) of the last successful save; see save().
+        self._last_saved: tuple[str, int] | None = None
 
     @property
     def path(self) -> Path:
@@ -42,7 +48,7 @@ class SettingsStore:
             if not p.exists():
                 return {}
             with p.open("r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=_YAML_LOADER) or {}
                 return data if isinstance(data, dict) else {}
         except (OSError, yaml.YAMLError, ValueError) as e:
             logger.warning("Failed to load settings from %s: %s", self._path, e)
@@ -51,11 +57,22 @@ class SettingsStore:
     def save(self, data: dict[str, Any]) -> None:
         try:
             p = self._path
+            blob = yaml.dump(data or {}, Dumper=_YAML_DUMPER, allow_unicode=True, sort_keys=True)
+            # Skip the write when this exact payload is what we last wrote and the
+            # file has not been touched since (e.g. a spin box re-emitting its value).
+            last = self._last_saved
+            if last is not None and last[0] == blob:
+                try:
+                    if p.stat().st_mtime_ns == last[1]:
+                        return
+                except OSError:
+                    pass
             p.parent.mkdir(parents=True, exist_ok=True)
             tmp = p.with_suffix(p.suffix + ".tmp")
             with tmp.open("w", encoding="utf-8") as f:
-                yaml.safe_dump(data or {}, f, allow_unicode=True, sort_keys=True)
+                f.write(blob)
             os.replace(str(tmp), str(p))
+            self._last_saved = (blob, p.stat().st_mtime_ns)
         except (OSError, yaml.YAMLError, ValueError) as e:
             logger.warning("Failed to save settings to %s: %s", self._path, e)
             # Best-effort persistence; callers should not crash on save failures.
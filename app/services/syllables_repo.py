@@ -59,21 +59,13 @@ _SYLLABLES_FILENAME: Final[str] = "syllables.yaml"
 # Path helpers
 # -----------------------------------------------------------------------------
 
-def _project_root() -> Path:
-    """Return the project root directory.
-
-    Assumes this file lives at: <root>/app/services/syllables_repo.py
-    so we walk up two levels.
-    """
-    try:
-        return Path(__file__).resolve().parents[2]
-    except Exception:
-        # Conservative fallback
-        return Path.cwd()
+# Project root, resolved once. Assumes this file lives at
+# <root>/app/services/syllables_repo.py, so we walk up two levels.
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
 
 def _syllables_yaml_path() -> Path:
-    return _project_root() / "data" / _SYLLABLES_FILENAME
+    return _PROJECT_ROOT / "data" / _SYLLABLES_FILENAME
 
 
 # -----------------------------------------------------------------------------
@@ -84,32 +76,36 @@ def _load_syllables_yaml() -> dict[str, Any]:
     """Load syllables YAML if present.
 
     Failure is non-fatal; returns an empty mapping.
-    Uses a small mtime-based cache to avoid repeated disk reads.
+    Uses a small mtime-based cache to avoid repeated disk reads. The cached
+    mapping is returned as-is; callers must treat it as read-only.
     """
     global _YAML_CACHE, _YAML_CACHE_PATH, _YAML_CACHE_MTIME_NS
 
     try:
         path = _syllables_yaml_path()
-        if not path.exists():
+        # One stat() both checks existence and yields the cache key.
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
             _YAML_CACHE = {}
             _YAML_CACHE_PATH = path
             _YAML_CACHE_MTIME_NS = None
-            return {}
+            return _YAML_CACHE
 
-        mtime_ns = path.stat().st_mtime_ns
         if _YAML_CACHE is not None and _YAML_CACHE_PATH == path and _YAML_CACHE_MTIME_NS == mtime_ns:
-            return dict(_YAML_CACHE)
+            return _YAML_CACHE
 
         import yaml
 
         with path.open("r", encoding="utf-8") as f:
-            loaded = yaml.safe_load(f)
+            # LibYAML's C loader when PyYAML was built with it; same safe semantics.
+            loaded = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
             parsed = loaded if isinstance(loaded, dict) else {}
 
         _YAML_CACHE = dict(parsed)
         _YAML_CACHE_PATH = path
         _YAML_CACHE_MTIME_NS = mtime_ns
-        return dict(_YAML_CACHE)
+        return _YAML_CACHE
     except Exception:
         return {}
 
@@ -17,7 +17,10 @@ class HybridTTSBackend:
         language_code: str = "ko-KR",
         voice_name: Optional[str] = None,
     ) -> None:
-        self._fallback = fallback or TTSService()
+        # The system-voice service probes installed voices (a `say` subprocess
+        # on macOS), so it is only built the first time a fallback is needed.
+        self._fallback: Optional[TTSService] = fallback
+        self._fallback_wpm: Optional[int] = None
         self._language_code = language_code
         self._voice_name = voice_name or os.environ.get("HANGUL_GCP_VOICE", "ko-KR-Standard-A")
         self._rate_wpm: int = 120
@@ -27,12 +30,20 @@ class HybridTTSBackend:
             self._rate_wpm = int(wpm)
         except Exception:
             self._rate_wpm = 120
+        self._fallback_wpm = self._rate_wpm
         try:
-            if hasattr(self._fallback, "set_rate_wpm"):
+            if self._fallback is not None and hasattr(self._fallback, "set_rate_wpm"):
                 self._fallback.set_rate_wpm(self._rate_wpm)
         except Exception:
             pass
 
+    def _fallback_service(self) -> TTSService:
+        if self._fallback is None:
+            self._fallback = TTSService()
+            if self._fallback_wpm is not None:
+                self._fallback.set_rate_wpm(self._fallback_wpm)
+        return self._fallback
+
     def _wpm_to_speaking_rate(self) -> float:
         # Map 40..160 WPM -> ~0.6..1.6 speaking_rate (matches ref behavior).
         wpm = max(40, min(160, int(self._rate_wpm)))
@@ -61,11 +72,15 @@ class HybridTTSBackend:
             )
         except Exception:
             try:
-                print("[TTS] Falling back to system voice: {}".format(self._fallback.voice))
+                fallback = self._fallback_service()
+            except Exception:
+                fallback = None
+            try:
+                print("[TTS] Falling back to system voice: {}".format(fallback.voice))
             except Exception:
                 print("[TTS] Falling back to system voice")
             try:
-                self._fallback.speak(glyph)
+                fallback.speak(glyph)
             except Exception:
                 pass
         if callable(on_complete):
@@ -20,11 +20,13 @@ network calls.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional
 
 import hashlib
 import os
+import stat
 
 
 # ----------------------------
@@ -34,6 +36,13 @@ import os
 
 Synthesizer = Callable[[str], bytes]
 
+# (request, HANGUL_TTS_CACHE_DIR, cache-dir resolver) -> WAV path already
+# verified or written by ensure_cached_wav. Repeat playback of a glyph then
+# costs one stat() instead of cache-dir resolution (mkdir) plus the
+# exists/is_file/stat chain. The resolver is part of the key so a replaced
+# get_cache_dir() (e.g. monkeypatched in tests) is not bypassed.
+_WAV_INDEX: dict[tuple["TtsRequest", str, Callable[[], Path]], Path] = {}
+
 
 @dataclass(frozen=True)
 class TtsRequest:
@@ -50,6 +59,25 @@ class TtsRequest:
 # ----------------------------
 
 
+@lru_cache(maxsize=1)
+def _find_project_root() -> Optional[Path]:
+    """Locate the project root once per process (None if not inside one)."""
+    # Attempt a small, robust inference: if this file is inside the project, use
+    # a sibling `.cache/tts` anchored at project root.
+    here = Path(__file__).resolve()
+
+    # Heuristic: walk upwards looking for a pyproject.toml or requirements.txt
+    # (max 5 levels). If not found, fall back to user cache.
+    for i in range(1, 6):
+        try:
+            cand = here.parents[i]
+        except IndexError:
+            break
+        if (cand / "pyproject.toml").exists() or (cand / "requirements.txt").exists():
+            return cand
+    return None
+
+
 def get_cache_dir() -> Path:
     """Return the directory used to store cached TTS WAV files.
 
@@ -66,22 +94,7 @@ def get_cache_dir() -> Path:
         p.mkdir(parents=True, exist_ok=True)
         return p
 
-    # Attempt a small, robust inference: if this file is inside the project, use
-    # a sibling `.cache/tts` anchored at project root.
-    here = Path(__file__).resolve()
-
-    # Heuristic: walk upwards looking for a pyproject.toml or requirements.txt
-    # (max 5 levels). If not found, fall back to user cache.
-    project_root: Optional[Path] = None
-    for i in range(1, 6):
-        try:
-            cand = here.parents[i]
-        except IndexError:
-            break
-        if (cand / "pyproject.toml").exists() or (cand / "requirements.txt").exists():
-            project_root = cand
-            break
-
+    project_root = _find_project_root()
     if project_root is not None:
         p = project_root / ".cache" / "tts"
         p.mkdir(parents=True, exist_ok=True)
@@ -202,6 +215,8 @@ def ensure_cached_wav(
     """Ensure a cached WAV exists for `text` and return its path.
 
     If the WAV already exists, returns immediately without calling the synthesizer.
+    Known paths are remembered per process and re-checked with a single
+    stat(); a WAV deleted while the app runs is synthesized again.
 
     The `synthesizer` callable (if provided) must accept `text: str` and return
     WAV bytes.
@@ -214,9 +229,21 @@ def ensure_cached_wav(
         voice_name=voice_name,
         speaking_rate=speaking_rate,
     )
+    index_key = (req, os.environ.get("HANGUL_TTS_CACHE_DIR") or "", get_cache_dir)
+    known = _WAV_INDEX.get(index_key)
+    if known is not None:
+        try:
+            st = os.stat(known)
+        except OSError:
+            st = None
+        if st is not None and stat.S_ISREG(st.st_mode) and st.st_size > 0:
+            return known
+        del _WAV_INDEX[index_key]
+
     out_path = cached_path(req)
 
     if out_path.exists() and out_path.is_file() and out_path.stat().st_size > 0:
+        _WAV_INDEX[index_key] = out_path
         return out_path
 
     # Synthesize and write atomically.
@@ -242,9 +269,14 @@ def ensure_cached_wav(
             pass
         raise
 
+    _WAV_INDEX[index_key] = out_path
     return out_path
 
 
+# Reused by play_wav() for every playback.
+_last_sound_effect = None
+
+
 def play_wav(path: Path) -> None:
     """Play a WAV file via QtMultimedia when available.
 
@@ -253,6 +285,7 @@ def play_wav(path: Path) -> None:
 
     Note: the caller is responsible for keeping the Qt application alive.
     """
+    global _last_sound_effect
     try:
         from PyQt6.QtCore import QUrl  # type: ignore
         from PyQt6.QtMultimedia import QSoundEffect  # type: ignore
@@ -260,16 +293,18 @@ def play_wav(path: Path) -> None:
         return
 
     try:
-        eff = QSoundEffect()
+        # One effect is created and reused: setting a new source stops the
+        # previous sound, just as dropping the old effect object did.
+        # IMPORTANT: QSoundEffect must remain referenced; otherwise it may be
+        # GC'd mid-playback, so it lives on the module.
+        eff = _last_sound_effect
+        if eff is None:
+            eff = QSoundEffect()
+            eff.setLoopCount(1)
+            eff.setVolume(1.0)
+            _last_sound_effect = eff
         eff.setSource(QUrl.fromLocalFile(str(path)))
-        eff.setLoopCount(1)
-        eff.setVolume(1.0)
         eff.play()
-
-        # IMPORTANT:
-        # QSoundEffect must remain referenced; otherwise it may be GC'd.
-        # We stash it on the module as a best-effort.
-        globals()["_last_sound_effect"] = eff
     except Exception:
         return
 
@@ -13,13 +13,57 @@ It centralises:
 These utilities are used to size large glyph labels to fit their container.
 """
 
+from functools import lru_cache
 from typing import Optional
 
-from PyQt6.QtCore import QObject, QEvent
+from PyQt6.QtCore import QObject, QEvent, QTimer
 from PyQt6.QtGui import QFont, QFontMetrics
 from PyQt6.QtWidgets import QLabel, QWidget
 
 
+@lru_cache(maxsize=512)
+def _font_metrics(font_key: str, pt: int) -> Optional[QFontMetrics]:
+    """Return a shared QFontMetrics for the font `font_key` at `pt`.
+
+    `font_key` is a QFont.toString() description; None if it cannot be parsed.
+    Constructing QFontMetrics queries the font engine, so different texts
+    measured at the same size reuse one instance.
+    """
+    f = QFont()
+    if not f.fromString(font_key):
+        return None
+    try:
+        f.setPointSize(pt)
+    except Exception:
+        return None
+    return QFontMetrics(f)
+
+
+@lru_cache(maxsize=4096)
+def _measure_text(font_key: str, pt: int, text: str) -> Optional[tuple[int, int]]:
+    """Return (advance width, line height) of `text` in the font `font_key` at `pt`.
+
+    None if measuring fails.
+    """
+    fm = _font_metrics(font_key, pt)
+    if fm is None:
+        return None
+    try:
+        w = int(fm.horizontalAdvance(text))
+    except Exception:
+        try:
+            w = int(fm.boundingRect(text).width())
+        except Exception:
+            return None
+
+    try:
+        h = int(fm.height())
+    except Exception:
+        return None
+
+    return w, h
+
+
 def _fit_label_font_to_label_rect(
     label: QLabel,
     target: Optional[QWidget] = None,
@@ -60,28 +104,28 @@ def _fit_label_font_to_label_rect(
     except Exception:
         base_font = QFont()
 
-    def fits(pt: int) -> bool:
-        f = QFont(base_font)
-        try:
-            f.setPointSize(int(pt))
-        except Exception:
-            return False
-
-        fm = QFontMetrics(f)
-        try:
-            w = int(fm.horizontalAdvance(text))
-        except Exception:
-            try:
-                w = int(fm.boundingRect(text).width())
-            except Exception:
-                return False
+    # Metrics are memoized per (font description, point size, text), so
+    # repeated refits during a drag-resize mostly skip QFontMetrics entirely.
+    # The key is normalised to one point size: a label's own size changes with
+    # every fit and must not split the cache.
+    key_font = QFont(base_font)
+    key_font.setPointSize(12)
+    font_key = key_font.toString()
+
+    # Relayout cascades resend resizes with unchanged geometry; when nothing
+    # that feeds the fit has changed and the label still has the fitted size,
+    # there is nothing to do.
+    fit_key = (avail_w, avail_h, text, int(min_pt), int(max_pt), font_key)
+    last = getattr(label, "_hg_last_fit", None)
+    if last is not None and last[0] == fit_key and base_font.pointSize() == last[1]:
+        return
 
-        try:
-            h = int(fm.height())
-        except Exception:
-            return False
+    def measure(pt: int) -> Optional[tuple[int, int]]:
+        return _measure_text(font_key, int(pt), text)
 
-        return (w <= avail_w) and (h <= avail_h)
+    def fits(pt: int) -> bool:
+        m = measure(pt)
+        return m is not None and m[0] <= avail_w and m[1] <= avail_h
 
     lo = int(min_pt)
     hi = int(max_pt)
@@ -92,13 +136,41 @@ def _fit_label_font_to_label_rect(
     if hi < lo:
         hi = lo
 
-    while lo <= hi:
-        mid = (lo + hi) // 2
-        if fits(mid):
-            best = mid
-            lo = mid + 1
+    # Text metrics scale roughly linearly with point size: measure at `lo`,
+    # jump to the proportional estimate, refine it once from that measurement,
+    # then step to the exact largest fitting size.
+    pt = lo
+    m = measure(pt)
+    for _ in range(2):
+        if m is None or m[0] <= 0 or m[1] <= 0:
+            m = None
+            break
+        nxt = max(lo, min(hi, int(pt * min(avail_w / m[0], avail_h / m[1]))))
+        if nxt == pt:
+            break
+        pt = nxt
+        m = measure(pt)
+
+    if m is not None:
+        if m[0] <= avail_w and m[1] <= avail_h:
+            best = pt
+            while best < hi and fits(best + 1):
+                best += 1
         else:
-            hi = mid - 1
+            pt -= 1
+            while pt >= lo and not fits(pt):
+                pt -= 1
+            if pt >= lo:
+                best = pt
+    else:
+        # Degenerate metrics (e.g. a 1pt probe): fall back to bisection.
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            if fits(mid):
+                best = mid
+                lo = mid + 1
+            else:
+                hi = mid - 1
 
     try:
         new_font = QFont(base_font)
@@ -106,16 +178,30 @@ def _fit_label_font_to_label_rect(
         label.setFont(new_font)
     except Exception:
         return
+    label._hg_last_fit = (fit_key, int(best))
 
 
 class _AutoFitHook(QObject):
-    """Event filter that resizes a label font to fit a target widget (optional)."""
+    """Event filter that resizes a label font to fit a target widget (optional).
+
+    Refits are coalesced through one zero-interval single-shot timer: a burst
+    of resize events (e.g. a window drag) restarts it, so only one refit runs
+    once the burst has been delivered.
+    """
 
     def __init__(self, label: QLabel, target: Optional[QWidget] = None) -> None:
         super().__init__()
         self._label: QLabel = label
         self._target: Optional[QWidget] = target
 
+        self._refit_timer = QTimer(self)
+        self._refit_timer.setSingleShot(True)
+        self._refit_timer.setInterval(0)
+        self._refit_timer.timeout.connect(self._refit)
+
+    def _refit(self) -> None:
+        _fit_label_font_to_label_rect(self._label, self._target)
+
     def eventFilter(self, obj: QObject, event: QEvent) -> bool:  # noqa: N802
         try:
             et = event.type()
@@ -123,7 +209,7 @@ class _AutoFitHook(QObject):
             return False
 
         if et in (QEvent.Type.Resize, QEvent.Type.Show, QEvent.Type.LayoutRequest):
-            _fit_label_font_to_label_rect(self._label, self._target)
+            self._refit_timer.start()
 
         return False
 
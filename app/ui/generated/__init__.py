@@ -0,0 +1,5 @@
+"""Python modules generated by pyuic6 from the Designer files under ui/.
+
+Do not edit these by hand; regenerate with `scripts/compile_ui.sh` after
+changing a .ui file.
+"""
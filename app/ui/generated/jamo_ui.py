@@ -0,0 +1,209 @@
+# Form implementation generated from reading ui file 'ui/jamo.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_JamoBlock(object):
+    def setupUi(self, JamoBlock):
+        JamoBlock.setObjectName("JamoBlock")
+        JamoBlock.resize(400, 400)
+        self.verticalLayout = QtWidgets.QVBoxLayout(JamoBlock)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.frameStackedBorder = QtWidgets.QFrame(parent=JamoBlock)
+        self.frameStackedBorder.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.frameStackedBorder.setFrameShadow(QtWidgets.QFrame.Shadow.Plain)
+        self.frameStackedBorder.setLineWidth(0)
+        self.frameStackedBorder.setMidLineWidth(0)
+        self.frameStackedBorder.setStyleSheet("border: none; background: #ffffff;")
+        self.frameStackedBorder.setObjectName("frameStackedBorder")
+        self.layoutStackedBorder = QtWidgets.QVBoxLayout(self.frameStackedBorder)
+        self.layoutStackedBorder.setContentsMargins(0, 0, 0, 0)
+        self.layoutStackedBorder.setObjectName("layoutStackedBorder")
+        self.stackedTemplates = QtWidgets.QStackedWidget(parent=self.frameStackedBorder)
+        self.stackedTemplates.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.stackedTemplates.setFrameShadow(QtWidgets.QFrame.Shadow.Plain)
+        self.stackedTemplates.setLineWidth(0)
+        self.stackedTemplates.setMidLineWidth(0)
+        self.stackedTemplates.setStyleSheet("border: none;")
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.stackedTemplates.sizePolicy().hasHeightForWidth())
+        self.stackedTemplates.setSizePolicy(sizePolicy)
+        self.stackedTemplates.setObjectName("stackedTemplates")
+        self.typeA_RightBranch = QtWidgets.QWidget()
+        self.typeA_RightBranch.setObjectName("typeA_RightBranch")
+        self.gridRightBranch = QtWidgets.QGridLayout(self.typeA_RightBranch)
+        self.gridRightBranch.setContentsMargins(4, 4, 4, 4)
+        self.gridRightBranch.setSpacing(4)
+        self.gridRightBranch.setObjectName("gridRightBranch")
+        self.typeA_segmentTop = QtWidgets.QFrame(parent=self.typeA_RightBranch)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.typeA_segmentTop.sizePolicy().hasHeightForWidth())
+        self.typeA_segmentTop.setSizePolicy(sizePolicy)
+        self.typeA_segmentTop.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.typeA_segmentTop.setStyleSheet("border: 1px dashed #aaaaaa; background: #ffffff;")
+        self.typeA_segmentTop.setObjectName("typeA_segmentTop")
+        self.gridRightBranch.addWidget(self.typeA_segmentTop, 0, 0, 1, 1)
+        self.typeA_segmentMiddle = QtWidgets.QFrame(parent=self.typeA_RightBranch)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.typeA_segmentMiddle.sizePolicy().hasHeightForWidth())
+        self.typeA_segmentMiddle.setSizePolicy(sizePolicy)
+        self.typeA_segmentMiddle.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.typeA_segmentMiddle.setStyleSheet("border: 1px dashed #aaaaaa; background: #ffffff;")
+        self.typeA_segmentMiddle.setObjectName("typeA_segmentMiddle")
+        self.gridRightBranch.addWidget(self.typeA_segmentMiddle, 1, 0, 1, 1)
+        self.typeA_segmentBottom = QtWidgets.QFrame(parent=self.typeA_RightBranch)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.typeA_segmentBottom.sizePolicy().hasHeightForWidth())
+        self.typeA_segmentBottom.setSizePolicy(sizePolicy)
+        self.typeA_segmentBottom.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.typeA_segmentBottom.setStyleSheet("border: 1px dashed #aaaaaa; background: #ffffff;")
+        self.typeA_segmentBottom.setObjectName("typeA_segmentBottom")
+        self.gridRightBranch.addWidget(self.typeA_segmentBottom, 2, 0, 1, 1)
+        self.stackedTemplates.addWidget(self.typeA_RightBranch)
+        self.typeB_TopBranch = QtWidgets.QWidget()
+        self.typeB_TopBranch.setObjectName("typeB_TopBranch")
+        self.gridTopBranch = QtWidgets.QGridLayout(self.typeB_TopBranch)
+        self.gridTopBranch.setContentsMargins(4, 4, 4, 4)
+        self.gridTopBranch.setSpacing(4)
+        self.gridTopBranch.setObjectName("gridTopBranch")
+        self.typeB_segmentTop = QtWidgets.QFrame(parent=self.typeB_TopBranch)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.typeB_segmentTop.sizePolicy().hasHeightForWidth())
+        self.typeB_segmentTop.setSizePolicy(sizePolicy)
+        self.typeB_segmentTop.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.typeB_segmentTop.setStyleSheet("border: 1px dashed #aaaaaa; background: #ffffff;")
+        self.typeB_segmentTop.setObjectName("typeB_segmentTop")
+        self.gridTopBranch.addWidget(self.typeB_segmentTop, 0, 0, 1, 1)
+        self.typeB_segmentMiddle = QtWidgets.QFrame(parent=self.typeB_TopBranch)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.typeB_segmentMiddle.sizePolicy().hasHeightForWidth())
+        self.typeB_segmentMiddle.setSizePolicy(sizePolicy)
+        self.typeB_segmentMiddle.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.typeB_segmentMiddle.setStyleSheet("border: 1px dashed #aaaaaa; background: #ffffff;")
+        self.typeB_segmentMiddle.setObjectName("typeB_segmentMiddle")
+        self.gridTopBranch.addWidget(self.typeB_segmentMiddle, 1, 0, 1, 1)
+        self.typeB_segmentBottom = QtWidgets.QFrame(parent=self.typeB_TopBranch)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.typeB_segmentBottom.sizePolicy().hasHeightForWidth())
+        self.typeB_segmentBottom.setSizePolicy(sizePolicy)
+        self.typeB_segmentBottom.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.typeB_segmentBottom.setStyleSheet("border: 1px dashed #aaaaaa; background: #ffffff;")
+        self.typeB_segmentBottom.setObjectName("typeB_segmentBottom")
+        self.gridTopBranch.addWidget(self.typeB_segmentBottom, 2, 0, 1, 1)
+        self.stackedTemplates.addWidget(self.typeB_TopBranch)
+        self.typeC_BottomBranch = QtWidgets.QWidget()
+        self.typeC_BottomBranch.setObjectName("typeC_BottomBranch")
+        self.gridBottomBranch = QtWidgets.QGridLayout(self.typeC_BottomBranch)
+        self.gridBottomBranch.setContentsMargins(4, 4, 4, 4)
+        self.gridBottomBranch.setSpacing(4)
+        self.gridBottomBranch.setObjectName("gridBottomBranch")
+        self.typeC_segmentTop = QtWidgets.QFrame(parent=self.typeC_BottomBranch)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.typeC_segmentTop.sizePolicy().hasHeightForWidth())
+        self.typeC_segmentTop.setSizePolicy(sizePolicy)
+        self.typeC_segmentTop.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.typeC_segmentTop.setStyleSheet("border: 1px dashed #aaaaaa; background: #ffffff;")
+        self.typeC_segmentTop.setObjectName("typeC_segmentTop")
+        self.gridBottomBranch.addWidget(self.typeC_segmentTop, 0, 0, 1, 1)
+        self.typeC_segmentMiddle = QtWidgets.QFrame(parent=self.typeC_BottomBranch)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.typeC_segmentMiddle.sizePolicy().hasHeightForWidth())
+        self.typeC_segmentMiddle.setSizePolicy(sizePolicy)
+        self.typeC_segmentMiddle.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.typeC_segmentMiddle.setStyleSheet("border: 1px dashed #aaaaaa; background: #ffffff;")
+        self.typeC_segmentMiddle.setObjectName("typeC_segmentMiddle")
+        self.gridBottomBranch.addWidget(self.typeC_segmentMiddle, 1, 0, 1, 1)
+        self.typeC_segmentBottom = QtWidgets.QFrame(parent=self.typeC_BottomBranch)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.typeC_segmentBottom.sizePolicy().hasHeightForWidth())
+        self.typeC_segmentBottom.setSizePolicy(sizePolicy)
+        self.typeC_segmentBottom.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.typeC_segmentBottom.setStyleSheet("border: 1px dashed #aaaaaa; background: #ffffff;")
+        self.typeC_segmentBottom.setObjectName("typeC_segmentBottom")
+        self.gridBottomBranch.addWidget(self.typeC_segmentBottom, 2, 0, 1, 1)
+        self.stackedTemplates.addWidget(self.typeC_BottomBranch)
+        self.typeD_Horizontal = QtWidgets.QWidget()
+        self.typeD_Horizontal.setObjectName("typeD_Horizontal")
+        self.gridHorizontal = QtWidgets.QGridLayout(self.typeD_Horizontal)
+        self.gridHorizontal.setContentsMargins(4, 4, 4, 4)
+        self.gridHorizontal.setSpacing(4)
+        self.gridHorizontal.setObjectName("gridHorizontal")
+        self.typeD_segmentTop = QtWidgets.QFrame(parent=self.typeD_Horizontal)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.typeD_segmentTop.sizePolicy().hasHeightForWidth())
+        self.typeD_segmentTop.setSizePolicy(sizePolicy)
+        self.typeD_segmentTop.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.typeD_segmentTop.setStyleSheet("border: 1px dashed #aaaaaa; background: #ffffff;")
+        self.typeD_segmentTop.setObjectName("typeD_segmentTop")
+        self.gridHorizontal.addWidget(self.typeD_segmentTop, 0, 0, 1, 1)
+        self.typeD_segmentMiddle = QtWidgets.QFrame(parent=self.typeD_Horizontal)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.typeD_segmentMiddle.sizePolicy().hasHeightForWidth())
+        self.typeD_segmentMiddle.setSizePolicy(sizePolicy)
+        self.typeD_segmentMiddle.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.typeD_segmentMiddle.setStyleSheet("border: 1px dashed #aaaaaa; background: #ffffff;")
+        self.typeD_segmentMiddle.setObjectName("typeD_segmentMiddle")
+        self.gridHorizontal.addWidget(self.typeD_segmentMiddle, 1, 0, 1, 1)
+        self.typeD_segmentBottom = QtWidgets.QFrame(parent=self.typeD_Horizontal)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.typeD_segmentBottom.sizePolicy().hasHeightForWidth())
+        self.typeD_segmentBottom.setSizePolicy(sizePolicy)
+        self.typeD_segmentBottom.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.typeD_segmentBottom.setStyleSheet("border: 1px dashed #aaaaaa; background: #ffffff;")
+        self.typeD_segmentBottom.setObjectName("typeD_segmentBottom")
+        self.gridHorizontal.addWidget(self.typeD_segmentBottom, 2, 0, 1, 1)
+        self.stackedTemplates.addWidget(self.typeD_Horizontal)
+        self.layoutStackedBorder.addWidget(self.stackedTemplates)
+        self.verticalLayout.addWidget(self.frameStackedBorder)
+
+        self.retranslateUi(JamoBlock)
+        self.stackedTemplates.setCurrentIndex(0)
+        QtCore.QMetaObject.connectSlotsByName(JamoBlock)
+
+    def retranslateUi(self, JamoBlock):
+        _translate = QtCore.QCoreApplication.translate
+        JamoBlock.setWindowTitle(_translate("JamoBlock", "Jamo Block Viewer"))
+        self.typeA_segmentTop.setToolTip(_translate("JamoBlock", "Type A (Right-branching) — Top segment"))
+        self.typeA_segmentMiddle.setToolTip(_translate("JamoBlock", "Type A (Right-branching) — Middle segment"))
+        self.typeA_segmentBottom.setToolTip(_translate("JamoBlock", "Type A (Right-branching) — Bottom segment"))
+        self.typeB_segmentTop.setToolTip(_translate("JamoBlock", "Type B (Top-branching) — Top segment"))
+        self.typeB_segmentMiddle.setToolTip(_translate("JamoBlock", "Type B (Top-branching) — Middle segment"))
+        self.typeB_segmentBottom.setToolTip(_translate("JamoBlock", "Type B (Top-branching) — Bottom segment"))
+        self.typeC_segmentTop.setToolTip(_translate("JamoBlock", "Type C (Bottom-branching) — Top segment"))
+        self.typeC_segmentMiddle.setToolTip(_translate("JamoBlock", "Type C (Bottom-branching) — Middle segment"))
+        self.typeC_segmentBottom.setToolTip(_translate("JamoBlock", "Type C (Bottom-branching) — Bottom segment"))
+        self.typeD_segmentTop.setToolTip(_translate("JamoBlock", "Type D (Horizontal) — Top segment"))
+        self.typeD_segmentMiddle.setToolTip(_translate("JamoBlock", "Type D (Horizontal) — Middle segment"))
+        self.typeD_segmentBottom.setToolTip(_translate("JamoBlock", "Type D (Horizontal) — Bottom segment"))
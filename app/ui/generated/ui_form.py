@@ -0,0 +1,748 @@
+# Form implementation generated from reading ui file 'ui/form.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.setStyleSheet("\n"
+"                #emptyPlaceholder {\n"
+"                color: palette(mid);\n"
+"                font-style: italic;\n"
+"                font-size: 11pt;\n"
+"                qproperty-alignment: AlignCenter;\n"
+"                }\n"
+"                QWidget[darkTheme=\"true\"] #emptyPlaceholder {\n"
+"                color: palette(midlight);\n"
+"                }\n"
+"                #MainWindow {\n"
+"                background-color: #E6F2F8;\n"
+"                }\n"
+"                #JamoBlock {\n"
+"                }\n"
+"\n"
+"                #MainWindow { background-color: #E6F2F8; }\n"
+"                #JamoBlock { background-color: #FBEFEF; }\n"
+"\n"
+"                /* Taegeuk */\n"
+"                #MainWindow[theme=\"taegeuk\"] { background-color: #E6F2F8; }\n"
+"                #JamoBlock[theme=\"taegeuk\"] { background-color: #FBEFEF; }\n"
+"\n"
+"                /* Hanji */\n"
+"                #MainWindow[theme=\"hanji\"] { background-color: #FEFCF8; }\n"
+"                #JamoBlock[theme=\"hanji\"] { background-color: #F5EAD8; }\n"
+"\n"
+"                QLabel, QGroupBox, QRadioButton, QPushButton, QComboBox {\n"
+"                color: #000000;\n"
+"                }\n"
+"                QComboBox {\n"
+"                background: #ffffff;\n"
+"                }\n"
+"                QComboBox QAbstractItemView {\n"
+"                background: #ffffff;\n"
+"                color: #000000;\n"
+"                }\n"
+"                QPushButton {\n"
+"                background: #f2f2f2;\n"
+"                border: 1px solid #888888;\n"
+"                border-radius: 6px;\n"
+"                padding: 6px 12px;\n"
+"                }\n"
+"                QPushButton:hover {\n"
+"                background: #e8e8e8;\n"
+"                }\n"
+"                QPushButton:pressed {\n"
+"                background: #dddddd;\n"
+"                }\n"
+"                QPushButton:disabled {\n"
+"                background: #f6f6f6;\n"
+"                color: #9a9a9a;\n"
+"                border: 1px solid #cfcfcf;\n"
+"                }\n"
+"                QScrollArea#scrollRrHint,\n"
+"                QWidget#scrollRrHintContents,\n"
+"                QLabel#labelRRHint {\n"
+"                background: transparent;\n"
+"                }\n"
+"\n"
+"                /* Glyph presenters (Characters): keep glyphs visible even if\n"
+"                   parent palettes/styles are muted. */\n"
+"                AutoFitLabel { color: #000000; background: transparent; }\n"
+"\n"
+"                /* Consonant sidebar labels (ConsonantSidebarController) */\n"
+"                QLabel[sidebarState=\"hidden\"] { color: transparent; }\n"
+"                QLabel[sidebarState=\"dim\"] { color: #bbbbbb; }\n"
+"                QLabel[sidebarState=\"current\"] { color: #222222; font-weight: 600; }\n"
+"\n"
+"            ")
+        MainWindow.resize(800, 1200)
+        self.centralwidget = QtWidgets.QWidget(parent=MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setContentsMargins(48, -1, 48, -1)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.labelPlaceholder = QtWidgets.QLabel(parent=self.centralwidget)
+        self.labelPlaceholder.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.labelPlaceholder.setObjectName("labelPlaceholder")
+        self.verticalLayout.addWidget(self.labelPlaceholder)
+        self.rowControls = QtWidgets.QHBoxLayout()
+        self.rowControls.setContentsMargins(0, -1, 0, -1)
+        self.rowControls.setSpacing(8)
+        self.rowControls.setObjectName("rowControls")
+        self.comboMode = QtWidgets.QComboBox(parent=self.centralwidget)
+        self.comboMode.setObjectName("comboMode")
+        self.comboMode.addItem("")
+        self.comboMode.addItem("")
+        self.comboMode.addItem("")
+        self.comboMode.addItem("")
+        self.rowControls.addWidget(self.comboMode)
+        spacerItem = QtWidgets.QSpacerItem(12, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.rowControls.addItem(spacerItem)
+        self.buttonPrev = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.buttonPrev.setMinimumHeight(36)
+        self.buttonPrev.setObjectName("buttonPrev")
+        self.rowControls.addWidget(self.buttonPrev)
+        self.buttonNext = QtWidgets.QPushButton(parent=self.centralwidget)
+        self.buttonNext.setMinimumHeight(36)
+        self.buttonNext.setObjectName("buttonNext")
+        self.rowControls.addWidget(self.buttonNext)
+        spacerItem1 = QtWidgets.QSpacerItem(12, 20, QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.rowControls.addItem(spacerItem1)
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.rowControls.addItem(spacerItem2)
+        self.labelProgress = QtWidgets.QLabel(parent=self.centralwidget)
+        self.labelProgress.setText("")
+        self.labelProgress.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.labelProgress.setMinimumWidth(120)
+        self.labelProgress.setObjectName("labelProgress")
+        self.rowControls.addWidget(self.labelProgress)
+        self.verticalLayout.addLayout(self.rowControls)
+        self.drawerLeft = QtWidgets.QFrame(parent=self.centralwidget)
+        self.drawerLeft.setVisible(False)
+        self.drawerLeft.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.drawerLeft.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.drawerLeft.setStyleSheet("background-color: #f0f0f0; border: 2px solid #cccccc;")
+        self.drawerLeft.setObjectName("drawerLeft")
+        self.layoutDrawerLeft = QtWidgets.QVBoxLayout(self.drawerLeft)
+        self.layoutDrawerLeft.setContentsMargins(12, 12, 12, 12)
+        self.layoutDrawerLeft.setSpacing(6)
+        self.layoutDrawerLeft.setObjectName("layoutDrawerLeft")
+        self.buttonCloseDrawer = QtWidgets.QPushButton(parent=self.drawerLeft)
+        self.buttonCloseDrawer.setMaximumSize(QtCore.QSize(24, 24))
+        self.buttonCloseDrawer.setStyleSheet("font-weight: bold; font-size: 14pt; border: none;\n"
+"                                            background: transparent; color: #444;\n"
+"                                        ")
+        self.buttonCloseDrawer.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.buttonCloseDrawer.setObjectName("buttonCloseDrawer")
+        self.layoutDrawerLeft.addWidget(self.buttonCloseDrawer)
+        self.labelDrawerTitle = QtWidgets.QLabel(parent=self.drawerLeft)
+        self.labelDrawerTitle.setAlignment(QtCore.Qt.AlignmentFlag.AlignHCenter)
+        self.labelDrawerTitle.setStyleSheet("font-weight: bold;")
+        self.labelDrawerTitle.setObjectName("labelDrawerTitle")
+        self.layoutDrawerLeft.addWidget(self.labelDrawerTitle)
+        self.checkIncludeRare = QtWidgets.QCheckBox(parent=self.drawerLeft)
+        self.checkIncludeRare.setObjectName("checkIncludeRare")
+        self.layoutDrawerLeft.addWidget(self.checkIncludeRare)
+        self.checkAdvancedVowels = QtWidgets.QCheckBox(parent=self.drawerLeft)
+        self.checkAdvancedVowels.setObjectName("checkAdvancedVowels")
+        self.layoutDrawerLeft.addWidget(self.checkAdvancedVowels)
+        self.groupPronunciation = QtWidgets.QGroupBox(parent=self.drawerLeft)
+        self.groupPronunciation.setObjectName("groupPronunciation")
+        self.layoutPronunciation = QtWidgets.QVBoxLayout(self.groupPronunciation)
+        self.layoutPronunciation.setContentsMargins(6, 6, 6, 6)
+        self.layoutPronunciation.setSpacing(6)
+        self.layoutPronunciation.setObjectName("layoutPronunciation")
+        self.groupSpeedWpm = QtWidgets.QGroupBox(parent=self.groupPronunciation)
+        self.groupSpeedWpm.setObjectName("groupSpeedWpm")
+        self.layoutWpmRadios = QtWidgets.QHBoxLayout(self.groupSpeedWpm)
+        self.layoutWpmRadios.setContentsMargins(6, 6, 6, 6)
+        self.layoutWpmRadios.setSpacing(12)
+        self.layoutWpmRadios.setObjectName("layoutWpmRadios")
+        self.radioWpm40 = QtWidgets.QRadioButton(parent=self.groupSpeedWpm)
+        self.radioWpm40.setObjectName("radioWpm40")
+        self.buttonGroupWpm = QtWidgets.QButtonGroup(MainWindow)
+        self.buttonGroupWpm.setObjectName("buttonGroupWpm")
+        self.buttonGroupWpm.addButton(self.radioWpm40)
+        self.layoutWpmRadios.addWidget(self.radioWpm40)
+        self.radioWpm80 = QtWidgets.QRadioButton(parent=self.groupSpeedWpm)
+        self.radioWpm80.setObjectName("radioWpm80")
+        self.buttonGroupWpm.addButton(self.radioWpm80)
+        self.layoutWpmRadios.addWidget(self.radioWpm80)
+        self.radioWpm120 = QtWidgets.QRadioButton(parent=self.groupSpeedWpm)
+        self.radioWpm120.setChecked(True)
+        self.radioWpm120.setObjectName("radioWpm120")
+        self.buttonGroupWpm.addButton(self.radioWpm120)
+        self.layoutWpmRadios.addWidget(self.radioWpm120)
+        self.radioWpm160 = QtWidgets.QRadioButton(parent=self.groupSpeedWpm)
+        self.radioWpm160.setObjectName("radioWpm160")
+        self.buttonGroupWpm.addButton(self.radioWpm160)
+        self.layoutWpmRadios.addWidget(self.radioWpm160)
+        self.layoutPronunciation.addWidget(self.groupSpeedWpm)
+        self.layoutDrawerLeft.addWidget(self.groupPronunciation)
+        self.rowRepeats = QtWidgets.QHBoxLayout()
+        self.rowRepeats.setObjectName("rowRepeats")
+        self.labelRepeats = QtWidgets.QLabel(parent=self.drawerLeft)
+        self.labelRepeats.setObjectName("labelRepeats")
+        self.rowRepeats.addWidget(self.labelRepeats)
+        self.spinRepeats = QtWidgets.QSpinBox(parent=self.drawerLeft)
+        self.spinRepeats.setMinimum(1)
+        self.spinRepeats.setMaximum(5)
+        self.spinRepeats.setSingleStep(1)
+        self.spinRepeats.setProperty("value", 1)
+        self.spinRepeats.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight)
+        self.spinRepeats.setObjectName("spinRepeats")
+        self.rowRepeats.addWidget(self.spinRepeats)
+        self.layoutDrawerLeft.addLayout(self.rowRepeats)
+        self.groupDelays = QtWidgets.QGroupBox(parent=self.drawerLeft)
+        self.groupDelays.setObjectName("groupDelays")
+        self.layoutDelays = QtWidgets.QVBoxLayout(self.groupDelays)
+        self.layoutDelays.setContentsMargins(6, 6, 6, 6)
+        self.layoutDelays.setSpacing(6)
+        self.layoutDelays.setObjectName("layoutDelays")
+        self.rowDelayPreFirst = QtWidgets.QHBoxLayout()
+        self.rowDelayPreFirst.setObjectName("rowDelayPreFirst")
+        self.labelDelayPreFirst = QtWidgets.QLabel(parent=self.groupDelays)
+        self.labelDelayPreFirst.setObjectName("labelDelayPreFirst")
+        self.rowDelayPreFirst.addWidget(self.labelDelayPreFirst)
+        self.spinDelayPreFirst = QtWidgets.QSpinBox(parent=self.groupDelays)
+        self.spinDelayPreFirst.setMinimum(0)
+        self.spinDelayPreFirst.setMaximum(20)
+        self.spinDelayPreFirst.setSingleStep(1)
+        self.spinDelayPreFirst.setObjectName("spinDelayPreFirst")
+        self.rowDelayPreFirst.addWidget(self.spinDelayPreFirst)
+        self.layoutDelays.addLayout(self.rowDelayPreFirst)
+        self.rowDelayBetweenReps = QtWidgets.QHBoxLayout()
+        self.rowDelayBetweenReps.setObjectName("rowDelayBetweenReps")
+        self.labelDelayBetweenReps = QtWidgets.QLabel(parent=self.groupDelays)
+        self.labelDelayBetweenReps.setObjectName("labelDelayBetweenReps")
+        self.rowDelayBetweenReps.addWidget(self.labelDelayBetweenReps)
+        self.spinDelayBetweenReps = QtWidgets.QSpinBox(parent=self.groupDelays)
+        self.spinDelayBetweenReps.setMinimum(1)
+        self.spinDelayBetweenReps.setMaximum(5)
+        self.spinDelayBetweenReps.setSingleStep(1)
+        self.spinDelayBetweenReps.setProperty("value", 2)
+        self.spinDelayBetweenReps.setObjectName("spinDelayBetweenReps")
+        self.rowDelayBetweenReps.addWidget(self.spinDelayBetweenReps)
+        self.layoutDelays.addLayout(self.rowDelayBetweenReps)
+        self.rowDelayBeforeHints = QtWidgets.QHBoxLayout()
+        self.rowDelayBeforeHints.setObjectName("rowDelayBeforeHints")
+        self.labelDelayBeforeHints = QtWidgets.QLabel(parent=self.groupDelays)
+        self.labelDelayBeforeHints.setObjectName("labelDelayBeforeHints")
+        self.rowDelayBeforeHints.addWidget(self.labelDelayBeforeHints)
+        self.spinDelayBeforeHints = QtWidgets.QSpinBox(parent=self.groupDelays)
+        self.spinDelayBeforeHints.setMinimum(0)
+        self.spinDelayBeforeHints.setMaximum(5)
+        self.spinDelayBeforeHints.setSingleStep(1)
+        self.spinDelayBeforeHints.setObjectName("spinDelayBeforeHints")
+        self.rowDelayBeforeHints.addWidget(self.spinDelayBeforeHints)
+        self.layoutDelays.addLayout(self.rowDelayBeforeHints)
+        self.rowDelayBeforeExtras = QtWidgets.QHBoxLayout()
+        self.rowDelayBeforeExtras.setObjectName("rowDelayBeforeExtras")
+        self.labelDelayBeforeExtras = QtWidgets.QLabel(parent=self.groupDelays)
+        self.labelDelayBeforeExtras.setObjectName("labelDelayBeforeExtras")
+        self.rowDelayBeforeExtras.addWidget(self.labelDelayBeforeExtras)
+        self.spinDelayBeforeExtras = QtWidgets.QSpinBox(parent=self.groupDelays)
+        self.spinDelayBeforeExtras.setMinimum(1)
+        self.spinDelayBeforeExtras.setMaximum(5)
+        self.spinDelayBeforeExtras.setSingleStep(1)
+        self.spinDelayBeforeExtras.setProperty("value", 1)
+        self.spinDelayBeforeExtras.setObjectName("spinDelayBeforeExtras")
+        self.rowDelayBeforeExtras.addWidget(self.spinDelayBeforeExtras)
+        self.layoutDelays.addLayout(self.rowDelayBeforeExtras)
+        self.rowDelayAutoAdvance = QtWidgets.QHBoxLayout()
+        self.rowDelayAutoAdvance.setObjectName("rowDelayAutoAdvance")
+        self.labelDelayAutoAdvance = QtWidgets.QLabel(parent=self.groupDelays)
+        self.labelDelayAutoAdvance.setObjectName("labelDelayAutoAdvance")
+        self.rowDelayAutoAdvance.addWidget(self.labelDelayAutoAdvance)
+        self.spinDelayAutoAdvance = QtWidgets.QDoubleSpinBox(parent=self.groupDelays)
+        self.spinDelayAutoAdvance.setMinimum(0.0)
+        self.spinDelayAutoAdvance.setMaximum(5.0)
+        self.spinDelayAutoAdvance.setSingleStep(0.5)
+        self.spinDelayAutoAdvance.setDecimals(1)
+        self.spinDelayAutoAdvance.setObjectName("spinDelayAutoAdvance")
+        self.rowDelayAutoAdvance.addWidget(self.spinDelayAutoAdvance)
+        self.layoutDelays.addLayout(self.rowDelayAutoAdvance)
+        self.layoutDrawerLeft.addWidget(self.groupDelays)
+        self.groupColorSchemes = QtWidgets.QGroupBox(parent=self.drawerLeft)
+        self.groupColorSchemes.setObjectName("groupColorSchemes")
+        self.layoutColorSchemes = QtWidgets.QVBoxLayout(self.groupColorSchemes)
+        self.layoutColorSchemes.setContentsMargins(6, 6, 6, 6)
+        self.layoutColorSchemes.setSpacing(6)
+        self.layoutColorSchemes.setObjectName("layoutColorSchemes")
+        self.radioColourTaegeuk = QtWidgets.QRadioButton(parent=self.groupColorSchemes)
+        self.radioColourTaegeuk.setChecked(True)
+        self.radioColourTaegeuk.setObjectName("radioColourTaegeuk")
+        self.buttonGroupColourSchemes = QtWidgets.QButtonGroup(MainWindow)
+        self.buttonGroupColourSchemes.setObjectName("buttonGroupColourSchemes")
+        self.buttonGroupColourSchemes.addButton(self.radioColourTaegeuk)
+        self.layoutColorSchemes.addWidget(self.radioColourTaegeuk)
+        self.radioColourHanji = QtWidgets.QRadioButton(parent=self.groupColorSchemes)
+        self.radioColourHanji.setObjectName("radioColourHanji")
+        self.buttonGroupColourSchemes.addButton(self.radioColourHanji)
+        self.layoutColorSchemes.addWidget(self.radioColourHanji)
+        self.layoutDrawerLeft.addWidget(self.groupColorSchemes)
+        spacerItem3 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.layoutDrawerLeft.addItem(spacerItem3)
+        self.verticalLayout.addWidget(self.drawerLeft)
+        self.splitJamoAndGlyph = QtWidgets.QSplitter(parent=self.centralwidget)
+        self.splitJamoAndGlyph.setOrientation(QtCore.Qt.Orientation.Horizontal)
+        self.splitJamoAndGlyph.setHandleWidth(6)
+        self.splitJamoAndGlyph.setOpaqueResize(True)
+        self.splitJamoAndGlyph.setObjectName("splitJamoAndGlyph")
+        self.JamoBlock = QtWidgets.QWidget(parent=self.splitJamoAndGlyph)
+        self.JamoBlock.setMinimumSize(QtCore.QSize(320, 200))
+        self.JamoBlock.setMaximumSize(QtCore.QSize(360, 16777215))
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.JamoBlock.sizePolicy().hasHeightForWidth())
+        self.JamoBlock.setSizePolicy(sizePolicy)
+        self.JamoBlock.setAutoFillBackground(True)
+        self.JamoBlock.setStyleSheet("border: none;")
+        self.JamoBlock.setObjectName("JamoBlock")
+        self.layoutJamoBlock = QtWidgets.QVBoxLayout(self.JamoBlock)
+        self.layoutJamoBlock.setContentsMargins(2, 2, 2, 2)
+        self.layoutJamoBlock.setSpacing(0)
+        self.layoutJamoBlock.setObjectName("layoutJamoBlock")
+        self.frameJamoOuter = QtWidgets.QFrame(parent=self.JamoBlock)
+        self.frameJamoOuter.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.frameJamoOuter.setLineWidth(1)
+        self.frameJamoOuter.setAutoFillBackground(True)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(1)
+        sizePolicy.setHeightForWidth(self.frameJamoOuter.sizePolicy().hasHeightForWidth())
+        self.frameJamoOuter.setSizePolicy(sizePolicy)
+        self.frameJamoOuter.setStyleSheet("border: 1px solid #000000; background: #FBEFEF;")
+        self.frameJamoOuter.setObjectName("frameJamoOuter")
+        self.layoutInnerJamo = QtWidgets.QVBoxLayout(self.frameJamoOuter)
+        self.layoutInnerJamo.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.layoutInnerJamo.setContentsMargins(30, 30, 30, 30)
+        self.layoutInnerJamo.setObjectName("layoutInnerJamo")
+        self.frameJamoInner = QtWidgets.QFrame(parent=self.frameJamoOuter)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.frameJamoInner.sizePolicy().hasHeightForWidth())
+        self.frameJamoInner.setSizePolicy(sizePolicy)
+        self.frameJamoInner.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.frameJamoInner.setFrameShadow(QtWidgets.QFrame.Shadow.Plain)
+        self.frameJamoInner.setLineWidth(0)
+        self.frameJamoInner.setMidLineWidth(0)
+        self.frameJamoInner.setStyleSheet("border: none; background: #ffffff;")
+        self.frameJamoInner.setObjectName("frameJamoInner")
+        self.layoutJamoInner = QtWidgets.QVBoxLayout(self.frameJamoInner)
+        self.layoutJamoInner.setContentsMargins(0, 0, 0, 0)
+        self.layoutJamoInner.setObjectName("layoutJamoInner")
+        self.layoutInnerJamo.addWidget(self.frameJamoInner)
+        self.layoutJamoBlock.addWidget(self.frameJamoOuter)
+        self.syllableContainer = QtWidgets.QWidget(parent=self.splitJamoAndGlyph)
+        self.syllableContainer.setMinimumSize(QtCore.QSize(260, 0))
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.syllableContainer.sizePolicy().hasHeightForWidth())
+        self.syllableContainer.setSizePolicy(sizePolicy)
+        self.syllableContainer.setStyleSheet("background: #ffffff;")
+        self.syllableContainer.setObjectName("syllableContainer")
+        self.layoutSyllableContainer = QtWidgets.QVBoxLayout(self.syllableContainer)
+        self.layoutSyllableContainer.setContentsMargins(0, 0, 20, 0)
+        self.layoutSyllableContainer.setSpacing(0)
+        self.layoutSyllableContainer.setObjectName("layoutSyllableContainer")
+        self.layoutSyllableRow = QtWidgets.QHBoxLayout()
+        self.layoutSyllableRow.setContentsMargins(0, 0, 0, 0)
+        self.layoutSyllableRow.setSpacing(8)
+        self.layoutSyllableRow.setObjectName("layoutSyllableRow")
+        self.syllableConsonantSidebar = QtWidgets.QWidget(parent=self.syllableContainer)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(1)
+        sizePolicy.setHeightForWidth(self.syllableConsonantSidebar.sizePolicy().hasHeightForWidth())
+        self.syllableConsonantSidebar.setSizePolicy(sizePolicy)
+        self.syllableConsonantSidebar.setMinimumSize(QtCore.QSize(24, 0))
+        self.syllableConsonantSidebar.setObjectName("syllableConsonantSidebar")
+        self.layoutConsonantTicks = QtWidgets.QVBoxLayout(self.syllableConsonantSidebar)
+        self.layoutConsonantTicks.setContentsMargins(4, 12, 4, 0)
+        self.layoutConsonantTicks.setSpacing(4)
+        self.layoutConsonantTicks.setObjectName("layoutConsonantTicks")
+        self.layoutSyllableRow.addWidget(self.syllableConsonantSidebar)
+        self.syllableRenderContainer = QtWidgets.QWidget(parent=self.syllableContainer)
+        self.syllableRenderContainer.setObjectName("syllableRenderContainer")
+        self.layoutSyllableRenderGrid = QtWidgets.QGridLayout(self.syllableRenderContainer)
+        self.layoutSyllableRenderGrid.setContentsMargins(0, 0, 0, 0)
+        self.layoutSyllableRenderGrid.setObjectName("layoutSyllableRenderGrid")
+        self.labelSyllableRight = QtWidgets.QLabel(parent=self.syllableRenderContainer)
+        self.labelSyllableRight.setText("")
+        self.labelSyllableRight.setAlignment(QtCore.Qt.AlignmentFlag.AlignTop|QtCore.Qt.AlignmentFlag.AlignHCenter)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(1)
+        sizePolicy.setHeightForWidth(self.labelSyllableRight.sizePolicy().hasHeightForWidth())
+        self.labelSyllableRight.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(96)
+        self.labelSyllableRight.setFont(font)
+        self.labelSyllableRight.setWordWrap(False)
+        self.labelSyllableRight.setObjectName("labelSyllableRight")
+        self.layoutSyllableRenderGrid.addWidget(self.labelSyllableRight, 0, 0, 1, 1)
+        self.labelSyllableIndex = QtWidgets.QLabel(parent=self.syllableRenderContainer)
+        self.labelSyllableIndex.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.labelSyllableIndex.sizePolicy().hasHeightForWidth())
+        self.labelSyllableIndex.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        self.labelSyllableIndex.setFont(font)
+        self.labelSyllableIndex.setStyleSheet("\n"
+"                                                                    color: #444444;\n"
+"                                                                    background: #f2f2f2;\n"
+"                                                                    border-radius: 8px;\n"
+"                                                                    padding: 2px 8px;\n"
+"                                                                    margin: 8px 0 0 8px;\n"
+"                                                                ")
+        self.labelSyllableIndex.setObjectName("labelSyllableIndex")
+        self.layoutSyllableRenderGrid.addWidget(self.labelSyllableIndex, 0, 0, 1, 1, QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignTop)
+        self.layoutSyllableRow.addWidget(self.syllableRenderContainer)
+        self.layoutSyllableContainer.addLayout(self.layoutSyllableRow)
+        spacerItem4 = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.layoutSyllableContainer.addItem(spacerItem4)
+        self.layoutSyllableChips = QtWidgets.QHBoxLayout()
+        self.layoutSyllableChips.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.layoutSyllableChips.setContentsMargins(8, 8, 0, 8)
+        self.layoutSyllableChips.setSpacing(8)
+        self.layoutSyllableChips.setObjectName("layoutSyllableChips")
+        self.chipAuto = QtWidgets.QPushButton(parent=self.syllableContainer)
+        self.chipAuto.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.chipAuto.setFlat(True)
+        self.chipAuto.setStyleSheet("\n"
+"                                                        QPushButton#chipAuto { padding: 6px 12px; border-radius: 14px;\n"
+"                                                        border: 1px solid rgba(0,0,0,0.15); background:\n"
+"                                                        rgba(0,0,0,0.04); }\n"
+"                                                        QPushButton#chipAuto:hover { background: rgba(0,0,0,0.07); }\n"
+"                                                        QPushButton#chipAuto:pressed { background: rgba(0,0,0,0.12); }\n"
+"                                                        QPushButton#chipAuto:disabled { color: #9a9a9a; border: 1px solid\n"
+"                                                        rgba(0,0,0,0.08); background: rgba(0,0,0,0.02); }\n"
+"                                                    ")
+        self.chipAuto.setObjectName("chipAuto")
+        self.layoutSyllableChips.addWidget(self.chipAuto)
+        self.chipSlow = QtWidgets.QPushButton(parent=self.syllableContainer)
+        self.chipSlow.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.chipSlow.setFlat(True)
+        self.chipSlow.setStyleSheet("\n"
+"                                                        QPushButton#chipSlow { padding: 6px 12px; border-radius: 14px;\n"
+"                                                        border: 1px solid rgba(0,0,0,0.15); background:\n"
+"                                                        rgba(0,0,0,0.04); }\n"
+"                                                        QPushButton#chipSlow:hover { background: rgba(0,0,0,0.07); }\n"
+"                                                        QPushButton#chipSlow:pressed { background: rgba(0,0,0,0.12); }\n"
+"                                                        QPushButton#chipSlow:disabled { color: #9a9a9a; border: 1px solid\n"
+"                                                        rgba(0,0,0,0.08); background: rgba(0,0,0,0.02); }\n"
+"                                                    ")
+        self.chipSlow.setObjectName("chipSlow")
+        self.layoutSyllableChips.addWidget(self.chipSlow)
+        spacerItem5 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.layoutSyllableChips.addItem(spacerItem5)
+        self.layoutChipsRight = QtWidgets.QHBoxLayout()
+        self.layoutChipsRight.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.layoutChipsRight.setSpacing(8)
+        self.layoutChipsRight.setObjectName("layoutChipsRight")
+        self.chipPrev = QtWidgets.QPushButton(parent=self.syllableContainer)
+        self.chipPrev.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.chipPrev.setFlat(True)
+        self.chipPrev.setStyleSheet("\n"
+"                                                                QPushButton#chipPrev { padding: 6px 12px; border-radius: 14px;\n"
+"                                                                border: 1px solid rgba(0,0,0,0.15); background:\n"
+"                                                                rgba(0,0,0,0.04); }\n"
+"                                                                QPushButton#chipPrev:hover { background: rgba(0,0,0,0.07); }\n"
+"                                                                QPushButton#chipPrev:pressed { background: rgba(0,0,0,0.12); }\n"
+"                                                            ")
+        self.chipPrev.setObjectName("chipPrev")
+        self.layoutChipsRight.addWidget(self.chipPrev)
+        self.chipPronounce = QtWidgets.QPushButton(parent=self.syllableContainer)
+        font = QtGui.QFont()
+        font.setPointSize(20)
+        self.chipPronounce.setFont(font)
+        self.chipPronounce.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.chipPronounce.setFlat(True)
+        self.chipPronounce.setStyleSheet("\n"
+"                                                                QPushButton#chipPronounce { padding: 6px 12px; border-radius:\n"
+"                                                                14px; border: 1px solid rgba(0,0,0,0.15); background:\n"
+"                                                                rgba(0,0,0,0.04); }\n"
+"                                                                QPushButton#chipPronounce:hover { background: rgba(0,0,0,0.07);\n"
+"                                                                }\n"
+"                                                                QPushButton#chipPronounce:pressed { background:\n"
+"                                                                rgba(0,0,0,0.12); }\n"
+"                                                            ")
+        self.chipPronounce.setObjectName("chipPronounce")
+        self.layoutChipsRight.addWidget(self.chipPronounce)
+        self.chipNext = QtWidgets.QPushButton(parent=self.syllableContainer)
+        self.chipNext.setCursor(QtGui.QCursor(QtCore.Qt.CursorShape.PointingHandCursor))
+        self.chipNext.setFlat(True)
+        self.chipNext.setStyleSheet("\n"
+"                                                                QPushButton#chipNext { padding: 6px 12px; border-radius: 14px;\n"
+"                                                                border: 1px solid rgba(0,0,0,0.15); background:\n"
+"                                                                rgba(0,0,0,0.04); }\n"
+"                                                                QPushButton#chipNext:hover { background: rgba(0,0,0,0.07); }\n"
+"                                                                QPushButton#chipNext:pressed { background: rgba(0,0,0,0.12); }\n"
+"                                                            ")
+        self.chipNext.setObjectName("chipNext")
+        self.layoutChipsRight.addWidget(self.chipNext)
+        self.layoutSyllableChips.addLayout(self.layoutChipsRight)
+        self.layoutSyllableContainer.addLayout(self.layoutSyllableChips)
+        self.verticalLayout.addWidget(self.splitJamoAndGlyph)
+        spacerItem6 = QtWidgets.QSpacerItem(20, 8, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Fixed)
+        self.verticalLayout.addItem(spacerItem6)
+        self.groupRrPanel = QtWidgets.QGroupBox(parent=self.centralwidget)
+        self.groupRrPanel.setTitle("")
+        self.groupRrPanel.setObjectName("groupRrPanel")
+        self.layoutHintsExamplesRow = QtWidgets.QHBoxLayout(self.groupRrPanel)
+        self.layoutHintsExamplesRow.setSpacing(12)
+        self.layoutHintsExamplesRow.setObjectName("layoutHintsExamplesRow")
+        self.groupRrInner = QtWidgets.QGroupBox(parent=self.groupRrPanel)
+        self.groupRrInner.setObjectName("groupRrInner")
+        self.layoutRrPanel = QtWidgets.QVBoxLayout(self.groupRrInner)
+        self.layoutRrPanel.setAlignment(QtCore.Qt.AlignmentFlag.AlignTop)
+        self.layoutRrPanel.setObjectName("layoutRrPanel")
+        self.labelRRValue = QtWidgets.QLabel(parent=self.groupRrInner)
+        font = QtGui.QFont()
+        font.setPointSize(36)
+        self.labelRRValue.setFont(font)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.labelRRValue.sizePolicy().hasHeightForWidth())
+        self.labelRRValue.setSizePolicy(sizePolicy)
+        self.labelRRValue.setStyleSheet("")
+        self.labelRRValue.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.labelRRValue.setObjectName("labelRRValue")
+        self.layoutRrPanel.addWidget(self.labelRRValue)
+        self.scrollRrHint = QtWidgets.QScrollArea(parent=self.groupRrInner)
+        self.scrollRrHint.setMinimumSize(QtCore.QSize(0, 240))
+        self.scrollRrHint.setMaximumSize(QtCore.QSize(16777215, 240))
+        self.scrollRrHint.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.scrollRrHint.setStyleSheet("")
+        self.scrollRrHint.setWidgetResizable(True)
+        self.scrollRrHint.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.scrollRrHint.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.scrollRrHint.setObjectName("scrollRrHint")
+        self.scrollRrHintContents = QtWidgets.QWidget()
+        self.scrollRrHintContents.setObjectName("scrollRrHintContents")
+        self.layoutRrHintContents = QtWidgets.QVBoxLayout(self.scrollRrHintContents)
+        self.layoutRrHintContents.setAlignment(QtCore.Qt.AlignmentFlag.AlignTop)
+        self.layoutRrHintContents.setContentsMargins(0, 0, 0, 0)
+        self.layoutRrHintContents.setObjectName("layoutRrHintContents")
+        self.labelRRHint = QtWidgets.QLabel(parent=self.scrollRrHintContents)
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.labelRRHint.setFont(font)
+        self.labelRRHint.setWordWrap(True)
+        self.labelRRHint.setObjectName("labelRRHint")
+        self.layoutRrHintContents.addWidget(self.labelRRHint)
+        self.scrollRrHint.setWidget(self.scrollRrHintContents)
+        self.layoutRrPanel.addWidget(self.scrollRrHint)
+        self.layoutRrButtons = QtWidgets.QHBoxLayout()
+        self.layoutRrButtons.setObjectName("layoutRrButtons")
+        self.btnRRHear = QtWidgets.QPushButton(parent=self.groupRrInner)
+        self.btnRRHear.setObjectName("btnRRHear")
+        self.layoutRrButtons.addWidget(self.btnRRHear)
+        self.radioRRCues = QtWidgets.QRadioButton(parent=self.groupRrInner)
+        self.radioRRCues.setChecked(True)
+        self.radioRRCues.setObjectName("radioRRCues")
+        self.layoutRrButtons.addWidget(self.radioRRCues)
+        spacerItem7 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.layoutRrButtons.addItem(spacerItem7)
+        self.layoutRrPanel.addLayout(self.layoutRrButtons)
+        self.layoutHintsExamplesRow.addWidget(self.groupRrInner)
+        self.groupExamplesPanel = QtWidgets.QGroupBox(parent=self.groupRrPanel)
+        self.groupExamplesPanel.setObjectName("groupExamplesPanel")
+        self.layoutExamplesPanel = QtWidgets.QVBoxLayout(self.groupExamplesPanel)
+        self.layoutExamplesPanel.setAlignment(QtCore.Qt.AlignmentFlag.AlignTop)
+        self.layoutExamplesPanel.setSpacing(4)
+        self.layoutExamplesPanel.setObjectName("layoutExamplesPanel")
+        self.labelExampleHangul = QtWidgets.QLabel(parent=self.groupExamplesPanel)
+        font = QtGui.QFont()
+        font.setPointSize(36)
+        font.setBold(True)
+        self.labelExampleHangul.setFont(font)
+        self.labelExampleHangul.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignTop)
+        self.labelExampleHangul.setWordWrap(True)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.labelExampleHangul.sizePolicy().hasHeightForWidth())
+        self.labelExampleHangul.setSizePolicy(sizePolicy)
+        self.labelExampleHangul.setObjectName("labelExampleHangul")
+        self.layoutExamplesPanel.addWidget(self.labelExampleHangul)
+        self.labelExampleHangulPlain = QtWidgets.QLabel(parent=self.groupExamplesPanel)
+        self.labelExampleHangulPlain.setVisible(False)
+        self.labelExampleHangulPlain.setObjectName("labelExampleHangulPlain")
+        self.layoutExamplesPanel.addWidget(self.labelExampleHangulPlain)
+        spacerItem8 = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.layoutExamplesPanel.addItem(spacerItem8)
+        self.layoutExampleMedia = QtWidgets.QHBoxLayout()
+        self.layoutExampleMedia.setSpacing(8)
+        self.layoutExampleMedia.setObjectName("layoutExampleMedia")
+        self.labelExampleImage = QtWidgets.QLabel(parent=self.groupExamplesPanel)
+        self.labelExampleImage.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.labelExampleImage.sizePolicy().hasHeightForWidth())
+        self.labelExampleImage.setSizePolicy(sizePolicy)
+        self.labelExampleImage.setMinimumSize(QtCore.QSize(160, 160))
+        self.labelExampleImage.setMaximumSize(QtCore.QSize(160, 160))
+        self.labelExampleImage.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
+        self.labelExampleImage.setObjectName("labelExampleImage")
+        self.layoutExampleMedia.addWidget(self.labelExampleImage)
+        self.layoutExamplesPanel.addLayout(self.layoutExampleMedia)
+        spacerItem9 = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.layoutExamplesPanel.addItem(spacerItem9)
+        self.labelExampleRR = QtWidgets.QLabel(parent=self.groupExamplesPanel)
+        self.labelExampleRR.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.labelExampleRR.setVisible(False)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.labelExampleRR.sizePolicy().hasHeightForWidth())
+        self.labelExampleRR.setSizePolicy(sizePolicy)
+        self.labelExampleRR.setObjectName("labelExampleRR")
+        self.layoutExamplesPanel.addWidget(self.labelExampleRR)
+        self.labelExampleGloss = QtWidgets.QLabel(parent=self.groupExamplesPanel)
+        self.labelExampleGloss.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.labelExampleGloss.setVisible(False)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.labelExampleGloss.sizePolicy().hasHeightForWidth())
+        self.labelExampleGloss.setSizePolicy(sizePolicy)
+        self.labelExampleGloss.setObjectName("labelExampleGloss")
+        self.layoutExamplesPanel.addWidget(self.labelExampleGloss)
+        self.layoutExampleButtons = QtWidgets.QHBoxLayout()
+        self.layoutExampleButtons.setObjectName("layoutExampleButtons")
+        self.btnExampleHear = QtWidgets.QPushButton(parent=self.groupExamplesPanel)
+        self.btnExampleHear.setObjectName("btnExampleHear")
+        self.layoutExampleButtons.addWidget(self.btnExampleHear)
+        spacerItem10 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.layoutExampleButtons.addItem(spacerItem10)
+        self.layoutExamplesPanel.addLayout(self.layoutExampleButtons)
+        self.layoutHintsExamplesRow.addWidget(self.groupExamplesPanel)
+        self.verticalLayout.addWidget(self.groupRrPanel)
+        self.groupNotesPanel = QtWidgets.QGroupBox(parent=self.centralwidget)
+        self.groupNotesPanel.setObjectName("groupNotesPanel")
+        self.layoutNotesPanel = QtWidgets.QVBoxLayout(self.groupNotesPanel)
+        self.layoutNotesPanel.setObjectName("layoutNotesPanel")
+        self.labelNotesPlaceholder = QtWidgets.QLabel(parent=self.groupNotesPanel)
+        self.labelNotesPlaceholder.setWordWrap(True)
+        self.labelNotesPlaceholder.setObjectName("labelNotesPlaceholder")
+        self.layoutNotesPanel.addWidget(self.labelNotesPlaceholder)
+        self.verticalLayout.addWidget(self.groupNotesPanel)
+        spacerItem11 = QtWidgets.QSpacerItem(20, 200, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.verticalLayout.addItem(spacerItem11)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(parent=MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 1536, 22))
+        self.menubar.setObjectName("menubar")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(parent=MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "Hangul Pronunciation"))
+        self.labelPlaceholder.setText(_translate("MainWindow", "Welcome to Hangul Pronunciation"))
+        self.comboMode.setToolTip(_translate("MainWindow", "Choose what to practice: full syllables, vowels, or consonants"))
+        self.comboMode.setItemText(0, _translate("MainWindow", "Vowels"))
+        self.comboMode.setItemText(1, _translate("MainWindow", "Consonants"))
+        self.comboMode.setItemText(2, _translate("MainWindow", "Syllables"))
+        self.comboMode.setItemText(3, _translate("MainWindow", "Words"))
+        self.buttonPrev.setText(_translate("MainWindow", "Prev"))
+        self.buttonPrev.setToolTip(_translate("MainWindow", "Go to previous item on the current axis"))
+        self.buttonNext.setText(_translate("MainWindow", "Next"))
+        self.buttonNext.setToolTip(_translate("MainWindow", "Go to next item on the current axis"))
+        self.labelProgress.setToolTip(_translate("MainWindow", "Progress summary (e.g., 5/10 vowels)"))
+        self.buttonCloseDrawer.setToolTip(_translate("MainWindow", "Close drawer"))
+        self.buttonCloseDrawer.setText(_translate("MainWindow", "×"))
+        self.labelDrawerTitle.setText(_translate("MainWindow", "Settings"))
+        self.checkIncludeRare.setText(_translate("MainWindow", "Include rare"))
+        self.checkIncludeRare.setToolTip(_translate("MainWindow", "Show syllables marked as rare"))
+        self.checkAdvancedVowels.setText(_translate("MainWindow", "Advanced vowels"))
+        self.checkAdvancedVowels.setToolTip(_translate("MainWindow", "Include diphthongs/complex vowels in the order"))
+        self.groupPronunciation.setTitle(_translate("MainWindow", "Pronunciation"))
+        self.groupSpeedWpm.setTitle(_translate("MainWindow", "Speed (WPM)"))
+        self.radioWpm40.setText(_translate("MainWindow", "40"))
+        self.radioWpm40.setToolTip(_translate("MainWindow", "40 words per minute"))
+        self.radioWpm80.setText(_translate("MainWindow", "80"))
+        self.radioWpm80.setToolTip(_translate("MainWindow", "80 words per minute"))
+        self.radioWpm120.setText(_translate("MainWindow", "120"))
+        self.radioWpm120.setToolTip(_translate("MainWindow", "120 words per minute"))
+        self.radioWpm160.setText(_translate("MainWindow", "160"))
+        self.radioWpm160.setToolTip(_translate("MainWindow", "160 words per minute"))
+        self.labelRepeats.setText(_translate("MainWindow", "Repeats"))
+        self.labelRepeats.setToolTip(_translate("MainWindow", "Number of times each pronunciation will be repeated."))
+        self.spinRepeats.setSuffix(_translate("MainWindow", "×"))
+        self.spinRepeats.setToolTip(_translate("MainWindow", "Number of times to repeat the pronunciation (1–5)"))
+        self.groupDelays.setTitle(_translate("MainWindow", "Delays"))
+        self.labelDelayPreFirst.setText(_translate("MainWindow", "Before first play"))
+        self.labelDelayPreFirst.setToolTip(_translate("MainWindow", "Delay before the first pronunciation starts"))
+        self.spinDelayPreFirst.setSuffix(_translate("MainWindow", " s"))
+        self.spinDelayPreFirst.setToolTip(_translate("MainWindow", "0–20 seconds, whole seconds"))
+        self.labelDelayBetweenReps.setText(_translate("MainWindow", "Between repeats"))
+        self.labelDelayBetweenReps.setToolTip(_translate("MainWindow", "Pause between repeated pronunciations"))
+        self.spinDelayBetweenReps.setSuffix(_translate("MainWindow", " s"))
+        self.spinDelayBetweenReps.setToolTip(_translate("MainWindow", "1–5 seconds, whole seconds"))
+        self.labelDelayBeforeHints.setText(_translate("MainWindow", "Before hints"))
+        self.labelDelayBeforeHints.setToolTip(_translate("MainWindow", "Delay before pronunciation hints are shown"))
+        self.spinDelayBeforeHints.setSuffix(_translate("MainWindow", " s"))
+        self.spinDelayBeforeHints.setToolTip(_translate("MainWindow", "0–5 seconds, whole seconds"))
+        self.labelDelayBeforeExtras.setText(_translate("MainWindow", "Before extras"))
+        self.labelDelayBeforeExtras.setToolTip(_translate("MainWindow", "Delay before extra information is shown"))
+        self.spinDelayBeforeExtras.setSuffix(_translate("MainWindow", " s"))
+        self.spinDelayBeforeExtras.setToolTip(_translate("MainWindow", "1–5 seconds, whole seconds"))
+        self.labelDelayAutoAdvance.setText(_translate("MainWindow", "Before auto‑advance"))
+        self.labelDelayAutoAdvance.setToolTip(_translate("MainWindow", "Delay before moving forward automatically (auto mode)"))
+        self.spinDelayAutoAdvance.setSuffix(_translate("MainWindow", " s"))
+        self.spinDelayAutoAdvance.setToolTip(_translate("MainWindow", "0–5.0 seconds, step 0.5 s"))
+        self.groupColorSchemes.setTitle(_translate("MainWindow", "Colour schemes"))
+        self.radioColourTaegeuk.setText(_translate("MainWindow", "Taegeuk"))
+        self.radioColourTaegeuk.setToolTip(_translate("MainWindow", "Blue–red theme inspired by the Taegeuk symbol"))
+        self.radioColourHanji.setText(_translate("MainWindow", "Hanji paper"))
+        self.radioColourHanji.setToolTip(_translate("MainWindow", "Warm off‑white theme inspired by traditional Hanji paper\n"
+"                                                    "))
+        self.JamoBlock.setToolTip(_translate("MainWindow", "Hangul Jamo Block (≈45% width)"))
+        self.labelSyllableIndex.setText(_translate("MainWindow", "0/0"))
+        self.chipAuto.setText(_translate("MainWindow", "🚀"))
+        self.chipAuto.setToolTip(_translate("MainWindow", "Auto mode"))
+        self.chipSlow.setText(_translate("MainWindow", "🐢"))
+        self.chipSlow.setToolTip(_translate("MainWindow", "Toggle Slow Mode: temporarily slows pronunciation to minimum speed. Press again to restore your previous WPM rate."))
+        self.chipPrev.setText(_translate("MainWindow", "◀"))
+        self.chipPrev.setToolTip(_translate("MainWindow", "Previous item"))
+        self.chipPronounce.setText(_translate("MainWindow", "Listen"))
+        self.chipPronounce.setToolTip(_translate("MainWindow", "Play pronunciation"))
+        self.chipNext.setText(_translate("MainWindow", "▶"))
+        self.chipNext.setToolTip(_translate("MainWindow", "Next item"))
+        self.groupRrInner.setTitle(_translate("MainWindow", "Revised Romanization (RR)"))
+        self.labelRRValue.setText(_translate("MainWindow", "ga"))
+        self.labelRRHint.setText(_translate("MainWindow", "RR hint"))
+        self.btnRRHear.setText(_translate("MainWindow", "Listen"))
+        self.radioRRCues.setText(_translate("MainWindow", "Show cues"))
+        self.groupExamplesPanel.setTitle(_translate("MainWindow", "Examples"))
+        self.labelExampleHangul.setText(_translate("MainWindow", "가방"))
+        self.labelExampleHangulPlain.setText(_translate("MainWindow", "가방"))
+        self.labelExampleImage.setText(_translate("MainWindow", "No image yet"))
+        self.labelExampleRR.setText(_translate("MainWindow", "gabang"))
+        self.labelExampleGloss.setText(_translate("MainWindow", "bag"))
+        self.btnExampleHear.setText(_translate("MainWindow", "Listen"))
+        self.groupNotesPanel.setTitle(_translate("MainWindow", "Notes"))
+        self.labelNotesPlaceholder.setText(_translate("MainWindow", "Standalone vowels are written with a silent ㅇ onset, so ㅏ is written as 아 (ㅇ + ㅏ)."))
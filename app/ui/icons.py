@@ -44,16 +44,13 @@ def safe_icon_from_path(path: str | Path) -> QIcon:
     """
     try:
         p = Path(path).expanduser()
-        if not p.exists():
-            return QIcon()
-
-        ap = str(p.resolve())
+        # One stat() both checks existence and supplies the cache-busting mtime.
         try:
             mtime_ns = p.stat().st_mtime_ns
-        except (FileNotFoundError, PermissionError, OSError):
-            mtime_ns = 0
+        except OSError:
+            return QIcon()
 
-        return _cached_icon_from_path(ap, int(mtime_ns))
+        return _cached_icon_from_path(str(p.resolve()), int(mtime_ns))
     except (TypeError, ValueError, AttributeError, OSError):
         return QIcon()
 
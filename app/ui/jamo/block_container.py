@@ -1,13 +1,12 @@
 from __future__ import annotations
 
+import logging
 from typing import Optional, List
 
-from PyQt6.QtCore import QSize, Qt
-# --- PyQt6 multimedia imports (for QSoundEffect) ---
+from PyQt6.QtCore import QSize, Qt, QTimer
 from PyQt6.QtWidgets import (
     QWidget,
     QStackedWidget,
-    QLabel,
     QVBoxLayout,
     QHBoxLayout,
 )
@@ -18,14 +17,18 @@ from app.domain.enums import (
     ConsonantPosition,
 )
 from app.domain.hangul_compose import compose_cv
-from app.domain.syllables import select_syllable_for_block
+from app.domain.syllables import select_cv_for_block
 from app.ui.utils.layout import (
     _deep_clear_container,
     _ensure_empty_placeholder,
     _enforce_equal_segment_heights,
 )
 from app.ui.widgets.labels import _mk_title_label
-from app.ui.widgets.segments import SegmentView, ConsonantView, VowelView
+from app.ui.widgets.segments import Characters, SegmentView, ConsonantView, VowelView
+
+logger = logging.getLogger(__name__)
+
+_DEBUG_BLOCK_CONTAINER = False
 
 # --- Segment label text (tooltips and titles) ---
 # These were previously defined in main.py; BlockContainer needs them for UI tooltips.
@@ -41,6 +44,318 @@ SEG_TIPS = {
     "T": "Trailing consonant (final).",
 }
 
+# Segment roles in Top/Middle/Bottom order, resolved once for hot paths.
+_ROLES = (SegmentRole.Top, SegmentRole.Middle, SegmentRole.Bottom)
+
+# Normalise role values to SegmentRole. Promoted widgets may report the enum
+# itself or its legacy CamelCase name (as used by the 'segmentRole' property).
+_ROLE_NAMES = ("Top", "Middle", "Bottom")
+_ROLE_COERCE: dict[object, SegmentRole] = {
+    SegmentRole.Top: SegmentRole.Top,
+    SegmentRole.Middle: SegmentRole.Middle,
+    SegmentRole.Bottom: SegmentRole.Bottom,
+    "Top": SegmentRole.Top,
+    "Middle": SegmentRole.Middle,
+    "Bottom": SegmentRole.Bottom,
+}
+
+# (title, tooltip) for the trailing-consonant segment, resolved once.
+_T_TITLE = (SEG_TITLES["T"], SEG_TIPS["T"])
+
+# Tooltips of the glyph presenters. Set once when a view is built; pooled
+# views keep theirs, so reuse needs no setToolTip round-trip.
+_LEADING_TIP = "Leading"
+_VOWEL_TIP = "Vowel"
+
+
+# --- Segment contents per block type ---
+# "L" = leading consonant glyph, "V" = vowel glyph, "T" = trailing-consonant
+# title only (no glyph). Several glyphs in one segment share a single row.
+_BLOCK_LAYOUT: dict[BlockType, dict[SegmentRole, tuple[str, ...]]] = {
+    BlockType.A_RightBranch: {
+        SegmentRole.Top: ("L", "V"),
+        SegmentRole.Middle: (),
+        SegmentRole.Bottom: ("T",),
+    },
+    BlockType.B_TopBranch: {
+        SegmentRole.Top: ("V",),
+        SegmentRole.Middle: ("L",),
+        SegmentRole.Bottom: ("T",),
+    },
+    BlockType.C_BottomBranch: {
+        SegmentRole.Top: ("L",),
+        SegmentRole.Middle: ("V",),
+        SegmentRole.Bottom: ("T",),
+    },
+    BlockType.D_Horizontal: {
+        SegmentRole.Top: ("L",),
+        SegmentRole.Middle: ("V",),
+        SegmentRole.Bottom: ("T",),
+    },
+}
+
+
+def _get_or_create_vlayout(w: QWidget) -> QVBoxLayout:
+    """Return the segment's layout, creating a QVBoxLayout if it has none.
+
+    Segment margins and centring are (re)applied either way, because layouts
+    created by `_deep_clear_container` start with zero margins.
+    """
+    layout = w.layout()
+    if layout is None:
+        layout = QVBoxLayout(w)
+    layout.setContentsMargins(4, 4, 4, 4)
+    layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    return layout  # type: ignore[return-value]
+
+
+def _segment_layout(
+        w: Optional[QWidget], title: str | None, tooltip: Optional[str] = None
+) -> Optional[QVBoxLayout]:
+    if w is None:
+        return None
+    layout = _get_or_create_vlayout(w)
+    if title:
+        t = _mk_title_label(title)
+        if tooltip:
+            t.setToolTip(tooltip)
+        layout.addWidget(t)
+    return layout
+
+
+def _add_row(parent_w: QWidget, widgets: List[QWidget]) -> None:
+    """Place several glyph presenters side by side in one segment row.
+
+    The row layout is filled while still unattached and installed on its
+    holder afterwards, so the holder sees one complete layout instead of an
+    invalidation per added column.
+    """
+    row = QHBoxLayout()
+    row.setContentsMargins(0, 0, 0, 0)
+    row.setSpacing(25)  # increase spacing between consonant and vowel to 25px
+    # row.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    for wdg in widgets:
+        # Give each column equal stretch so it fills available width
+        row.addWidget(wdg, 1)
+    row_holder = QWidget(parent_w)
+    row_holder.setLayout(row)
+    _get_or_create_vlayout(parent_w).addWidget(row_holder)
+
+
+def _dbg_seg(w: Optional[QWidget], name: str) -> None:
+    try:
+        layout = w.layout() if w is not None else None
+        cnt = layout.count() if layout is not None else -1
+        sz = w.size() if w is not None else QSize(0, 0)
+        logger.debug(
+            "seg %s: exists=%s size=%dx%d layout=%s items=%d",
+            name, w is not None, sz.width(), sz.height(),
+            type(layout).__name__ if layout else None, cnt,
+        )
+    except Exception as e:
+        logger.debug("seg %s: error=%s", name, e)
+
+
+def _reset_segments(page: QWidget, segments: tuple[Optional[QWidget], ...]) -> None:
+    """Empty the segments for a fresh attach, pooling their glyph presenters.
+
+    Each dirty segment is handled in one visit: its presenters are moved under
+    a hidden holder on the page (which also takes them out of their layouts)
+    and kept in `page._hg_view_pool` by class, so the next attach can reuse
+    them instead of building new widgets; then whatever remains is cleared.
+    Missing (None) segments are skipped.
+    """
+    holder = getattr(page, "_hg_view_holder", None)
+    for seg in segments:
+        if seg is None or not getattr(seg, "_hg_dirty", True):
+            continue
+        views = seg.findChildren(Characters)
+        if views:
+            if holder is None:
+                holder = page._hg_view_holder = QWidget(page)
+                holder.hide()
+                page._hg_view_pool = {}
+            pool = page._hg_view_pool
+            for v in views:
+                v.setParent(holder)
+                pool.setdefault(type(v), []).append(v)
+        _deep_clear_container(seg)
+
+
+def _take_consonant_view(page: QWidget, parent: QWidget, grapheme: str) -> ConsonantView:
+    pool = getattr(page, "_hg_view_pool", None)
+    bucket = pool.get(ConsonantView) if pool else None
+    if not bucket:
+        view = ConsonantView(parent, grapheme, ConsonantPosition.Initial)
+        view.setToolTip(_LEADING_TIP)
+        return view
+    view = bucket.pop()
+    view.setParent(parent)
+    view.set_grapheme(grapheme)
+    view.set_position(ConsonantPosition.Initial)
+    view.set_ipa(None)
+    return view
+
+
+def _take_vowel_view(page: QWidget, parent: QWidget, grapheme: str) -> VowelView:
+    pool = getattr(page, "_hg_view_pool", None)
+    bucket = pool.get(VowelView) if pool else None
+    if not bucket:
+        view = VowelView(parent, grapheme)
+        view.setToolTip(_VOWEL_TIP)
+        return view
+    view = bucket.pop()
+    view.setParent(parent)
+    view.set_grapheme(grapheme)
+    view.set_ipa(None)
+    return view
+
+
+def _ensure_placeholder_if_empty(w: Optional[QWidget]) -> None:
+    if w is None:
+        return
+    layout = w.layout()
+    if layout is None or layout.count() == 0:
+        ph = _ensure_empty_placeholder(w)
+        ph.setText("")
+        ph.setVisible(False)
+
+
+# Stacked-widget page index of each block type's template in jamo.ui.
+_TYPE_TO_INDEX = {
+    BlockType.A_RightBranch: 0,
+    BlockType.B_TopBranch: 1,
+    BlockType.C_BottomBranch: 2,
+    BlockType.D_Horizontal: 3,
+}
+
+# Legacy objectName prefixes of the per-type segment frames in jamo.ui.
+_TYPE_PREFIX = {
+    BlockType.A_RightBranch: "typeA_",
+    BlockType.B_TopBranch: "typeB_",
+    BlockType.C_BottomBranch: "typeC_",
+    BlockType.D_Horizontal: "typeD_",
+}
+
+
+def _objname_map(page: QWidget, widgets: Optional[List[QWidget]] = None) -> dict[str, QWidget]:
+    """Return a cached {objectName: widget} index of `page`'s descendants.
+
+    Built on first use, from `widgets` when the caller already walked the page
+    or else with one recursive findChildren(), and cached on the page as
+    `_objname_map`; only the legacy name-based fallback needs it.
+    """
+    cached = getattr(page, "_objname_map", None)
+    if cached is None:
+        cached = {}
+        for w in page.findChildren(QWidget) if widgets is None else widgets:
+            name = w.objectName()
+            if name and name not in cached:
+                cached[name] = w
+        page._objname_map = cached
+    return cached
+
+
+def _resolve_segment_widgets(page: QWidget, block_type: BlockType) -> dict[SegmentRole, QWidget]:
+    """Discover the Top/Middle/Bottom segment widgets on a template page.
+
+    Strategies, in order: promoted SegmentView children (by role()), widgets
+    carrying the 'segmentRole' dynamic property, then the legacy per-type
+    object names. The mapping is cached on the page as `_seg_roles`, so later
+    attaches (and consonant_only) skip discovery entirely.
+    The returned dict is shared; callers must not mutate it.
+    """
+    cached = getattr(page, "_seg_roles", None)
+    if cached is not None:
+        return cached
+
+    # One descendant walk, one Python pass: promoted SegmentViews (strategy A)
+    # and 'segmentRole'-tagged widgets (strategy B) are bucketed together, and
+    # the pass stops early once A alone has all three roles.
+    widgets = page.findChildren(QWidget)
+    by_view: dict[SegmentRole, QWidget] = {}
+    by_prop: dict[SegmentRole, QWidget] = {}
+    for w in widgets:
+        if isinstance(w, SegmentView) and (r := w.role()) in _ROLE_COERCE:
+            by_view.setdefault(_ROLE_COERCE[r], w)
+            if len(by_view) == 3:
+                break
+        # Whoever sets 'segmentRole' mirrors it as _hg_segment_role (SegmentView,
+        # _index_page_frames); reading the attribute avoids a property() call
+        # across the sip boundary for every widget on the page.
+        prop = getattr(w, "_hg_segment_role", None)
+        if prop in _ROLE_NAMES:
+            by_prop[_ROLE_COERCE[prop]] = w
+
+    # Strategy B entries take over when A is incomplete, as before.
+    role_to_widget = by_view
+    if len(role_to_widget) < 3:
+        role_to_widget.update(by_prop)
+
+    # Fallback C: legacy per-type frame names
+    if len(role_to_widget) < 3:
+        type_prefix = _TYPE_PREFIX[block_type]
+        by_name = _objname_map(page, widgets)
+        for role, role_name in zip(_ROLES, _ROLE_NAMES):
+            objname = type_prefix + "segment" + role_name
+            w = by_name.get(objname)
+            if w is not None:
+                role_to_widget[role] = w
+            if _DEBUG_BLOCK_CONTAINER:
+                logger.debug(
+                    "%s: lookup %s -> %s",
+                    page.objectName(), objname, "OK" if isinstance(w, QWidget) else "MISSING",
+                )
+
+    # As a last resort, if a role is still missing, create a SegmentView and add it to the page's top/middle/bottom rows
+    # (requires a QGridLayout with rows 0,1,2). If not present, we skip creation to avoid guessing.
+    if len(role_to_widget) < 3:
+        grid = page.layout()
+        if isinstance(grid, QVBoxLayout):
+            pass  # not attempting to inject into unfamiliar layouts
+        else:
+            try:
+                # best-effort: rows 0..2, col 0
+                for row, role in enumerate(_ROLES):
+                    if role not in role_to_widget:
+                        sv = SegmentView(page, role)
+                        _get_or_create_vlayout(sv)
+                        role_to_widget[role] = sv
+            except Exception:
+                pass
+
+    # Template pages are static for the app's lifetime, so even an incomplete
+    # mapping is final; caching it keeps a broken page from being re-walked
+    # on every attach.
+    page._seg_roles = role_to_widget
+    return role_to_widget
+
+
+def _schedule_finalize(page: QWidget, segments: List[QWidget]) -> None:
+    """Defer post-attach layout work on `page` to a single event-loop pass.
+
+    Repeated attaches before the event loop runs (startup, rapid switching)
+    restart the same per-page timer, so heights are equalised and geometry
+    is invalidated once for the latest segments only.
+    """
+    page._hg_pending_segments = segments
+    timer = getattr(page, "_hg_finalize_timer", None)
+    if timer is None:
+        timer = QTimer(page)
+        timer.setSingleShot(True)
+        timer.setInterval(0)
+        timer.timeout.connect(lambda: _finalize_page(page))
+        page._hg_finalize_timer = timer
+    timer.start()
+
+
+def _finalize_page(page: QWidget) -> None:
+    segments = getattr(page, "_hg_pending_segments", None) or []
+    page._hg_pending_segments = None
+    _enforce_equal_segment_heights(segments)
+    page.updateGeometry()
+    page.update()
+
 
 class BlockContainer:
     """Holds one block type (A–D) and renders three segment frames.
@@ -50,6 +365,8 @@ class BlockContainer:
       - Owns exactly three segments: Top, Middle, Bottom (in that order).
     """
 
+    __slots__ = ("_type",)
+
     def __init__(self, block_type: BlockType):
         if block_type is None or not isinstance(block_type, BlockType):
             raise ValueError("BlockContainer requires a valid BlockType")
@@ -70,14 +387,7 @@ class BlockContainer:
         if not isinstance(stacked, QStackedWidget):
             raise TypeError("stacked must be a QStackedWidget")
 
-        # Map BlockType to stacked index
-        type_to_index = {
-            BlockType.A_RightBranch: 0,
-            BlockType.B_TopBranch: 1,
-            BlockType.C_BottomBranch: 2,
-            BlockType.D_Horizontal: 3,
-        }
-        index = type_to_index.get(self._type)
+        index = _TYPE_TO_INDEX.get(self._type)
         if index is None:
             raise KeyError("Unknown BlockType: {}".format(self._type))
 
@@ -87,125 +397,18 @@ class BlockContainer:
         if page is None:
             raise RuntimeError("Stacked page {} not found".format(index))
 
-        # Preferred: discover 3 segments by role (no object-name reliance)
-        # Strategy A: find promoted SegmentView children and map by their role()
-        views = [w for w in page.findChildren(QWidget) if isinstance(w, SegmentView)]
-        role_to_widget = {}
-
-        def _coerce_role(r):
-            """Normalise role values to SegmentRole.
-
-            Some widgets may return role as a string (e.g. 'Top'), while others
-            return the SegmentRole enum. We normalise to SegmentRole so downstream
-            code is stable.
-            """
-            if isinstance(r, SegmentRole):
-                return r
-            if isinstance(r, str):
-                mapping = {
-                    "Top": SegmentRole.Top,
-                    "Middle": SegmentRole.Middle,
-                    "Bottom": SegmentRole.Bottom,
-                }
-                return mapping.get(r)
-            return None
-
-        for v in views:
-            r = _coerce_role(v.role())
-            if r is not None:
-                role_to_widget[r] = v
-
-        # Strategy B: find any QWidget with dynamic property 'segmentRole'
-        if len(role_to_widget) < 3:
-            for w in page.findChildren(QWidget):
-                prop = w.property("segmentRole")
-                if prop in ("Top", "Middle", "Bottom"):
-                    mapping = {
-                        "Top": SegmentRole.Top,
-                        "Middle": SegmentRole.Middle,
-                        "Bottom": SegmentRole.Bottom,
-                    }
-                    role_to_widget[mapping[prop]] = w
-
-        # Fallback C: legacy per-type frame names
-        if len(role_to_widget) < 3:
-            type_prefix = {
-                BlockType.A_RightBranch: "typeA_",
-                BlockType.B_TopBranch: "typeB_",
-                BlockType.C_BottomBranch: "typeC_",
-                BlockType.D_Horizontal: "typeD_",
-            }[self._type]
-            wanted_names = {
-                SegmentRole.Top: type_prefix + "segmentTop",
-                SegmentRole.Middle: type_prefix + "segmentMiddle",
-                SegmentRole.Bottom: type_prefix + "segmentBottom",
-            }
-            for role, objname in wanted_names.items():
-                w = page.findChild(QWidget, objname, Qt.FindChildOption.FindChildrenRecursively)
-                if w is not None:
-                    role_to_widget[role] = w
-                print("[DEBUG] {}: lookup {} -> {}".format(
-                    page.objectName(), objname, "OK" if isinstance(w, QWidget) else "MISSING"
-                ))
-
-        # As a last resort, if a role is still missing, create a SegmentView and add it to the page's top/middle/bottom rows
-        # (requires a QGridLayout with rows 0,1,2). If not present, we skip creation to avoid guessing.
-        if len(role_to_widget) < 3:
-            grid = page.layout()
-            if isinstance(grid, QVBoxLayout):
-                pass  # not attempting to inject into unfamiliar layouts
-            else:
-                try:
-                    # best-effort: rows 0..2, col 0
-                    for role, row in ((SegmentRole.Top, 0), (SegmentRole.Middle, 1), (SegmentRole.Bottom, 2)):
-                        if role not in role_to_widget:
-                            sv = SegmentView(page, role)
-                            layout = sv.layout()
-                            if layout is None:
-                                layout = QVBoxLayout(sv)
-                            layout.setContentsMargins(4, 4, 4, 4)
-                            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                            role_to_widget[role] = sv
-                except Exception:
-                    pass
+        role_to_widget = _resolve_segment_widgets(page, self._type)
 
-        try:
-            jw = stacked.parentWidget().size().width() if stacked.parentWidget() else 0
-            jh = stacked.parentWidget().size().height() if stacked.parentWidget() else 0
-            print(f"[DEBUG] after-attach sizes -> page={page.size().width()}x{page.size().height()} jamo={jw}x{jh}")
-        except Exception:
-            pass
-
-        # --- Orthographic presenters using ConsonantView / VowelView ---
-        def _ensure_cleared_layout(w: QWidget) -> QVBoxLayout:
-            layout = w.layout()
-            if layout is None:
-                layout = QVBoxLayout(w)
-            # clear
-            while layout.count():
-                item = layout.takeAt(0)
-                ww = item.widget()
-                if ww is not None:
-                    ww.setParent(None)
-            layout.setContentsMargins(4, 4, 4, 4)
-            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            return layout  # type: ignore
-
-        def _add_row(parent_w: QWidget, widgets: List[QWidget]) -> None:
-            row_holder = QWidget(parent_w)
-            row = QHBoxLayout(row_holder)
-            row.setContentsMargins(0, 0, 0, 0)
-            row.setSpacing(25)  # increase spacing between consonant and vowel to 25px
-            # row.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            for wdg in widgets:
-                # Give each column equal stretch so it fills available width
-                row.addWidget(wdg, 1)
-            parent_layout = parent_w.layout()
-            if parent_layout is None:
-                parent_layout = QVBoxLayout(parent_w)
-                parent_layout.setContentsMargins(4, 4, 4, 4)
-                parent_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            parent_layout.addWidget(row_holder)
+        if _DEBUG_BLOCK_CONTAINER:
+            try:
+                jw = stacked.parentWidget().size().width() if stacked.parentWidget() else 0
+                jh = stacked.parentWidget().size().height() if stacked.parentWidget() else 0
+                logger.debug(
+                    "after-attach sizes -> page=%dx%d jamo=%dx%d",
+                    page.size().width(), page.size().height(), jw, jh,
+                )
+            except Exception:
+                pass
 
         # Default demo glyphs (can be replaced later by real content)
         # Pick a concrete CV from syllables.yaml for this block type (prefer ㄱ if present)
@@ -213,27 +416,16 @@ class BlockContainer:
             cons_char, vowel_char = consonant, vowel
             _glyph = glyph or (compose_cv(consonant, vowel) or "")
         else:
-            cons_char, vowel_char, _glyph = select_syllable_for_block(self._type, prefer_consonant=u"ㄱ")
+            cons_char, vowel_char, _glyph = select_cv_for_block(self._type, prefer_consonant=u"ㄱ")
 
         # Resolve target widgets for roles
-        top_w = role_to_widget.get(SegmentRole.Top)
-        mid_w = role_to_widget.get(SegmentRole.Middle)
-        bot_w = role_to_widget.get(SegmentRole.Bottom)
+        top_w, mid_w, bot_w = map(role_to_widget.get, _ROLES)
 
         # --- Deep segment debug ---
-        def _dbg_seg(w: Optional[QWidget], name: str):
-            try:
-                layout = w.layout() if w is not None else None
-                cnt = layout.count() if layout is not None else -1
-                sz = w.size() if w is not None else QSize(0, 0)
-                print(f"[DEBUG] seg {name}: exists={w is not None} size={sz.width()}x{sz.height()} "
-                      f"layout={type(layout).__name__ if layout else None} items={cnt}")
-            except Exception as e:
-                print(f"[DEBUG] seg {name}: error={e}")
-
-        _dbg_seg(top_w, "Top")
-        _dbg_seg(mid_w, "Middle")
-        _dbg_seg(bot_w, "Bottom")
+        if _DEBUG_BLOCK_CONTAINER:
+            _dbg_seg(top_w, "Top")
+            _dbg_seg(mid_w, "Middle")
+            _dbg_seg(bot_w, "Bottom")
 
         # Hard fail if any segment is missing so the error is explicit
         if top_w is None or mid_w is None or bot_w is None:
@@ -245,227 +437,84 @@ class BlockContainer:
                 )
             )
 
-        # Clear and place presenters per type
-        if top_w is not None:
-            _deep_clear_container(top_w)
-        if mid_w is not None:
-            _deep_clear_container(mid_w)
-        if bot_w is not None:
-            _deep_clear_container(bot_w)
-
-        def _segment_layout(w: Optional[QWidget], title: str | None, tooltip: Optional[str] = None) -> Optional[QVBoxLayout]:
-            if w is None:
-                return None
-            layout = w.layout()
-            if layout is None:
-                layout = QVBoxLayout(w)
-            layout.setContentsMargins(4, 4, 4, 4)
-            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            if title:
-                t = _mk_title_label(title)
-                if tooltip:
-                    try:
-                        t.setToolTip(tooltip)
-                    except Exception:
-                        pass
-                layout.addWidget(t)
-            return layout  # type: ignore[return-value]
-
-        # TYPE A
-        if self._type == BlockType.A_RightBranch:
-            # Top: L+V side by side
-            if top_w is not None:
-                _segment_layout(top_w, None)
-                cons = ConsonantView(top_w, cons_char, ConsonantPosition.Initial)
-                cons.setToolTip("Leading")
-                vow = VowelView(top_w, vowel_char)
-                vow.setToolTip("Vowel")
-                _add_row(top_w, [cons, vow])
-            # Middle: empty (by design)
-            # Bottom: empty (no T)
-            if bot_w is not None:
-                _segment_layout(bot_w, SEG_TITLES["T"], SEG_TIPS["T"])
-
-        # TYPE B
-        elif self._type == BlockType.B_TopBranch:
-            # Top: V; Middle: L; Bottom: T
-            if top_w is not None:
-                _segment_layout(top_w, None)
-                v_top = VowelView(top_w, vowel_char)
-                v_top.setToolTip("Vowel")
-                top_layout = top_w.layout()
-                if top_layout is None:
-                    top_layout = QVBoxLayout(top_w)
-                top_layout.addWidget(v_top)
-
-            if mid_w is not None:
-                _segment_layout(mid_w, None)
-                c_mid = ConsonantView(mid_w, cons_char, ConsonantPosition.Initial)
-                c_mid.setToolTip("Leading")
-                mid_layout = mid_w.layout()
-                if mid_layout is None:
-                    mid_layout = QVBoxLayout(mid_w)
-                mid_layout.addWidget(c_mid)
-
-            # Bottom: T subtitle only (no glyph)
-            if bot_w is not None:
-                _segment_layout(bot_w, SEG_TITLES["T"], SEG_TIPS["T"])
-
-        elif self._type == BlockType.C_BottomBranch:
-            # Top: L; Middle: V; Bottom: T
-            if top_w is not None:
-                _segment_layout(top_w, None)
-                c_top = ConsonantView(top_w, cons_char, ConsonantPosition.Initial)
-                c_top.setToolTip("Leading")
-                top_layout = top_w.layout()
-                if top_layout is None:
-                    top_layout = QVBoxLayout(top_w)
-                top_layout.addWidget(c_top)
-            if mid_w is not None:
-                _segment_layout(mid_w, None)
-                v_mid = VowelView(mid_w, vowel_char)
-                v_mid.setToolTip("Vowel")
-                mid_layout = mid_w.layout()
-                if mid_layout is None:
-                    mid_layout = QVBoxLayout(mid_w)
-                mid_layout.addWidget(v_mid)
-            # Bottom: T subtitle only (no glyph)
-            if bot_w is not None:
-                _segment_layout(bot_w, SEG_TITLES["T"], SEG_TIPS["T"])
-
-        elif self._type == BlockType.D_Horizontal:
-            # Top: L; Middle: V; Bottom: T
-            if top_w is not None:
-                _segment_layout(top_w, None)
-                c_top = ConsonantView(top_w, cons_char, ConsonantPosition.Initial)
-                c_top.setToolTip("Leading")
-                top_layout = top_w.layout()
-                if top_layout is None:
-                    top_layout = QVBoxLayout(top_w)
-                top_layout.addWidget(c_top)
-            if mid_w is not None:
-                _segment_layout(mid_w, None)
-                v_mid = VowelView(mid_w, vowel_char)
-                v_mid.setToolTip("Vowel")
-                mid_layout = mid_w.layout()
-                if mid_layout is None:
-                    mid_layout = QVBoxLayout(mid_w)
-                mid_layout.addWidget(v_mid)
-            # Bottom: T subtitle only (no glyph)
-            if bot_w is not None:
-                _segment_layout(bot_w, SEG_TITLES["T"], SEG_TIPS["T"])
-
-        def _ensure_placeholder_if_empty(w: Optional[QWidget]) -> None:
-            if w is None:
+        def _populate_segment(w: QWidget, items: tuple[str, ...]) -> None:
+            if not items:
                 return
-            layout = w.layout()
-            if layout is None or layout.count() == 0:
-                ph = _ensure_empty_placeholder(w)
-                try:
-                    ph.setText("")
-                    ph.setVisible(False)
-                except Exception:
-                    pass
-
-        _ensure_placeholder_if_empty(top_w)
-        _ensure_placeholder_if_empty(mid_w)
-        _ensure_placeholder_if_empty(bot_w)
-        _enforce_equal_segment_heights([w for w in (top_w, mid_w, bot_w) if w is not None])
-        page.updateGeometry()
-        page.update()
+            w._hg_dirty = True
+            if "T" in items:
+                layout = _segment_layout(w, *_T_TITLE)
+            else:
+                layout = _segment_layout(w, None)
+            glyphs: List[QWidget] = []
+            for item in items:
+                if item == "L":
+                    cons = _take_consonant_view(page, w, cons_char)
+                    glyphs.append(cons)
+                elif item == "V":
+                    vow = _take_vowel_view(page, w, vowel_char)
+                    glyphs.append(vow)
+            if len(glyphs) > 1:
+                _add_row(w, glyphs)
+            elif glyphs:
+                layout.addWidget(glyphs[0])
+
+        # Repaints are held off while the segments are torn down and refilled;
+        # re-enabling schedules a single one (the finalize pass adds layout).
+        suspend = page.updatesEnabled()
+        if suspend:
+            page.setUpdatesEnabled(False)
+        try:
+            # Clear and place presenters per type; existing glyph presenters are
+            # pooled on the page first so they can be reused below.
+            _reset_segments(page, (top_w, mid_w, bot_w))
+
+            for role, items in _BLOCK_LAYOUT[self._type].items():
+                _populate_segment(role_to_widget[role], items)
+
+            _ensure_placeholder_if_empty(top_w)
+            _ensure_placeholder_if_empty(mid_w)
+            _ensure_placeholder_if_empty(bot_w)
+        finally:
+            if suspend:
+                page.setUpdatesEnabled(True)
+        _schedule_finalize(page, [w for w in (top_w, mid_w, bot_w) if w is not None])
 
     def consonant_only(self, stacked: QStackedWidget, consonant: str) -> None:
         # Force Type A layout for a simple, stable presentation
-        index = 0  # A_RightBranch is page 0 by design
+        index = _TYPE_TO_INDEX[BlockType.A_RightBranch]
         stacked.setCurrentIndex(index)
         page = stacked.widget(index)
         if page is None:
             raise RuntimeError("Stacked page 0 not found")
-        # Discover segments (same fallbacks as attach):
-        role_to_widget = {}
-        # A) promoted SegmentView children with explicit role()
-        views = [w for w in page.findChildren(QWidget) if isinstance(w, SegmentView)]
-        for v in views:
-            r = v.role()
-            if isinstance(r, SegmentRole):
-                role_to_widget[r] = v
-            elif isinstance(r, str):
-                mapping = {"Top": SegmentRole.Top, "Middle": SegmentRole.Middle, "Bottom": SegmentRole.Bottom}
-                rr = mapping.get(r)
-                if rr is not None:
-                    role_to_widget[rr] = v
-        # B) dynamic property "segmentRole"
-        if len(role_to_widget) < 3:
-            for w in page.findChildren(QWidget):
-                prop = w.property("segmentRole")
-                if prop in ("Top", "Middle", "Bottom"):
-                    mapping = {"Top": SegmentRole.Top, "Middle": SegmentRole.Middle, "Bottom": SegmentRole.Bottom}
-                    role_to_widget[mapping[prop]] = w
-        # C) legacy per-type frame names
-        if len(role_to_widget) < 3:
-            type_prefix = "typeA_"  # consonant-only uses the Type A page
-            wanted_names = {
-                SegmentRole.Top: type_prefix + "segmentTop",
-                SegmentRole.Middle: type_prefix + "segmentMiddle",
-                SegmentRole.Bottom: type_prefix + "segmentBottom",
-            }
-            for role, objname in wanted_names.items():
-                w = page.findChild(QWidget, objname, Qt.FindChildOption.FindChildrenRecursively)
-                if w is not None:
-                    role_to_widget[role] = w
-        top_w = role_to_widget.get(SegmentRole.Top)
-        mid_w = role_to_widget.get(SegmentRole.Middle)
-        bot_w = role_to_widget.get(SegmentRole.Bottom)
-        # Clear any existing layouts/widgets
-        _deep_clear_container(top_w)
-        _deep_clear_container(mid_w)  # ensure any prior vowel is gone
-        _deep_clear_container(bot_w)
-
-        def _segment_layout(w: Optional[QWidget], title: str | None, tooltip: Optional[str] = None) -> Optional[QVBoxLayout]:
-            if w is None:
-                return None
-            layout = w.layout()
-            if layout is None:
-                layout = QVBoxLayout(w)
-            layout.setContentsMargins(4, 4, 4, 4)
-            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            if title:
-                t = _mk_title_label(title)
-                if tooltip:
-                    try:
-                        t.setToolTip(tooltip)
-                    except Exception:
-                        pass
-                layout.addWidget(t)
-            return layout  # type: ignore[return-value]
-
-        # Add title + consonant glyph in top
-        top_lay = _segment_layout(top_w, None)
-        if top_lay is not None:
-            cons = ConsonantView(top_w, consonant, ConsonantPosition.Initial)
-            cons.setToolTip("Leading")  # Leading consonant
-            top_lay.addWidget(cons, 1)
-
-        # Middle: V title only (no glyph)
-        _segment_layout(mid_w, None)
-
-        # Bottom: T title only (no glyph)
-        _segment_layout(bot_w, SEG_TITLES["T"], SEG_TIPS["T"])
-        def _ensure_placeholder_if_empty(w: Optional[QWidget]) -> None:
-            if w is None:
-                return
-            layout = w.layout()
-            if layout is None or layout.count() == 0:
-                ph = _ensure_empty_placeholder(w)
-                try:
-                    ph.setText("")
-                    ph.setVisible(False)
-                except Exception:
-                    pass
-
-        _ensure_placeholder_if_empty(top_w)
-        _ensure_placeholder_if_empty(mid_w)
-        _ensure_placeholder_if_empty(bot_w)
-        _enforce_equal_segment_heights([w for w in (top_w, mid_w, bot_w) if w is not None])
-        page.updateGeometry()
-        page.update()
+        # Discover segments (same strategies and cache as attach)
+        role_to_widget = _resolve_segment_widgets(page, BlockType.A_RightBranch)
+        top_w, mid_w, bot_w = map(role_to_widget.get, _ROLES)
+        suspend = page.updatesEnabled()
+        if suspend:
+            page.setUpdatesEnabled(False)
+        try:
+            # Clear any existing layouts/widgets (glyph presenters go to the pool)
+            _reset_segments(page, (top_w, mid_w, bot_w))  # also drops any prior vowel
+
+            # Add title + consonant glyph in top
+            top_lay = _segment_layout(top_w, None)
+            if top_lay is not None:
+                top_w._hg_dirty = True
+                cons = _take_consonant_view(page, top_w, consonant)
+                top_lay.addWidget(cons, 1)
+
+            # Middle: V title only (no glyph)
+            _segment_layout(mid_w, None)
+
+            # Bottom: T title only (no glyph)
+            if bot_w is not None:
+                bot_w._hg_dirty = True
+            _segment_layout(bot_w, *_T_TITLE)
+
+            _ensure_placeholder_if_empty(top_w)
+            _ensure_placeholder_if_empty(mid_w)
+            _ensure_placeholder_if_empty(bot_w)
+        finally:
+            if suspend:
+                page.setUpdatesEnabled(True)
+        _schedule_finalize(page, [w for w in (top_w, mid_w, bot_w) if w is not None])
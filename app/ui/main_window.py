@@ -20,20 +20,18 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
 
-import os
 import sys
-import inspect
 from PyQt6 import uic
 from PyQt6.QtWidgets import (
     QApplication,
+    QMainWindow,
     QWidget,
-    QLabel,
 )
 
 from app.controllers.main_window_controller import MainWindowController
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MainWindowHandles:
     """Optional handles that tests may need.
 
@@ -48,6 +46,41 @@ class MainWindowHandles:
     prev_button: Optional[Any] = None
 
 
+# Shared instance for windows that expose no handles; frozen, so safe to share.
+_EMPTY_HANDLES = MainWindowHandles()
+
+
+# Explicit main window UI contract: form.ui is the main window. Resolved once;
+# its existence is only checked when the runtime uic fallback needs it.
+_UI_PATH = Path(__file__).resolve().parents[2] / "ui" / "form.ui"
+
+# (form_class, base_class) pairs from uic.loadUiType, keyed by .ui path, so
+# each Designer file is parsed once per process rather than once per window.
+_UI_CACHE: dict[Path, tuple[type, type]] = {}
+
+
+def _load_ui_type(ui_path: Path) -> tuple[type, type]:
+    cached = _UI_CACHE.get(ui_path)
+    if cached is None:
+        if not ui_path.exists():
+            raise FileNotFoundError(f"Main window UI not found at expected path: {ui_path}")
+        cached = _UI_CACHE[ui_path] = uic.loadUiType(str(ui_path))
+    return cached
+
+
+def _main_form_classes(ui_path: Path) -> tuple[type, type]:
+    """Return (form_class, base_class) for the main window.
+
+    Prefers the pyuic6-generated module (see scripts/compile_ui.sh) so startup
+    skips XML parsing entirely; falls back to runtime uic when it is absent.
+    """
+    try:
+        from app.ui.generated.ui_form import Ui_MainWindow
+    except ImportError:
+        return _load_ui_type(ui_path)
+    return Ui_MainWindow, QMainWindow
+
+
 def create_main_window(*, expose_handles: bool = True, settings_path: str | None = None):
     """Create and return the application's main window.
 
@@ -62,46 +95,43 @@ def create_main_window(*, expose_handles: bool = True, settings_path: str | None
         QWidget: the loaded and wired main window.
     """
 
-    # Explicit main window UI contract: form.ui is the main window.
-    here = Path(__file__).resolve()
-    project_root = here.parents[2]
-    ui_path = project_root / "ui" / "form.ui"
-
-    if not ui_path.exists():
-        raise FileNotFoundError(f"Main window UI not found at expected path: {ui_path}")
-
+    ui_path = _UI_PATH
+    form_class, base_class = _main_form_classes(ui_path)
     try:
-        window: QWidget = uic.loadUi(str(ui_path))
+        window: QWidget = base_class()
+        form = form_class()
+        form.setupUi(window)
     except Exception as e:
         raise RuntimeError(f"Failed to load main window UI from {ui_path}: {e}")
+    window._ui = form
 
     controller = MainWindowController(
         window,
         settings_path=settings_path,
     )
-    setattr(window, "_controller", controller)
+    window._controller = controller
 
     # Best-effort: attach commonly-used handles for tests if present.
-    handles: MainWindowHandles | None = None
     # NOTE:
     # main_window.py does not discover buttons.
-    # It only forwards handles explicitly exposed by the controller.
-    try:
+    # It only forwards handles explicitly exposed by the controller, plus
+    # Designer-named widgets read straight off the Ui form (no tree walk).
+    pronounce_chip = getattr(form, "pronounce_chip", None)
+    next_button = controller.next_button
+    prev_button = controller.prev_button
+    if pronounce_chip is None and next_button is None and prev_button is None:
+        handles = _EMPTY_HANDLES
+    else:
         handles = MainWindowHandles(
-            pronounce_chip=getattr(window, "pronounce_chip", None) or window.findChild(QWidget, "pronounce_chip"),
-            next_button=getattr(controller, "next_button", None),
-            prev_button=getattr(controller, "prev_button", None),
+            pronounce_chip=pronounce_chip,
+            next_button=next_button,
+            prev_button=prev_button,
         )
-    except Exception:
-        handles = None
 
     # Standardise on attaching handles to the window instance so tests can
     # access them even if they only receive the window.
-    if expose_handles and handles is not None:
-        try:
-            setattr(window, "_handles", handles)
-        except Exception:
-            pass
+    if expose_handles:
+        window._handles = handles
 
     return window
 
@@ -120,26 +150,11 @@ def create_main_window_for_tests(settings_path: str | None = None):
     if app is None:
         app = QApplication(sys.argv)
 
-    # If the UI layer supports dependency injection for settings, prefer it.
-    # Otherwise, fall back to a best-effort environment variable hint.
-    kwargs: dict = {"expose_handles": True}
+    # create_main_window takes settings_path directly; nothing reads a settings
+    # path from the environment, so no env hints are needed.
+    call_kwargs: dict = {"expose_handles": True}
     if settings_path:
-        kwargs["settings_path"] = settings_path
-        kwargs["settings_file"] = settings_path
-        kwargs["settings_yaml"] = settings_path
-        try:
-            os.environ["HANGUL_SETTINGS_PATH"] = settings_path
-            os.environ["SETTINGS_PATH"] = settings_path
-            os.environ["SETTINGS_FILE"] = settings_path
-        except Exception:
-            pass
-
-    try:
-        sig = inspect.signature(create_main_window)
-        accepted = set(sig.parameters.keys())
-        call_kwargs = {k: v for k, v in kwargs.items() if k in accepted}
-    except Exception:
-        call_kwargs = {"expose_handles": True}
+        call_kwargs["settings_path"] = settings_path
 
     result = create_main_window(**call_kwargs)
     if isinstance(result, tuple) and len(result) == 2:
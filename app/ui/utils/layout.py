@@ -4,6 +4,7 @@ Functions in this module should not depend on application state.
 
 from __future__ import annotations
 
+import re
 from typing import Optional
 
 from PyQt6.QtCore import Qt
@@ -18,9 +19,28 @@ from PyQt6.QtWidgets import (
 from app.ui.widgets.segments import Characters
 
 
+_SEGMENT_ROLES = frozenset(("Top", "Middle", "Bottom"))
+# Common objectName patterns used in legacy UI files.
+_SEGMENT_SUFFIXES = ("segmentTop", "segmentMiddle", "segmentBottom")
+# Title/glyph separators accepted by _extract_title_and_glyph.
+_TITLE_SEP_RE = re.compile(r"[:\u2014\-|]")
+
+
 def _deep_clear_container(container: QWidget | QLayout) -> None:
-    """Remove all child widgets and layouts from a container."""
+    """Remove all child widgets and layouts from a container.
+
+    Widgets flagged with `_hg_dirty = False` have been cleared already and not
+    repopulated since, so they are skipped. Code that adds presenters to a
+    segment widget must set `_hg_dirty = True` on it.
+
+    No repaint is requested here; callers repopulate and then schedule one
+    deferred update for the whole page (see BlockContainer's finalize pass).
+    """
+    placeholder = None
     if isinstance(container, QWidget):
+        if not getattr(container, "_hg_dirty", True):
+            return
+        placeholder = getattr(container, "_hg_placeholder", None)
         layout = container.layout()
         if layout is None:
             # Placeholder frames/widgets may not have a layout set in Qt Designer.
@@ -31,35 +51,64 @@ def _deep_clear_container(container: QWidget | QLayout) -> None:
     else:
         layout = container
 
-    while layout.count():
-        item = layout.takeAt(0)
-        if item is None:
-            continue
-        widget = item.widget()
-        if widget is not None:
-            widget.deleteLater()
-        else:
-            child_layout = item.layout()
-            if child_layout is not None:
-                _deep_clear_container(child_layout)
+    # Nested layouts are drained from an explicit stack rather than by recursion.
+    # Removed widgets are moved under one throwaway parent, so a single
+    # deleteLater() destroys every subtree in one C++ pass.
+    scratch: Optional[QWidget] = None
+    stack = [layout]
+    while stack:
+        layout = stack.pop()
+        # Drain from the end: takeAt(0) shifts every remaining item each time.
+        for i in range(layout.count() - 1, -1, -1):
+            item = layout.takeAt(i)
+            if item is None:
+                continue
+            widget = item.widget()
+            if widget is not None:
+                if widget is placeholder:
+                    # Kept (hidden, still parented) for _ensure_empty_placeholder to reuse.
+                    widget.hide()
+                else:
+                    if scratch is None:
+                        scratch = QWidget()
+                    widget.setParent(scratch)
+            else:
+                child_layout = item.layout()
+                if child_layout is not None:
+                    stack.append(child_layout)
+
+    if scratch is not None:
+        scratch.deleteLater()
 
     if isinstance(container, QWidget):
-        container.update()
+        container._hg_dirty = False
 
 
 def _ensure_empty_placeholder(container: QWidget | QLayout) -> QLabel:
-    """Ensure the container has a single placeholder QLabel, clearing others."""
+    """Ensure the container has a single placeholder QLabel, clearing others.
+
+    For widget containers the label is created once and kept as
+    `_hg_placeholder`; later calls re-add and re-show the same label instead of
+    building a new one each time the container goes empty.
+    """
     _deep_clear_container(container)
 
-    label = QLabel("(empty)")
-    label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-    label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+    label = getattr(container, "_hg_placeholder", None) if isinstance(container, QWidget) else None
+    if label is None or label.parentWidget() is not container:
+        label = QLabel("(empty)")
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+    else:
+        label.setText("(empty)")
+        label.show()
 
     if isinstance(container, QWidget):
         layout = container.layout()
         if layout is None:
             layout = QVBoxLayout(container)
         layout.addWidget(label)
+        container._hg_placeholder = label
+        container._hg_dirty = True
     else:
         container.addWidget(label)
 
@@ -83,25 +132,12 @@ def _enforce_equal_segment_heights(segments: QWidget | list[QWidget]) -> None:
     if isinstance(segments, QWidget):
         page = segments
 
-        # Preferred: dynamic property marker.
-        for w in page.findChildren(QWidget):
-            try:
-                prop = w.property("segmentRole")
-            except Exception:
-                prop = None
-            if prop in ("Top", "Middle", "Bottom"):
-                segs.append(w)
-
-        # Fallback: common objectName patterns used in legacy UI files.
+        # One tree walk serves both the preferred dynamic-property marker and
+        # the legacy objectName fallback.
+        children = page.findChildren(QWidget)
+        segs = [w for w in children if w.property("segmentRole") in _SEGMENT_ROLES]
         if not segs:
-            wanted_suffixes = ("segmentTop", "segmentMiddle", "segmentBottom")
-            for w in page.findChildren(QWidget):
-                try:
-                    name = w.objectName() or ""
-                except Exception:
-                    name = ""
-                if any(name.endswith(suf) for suf in wanted_suffixes):
-                    segs.append(w)
+            segs = [w for w in children if w.objectName().endswith(_SEGMENT_SUFFIXES)]
     else:
         segs = list(segments)
 
@@ -109,18 +145,21 @@ def _enforce_equal_segment_heights(segments: QWidget | list[QWidget]) -> None:
     if len(segs) < 2:
         return
 
-    max_height = 0
-    for segment in segs:
-        segment.adjustSize()
-        height = segment.sizeHint().height()
-        if height > max_height:
-            max_height = height
-
-    if max_height <= 0:
-        return
-
-    for segment in segs:
-        segment.setMinimumHeight(max_height)
+    # sizeHint() alone is enough to size the segments; adjustSize() would run a
+    # layout pass per segment. Updates on the shared parent are suspended so
+    # the min-height changes land in a single repaint.
+    parent = segs[0].parentWidget()
+    suspend = parent is not None and parent.updatesEnabled()
+    if suspend:
+        parent.setUpdatesEnabled(False)
+    try:
+        max_height = max((s.sizeHint().height() for s in segs), default=0)
+        if max_height > 0:
+            for segment in segs:
+                segment.setMinimumHeight(max_height)
+    finally:
+        if suspend:
+            parent.setUpdatesEnabled(True)
 
 
 def _extract_title_and_glyph(text: str) -> tuple[str, str]:
@@ -146,11 +185,10 @@ def _extract_title_and_glyph(text: str) -> tuple[str, str]:
             return parts[0], parts[1]
         return parts[0], ""
 
-    # Common separators.
-    for sep in (":", "—", "-", "|"):
-        if sep in s:
-            left, right = s.split(sep, 1)
-            return left.strip(), right.strip()
+    # Common separators: split at the first one found, in a single scan.
+    m = _TITLE_SEP_RE.search(s)
+    if m is not None:
+        return s[:m.start()].strip(), s[m.end():].strip()
 
     # Fallback: if the string ends with a single non-space glyph-like token,
     # treat the last token as glyph.
@@ -165,7 +203,5 @@ def has_glyph_content(seg_w: Optional[QWidget]) -> bool:
     """Return True if the segment contains any real glyph presenter widgets."""
     if seg_w is None:
         return False
-    for w in seg_w.findChildren(QWidget):
-        if isinstance(w, Characters):
-            return True
-    return False
+    # findChild stops at the first match instead of materialising every descendant.
+    return seg_w.findChild(Characters) is not None
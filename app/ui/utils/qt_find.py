@@ -2,14 +2,26 @@ from __future__ import annotations
 
 from typing import TypeVar, cast
 
+from PyQt6.QtCore import QObject
 from PyQt6.QtWidgets import QWidget
 
-T = TypeVar("T", bound=QWidget)
+T = TypeVar("T", bound=QObject)
+
+
+def _from_ui(parent: QObject, cls: type[T], object_name: str) -> T | None:
+    # Windows built by create_main_window carry their Ui form as `_ui`; it
+    # already holds every Designer-named object as an attribute, so a named
+    # lookup is a getattr rather than a walk of the whole QObject tree.
+    form = getattr(parent, "_ui", None)
+    if form is None:
+        return None
+    obj = getattr(form, object_name, None)
+    return obj if isinstance(obj, cls) else None
 
 
 def require_child(parent: QWidget, cls: type[T], object_name: str) -> T:
     """Find a named Qt child and raise a clear error if missing."""
-    widget = parent.findChild(cls, object_name)
+    widget = _from_ui(parent, cls, object_name) or parent.findChild(cls, object_name)
     if widget is None:
         raise RuntimeError(f"{object_name} not found (expected {cls.__name__})")
     return widget
@@ -17,6 +29,9 @@ def require_child(parent: QWidget, cls: type[T], object_name: str) -> T:
 
 def find_child(parent: QWidget, cls: type[T], object_name: str) -> T | None:
     """Typed wrapper around Qt's findChild() to keep IDE type inference precise."""
+    widget = _from_ui(parent, cls, object_name)
+    if widget is not None:
+        return widget
     return cast(T | None, parent.findChild(cls, object_name))
 
 
@@ -1,13 +1,88 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Any, cast
 
-from PyQt6 import uic
+from PyQt6 import sip, uic
 from PyQt6.QtCore import Qt, QTimer, QSize
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QStackedWidget, QFrame, QLabel, QSizePolicy
 
 from app.ui.fit_text import _fit_label_font_to_label_rect
 
+_DEBUG_JAMO_BLOCK = False
+
+# objectName suffix (after the last "_", e.g. typeA_segmentTop) -> segmentRole.
+_SUFFIX_ROLE = {"segmentTop": "Top", "segmentMiddle": "Middle", "segmentBottom": "Bottom"}
+
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+_DIRECT_ONLY = Qt.FindChildOption.FindDirectChildrenOnly
+
+# Page attribute holding the segment frame for each role (set by _wire_segments).
+_ROLE_ATTR = {"Top": "_hg_top_frame", "Middle": "_hg_mid_frame", "Bottom": "_hg_bot_frame"}
+_UNINDEXED = object()
+
+_JAMO_UI_PATH = Path(__file__).resolve().parents[3] / "ui" / "jamo.ui"
+
+
+@lru_cache(maxsize=1)
+def _jamo_ui_cls() -> type:
+    """Return the jamo.ui form class; each JamoBlock just runs setupUi.
+
+    Prefers the pyuic6-generated module (see scripts/compile_ui.sh); falls back
+    to compiling jamo.ui with runtime uic, once per process, when it is absent.
+    """
+    try:
+        from app.ui.generated.jamo_ui import Ui_JamoBlock
+    except ImportError:
+        return uic.loadUiType(str(_JAMO_UI_PATH))[0]
+    return Ui_JamoBlock
+
+
+def _make_center_vbox(parent: QWidget) -> QVBoxLayout:
+    """Install and return a zero-margin, center-aligned QVBoxLayout on `parent`."""
+    layout = QVBoxLayout(parent)
+    layout.setContentsMargins(0, 0, 0, 0)
+    layout.setAlignment(_ALIGN_CENTER)
+    return layout
+
+
+def _direct_frames(w: QWidget) -> list[QFrame]:
+    """QFrame children of `w`, plus those one level down inside non-frame containers.
+
+    Segment frames are direct children of their template page, so walking
+    children() avoids a recursive findChildren() over the whole page.
+    """
+    frames: list[QFrame] = []
+    for c in w.children():
+        if isinstance(c, QFrame):
+            frames.append(c)
+        elif isinstance(c, QWidget):
+            frames.extend(g for g in c.children() if isinstance(g, QFrame))
+    return frames
+
+
+def _index_page_frames(page: QWidget, frames: Optional[list[QFrame]] = None) -> dict[str, QFrame]:
+    """Tag and record the page's segment frames; return them by role.
+
+    Frames named `*_segmentTop` etc. get their `segmentRole` property (and its
+    `_hg_segment_role` mirror) set here, in the same pass that stores them as
+    _ROLE_ATTR attributes on the page.
+    """
+    found: dict[str, QFrame] = {}
+    for frame in _direct_frames(page) if frames is None else frames:
+        _, sep, tail = frame.objectName().rpartition("_")
+        role = _SUFFIX_ROLE.get(tail) if sep else None
+        if role is not None:
+            frame.setProperty("segmentRole", role)
+            frame._hg_segment_role = role
+        else:
+            role = getattr(frame, "_hg_segment_role", None)
+        if role in _ROLE_ATTR and role not in found:
+            found[role] = frame
+    for role, attr in _ROLE_ATTR.items():
+        setattr(page, attr, found.get(role))
+    return found
+
 
 class JamoBlock(QWidget):
     """A container widget that enforces a 1:1 aspect ratio for the Hangul block.
@@ -22,72 +97,67 @@ class JamoBlock(QWidget):
 
         self._test_mode = str(os.getenv("HANGUL_TEST_MODE", "")).strip().lower() in ("1", "true", "yes", "on")
         self._debug_demo = str(os.getenv("HANGUL_DEBUG_DEMO", "")).strip().lower() in ("1", "true", "yes", "on")
+        # Trace output (segment wiring dump, render_demo progress); off by default.
+        self._debug = _DEBUG_JAMO_BLOCK or str(os.getenv("HANGUL_UI_DEBUG", "")).strip().lower() in (
+            "1", "true", "yes", "on"
+        )
 
         # Outer layout used to center the inner square block
-        self._inner_layout = QVBoxLayout(self)
-        self._inner_layout.setContentsMargins(0, 0, 0, 0)
-        self._inner_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._inner_layout = _make_center_vbox(self)
+        # Last (width, height, left, top) applied by resizeEvent.
+        self._last_square_geom: Optional[tuple[int, int, int, int]] = None
 
         # Load the visual structure of the Jamo block
-        here = Path(__file__).resolve()
-        project_root = here.parents[3]
-        jamo_ui_path = project_root / "ui" / "jamo.ui"
-
         block = QWidget(self)
-        uic.loadUi(jamo_ui_path, block)
+        self._ui = _jamo_ui_cls()()
+        self._ui.setupUi(block)
 
         # Keep references for debugging / discovery.
         self._ui_root = block
-        self._stacked = self.findChild(QStackedWidget, "stackedTemplates")
+        # The form class exposes named widgets as attributes; no tree walk needed.
+        self._stacked = getattr(self._ui, "stackedTemplates", None)
+        if self._stacked is None:
+            self._stacked = self.findChild(QStackedWidget, "stackedTemplates")
         if self._stacked is None:
             raise RuntimeError("stackedTemplates not found in JamoBlock UI")
 
-        for frame in block.findChildren(QFrame):
-            name = frame.objectName() or ""
-            if name.endswith("_segmentTop"):
-                frame.setProperty("segmentRole", "Top")
-            elif name.endswith("_segmentMiddle"):
-                frame.setProperty("segmentRole", "Middle")
-            elif name.endswith("_segmentBottom"):
-                frame.setProperty("segmentRole", "Bottom")
         self._inner_layout.addWidget(block)
 
-        # Wire up segment discovery / rendering hooks
+        # Wire up segment discovery / rendering hooks. Segment frames are
+        # indexed once here, as _ROLE_ATTR attributes on each page.
         self._wire_segments(block)
 
         # --------------------------------------------------
         # DEBUG: verify segment frames and their layouts
         # --------------------------------------------------
-        try:
-            print("[DEBUG] --- segmentRole frames after wiring ---")
-            for f in block.findChildren(QFrame):
-                r = f.property("segmentRole")
-                if r in ("Top", "Middle", "Bottom"):
-                    lay = f.layout()
-                    print(
-                        "[DEBUG] frame objName={} role={} layout_is_none={} layout_type={}".format(
-                            f.objectName(),
-                            r,
-                            (lay is None),
-                            (type(lay).__name__ if lay is not None else "None"),
+        if self._debug:
+            try:
+                print("[DEBUG] --- segmentRole frames after wiring ---")
+                for f in block.findChildren(QFrame):
+                    r = f.property("segmentRole")
+                    if r in ("Top", "Middle", "Bottom"):
+                        lay = f.layout()
+                        print(
+                            "[DEBUG] frame objName={} role={} layout_is_none={} layout_type={}".format(
+                                f.objectName(),
+                                r,
+                                (lay is None),
+                                (type(lay).__name__ if lay is not None else "None"),
+                            )
                         )
-                    )
-        except Exception as _e:
-            print("[DEBUG] segmentRole debug failed: {}".format(_e))
+            except Exception as _e:
+                print("[DEBUG] segmentRole debug failed: {}".format(_e))
 
         self._container: Optional[Any] = None
 
         # --------------------------------------------------
         # DEBUG / SMOKE: ensure we can see *something* without
         # relying on external callers to invoke render_demo().
-        # This runs after the widget is in a layout.
+        # Scheduled from the first showEvent, so blocks that are never shown
+        # never pay for it.
         # --------------------------------------------------
         # Demo rendering is only for explicit debug/test runs.
-        if self._test_mode or self._debug_demo:
-            try:
-                QTimer.singleShot(0, self.render_demo_on_current_page)
-            except Exception:
-                pass
+        self._demo_pending = self._test_mode or self._debug_demo
 
     def _wire_segments(self, root: QWidget) -> None:
         # We must ensure segment frames on ALL pages (and on the current page)
@@ -95,27 +165,27 @@ class JamoBlock(QWidget):
         stacked = self._stacked
         pages: list[QWidget] = []
 
+        # The template set is fixed by jamo.ui; next/prev_template reuse the count.
+        self._template_count = int(stacked.count()) if stacked is not None else 0
         if stacked is not None:
-            for i in range(int(stacked.count())):
+            for i in range(self._template_count):
                 w = stacked.widget(i)
                 if isinstance(w, QWidget):
                     pages.append(w)
 
-        # Fall back to the provided root if stacked is missing.
+        # Fall back to the provided root if stacked is missing; its frames may
+        # sit at any depth, so only that case pays for a recursive search.
+        fallback_frames: Optional[list[QFrame]] = None
         if not pages:
             pages = [root]
+            fallback_frames = root.findChildren(QFrame)
 
         for page in pages:
-            for frame in page.findChildren(QFrame):
-                role_name = frame.property("segmentRole")
-                if role_name not in ("Top", "Middle", "Bottom"):
-                    continue
-
+            for role_name, frame in _index_page_frames(page, fallback_frames).items():
                 if frame.layout() is None:
-                    layout = QVBoxLayout(frame)
-                    layout.setContentsMargins(0, 0, 0, 0)
-                    layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                    frame.setLayout(layout)
+                    _make_center_vbox(frame)
+                    # Fresh, empty layout: the first attach has nothing to clear.
+                    frame._hg_dirty = False
 
                 if self._test_mode:
                     # Ensure stable, discoverable glyph labels for tests.
@@ -133,20 +203,21 @@ class JamoBlock(QWidget):
         page = self._current_page()
         if page is None:
             return None
-        for frame in page.findChildren(QFrame):
-            if frame.property("segmentRole") == role:
-                return frame
-        return None
+        attr = _ROLE_ATTR.get(role)
+        if attr is None:
+            return None
+        frame = getattr(page, attr, _UNINDEXED)
+        if frame is _UNINDEXED:
+            # Page not seen by _wire_segments (added later): index it once.
+            _index_page_frames(page)
+            frame = getattr(page, attr)
+        return frame
 
     def _ensure_layout(self, frame: QFrame) -> QVBoxLayout:
         """Ensure the given frame has a QVBoxLayout and return it."""
         lay = frame.layout()
         if lay is None:
-            layout = QVBoxLayout(frame)
-            layout.setContentsMargins(0, 0, 0, 0)
-            layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            frame.setLayout(layout)
-            return layout
+            return _make_center_vbox(frame)
         # Best-effort: cast to QVBoxLayout-like API.
         return cast(QVBoxLayout, lay)  # type: ignore[return-value]
 
@@ -156,45 +227,41 @@ class JamoBlock(QWidget):
         We keep a stable child widget per segment so tests can find glyph text even when
         the production renderer uses custom paint widgets.
         """
-        obj_name = "testGlyph{}".format(role)
-        existing = frame.findChild(QLabel, obj_name)
-        if existing is not None:
-            return existing
-
-        lbl = QLabel(frame)
-        lbl.setObjectName(obj_name)
-        lbl.setProperty("glyphRole", role)
-        lbl.setProperty("_testExposure", True)
-        lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        # Keep it in the widget tree for discovery; it does not need to be visible.
-        lbl.setVisible(False)
+        lbl = getattr(frame, "_hg_test_label", None)
+        if lbl is None or sip.isdeleted(lbl) or lbl.parentWidget() is not frame:
+            # First call, or the cached label was cleared away with the segment.
+            obj_name = "testGlyph{}".format(role)
+            # The label is always created as a direct child of the frame.
+            lbl = frame.findChild(QLabel, obj_name, _DIRECT_ONLY)
+            if lbl is None:
+                lbl = QLabel(frame)
+                lbl.setObjectName(obj_name)
+                lbl.setProperty("glyphRole", role)
+                lbl.setProperty("_testExposure", True)
+                lbl.setAlignment(_ALIGN_CENTER)
+                # Keep it in the widget tree for discovery; it does not need to be visible.
+                lbl.setVisible(False)
+            frame._hg_test_label = lbl
 
         # Ensure the exposure label is also a layout child immediately so tests that
         # assert `layout.count() >= 1` pass deterministically without relying on
-        # deferred rendering.
+        # deferred rendering. indexOf() avoids duplicate insertions in one call.
         lay = frame.layout()
         if lay is None:
             lay = self._ensure_layout(frame)
-        # Avoid duplicate insertions.
-        already_in_layout = False
-        try:
-            for i in range(int(lay.count())):
-                it = lay.itemAt(i)
-                if it is not None and it.widget() is lbl:
-                    already_in_layout = True
-                    break
-        except Exception:
-            already_in_layout = False
-        if not already_in_layout:
-            try:
-                lay.addWidget(lbl)
-            except Exception:
-                pass
+        if lay.indexOf(lbl) < 0:
+            lay.addWidget(lbl)
+            frame._hg_dirty = True
 
         return lbl
 
     def set_exposed_glyph(self, role: str, text: str) -> None:
-        """Set the test-exposed glyph text for a segment role (Top/Middle/Bottom)."""
+        """Set the test-exposed glyph text for a segment role (Top/Middle/Bottom).
+
+        No-op unless HANGUL_TEST_MODE is set; production never needs the labels.
+        """
+        if not self._test_mode:
+            return
         frame = self._find_segment_frame_on_current_page(role)
         if frame is None:
             return
@@ -203,12 +270,20 @@ class JamoBlock(QWidget):
 
     def set_exposed_glyphs(self, top: str, middle: str, bottom: str) -> None:
         """Convenience: set all three exposed glyph strings."""
+        if not self._test_mode:
+            return
         self.set_exposed_glyph("Top", top)
         self.set_exposed_glyph("Middle", middle)
         self.set_exposed_glyph("Bottom", bottom)
 
-    def debug_dump_current_template(self, prefix: str = "[DEBUG]") -> None:
-        """Print what is currently attached inside the active template page."""
+    def debug_dump_current_template(self, prefix: str = "[DEBUG]", *, force: bool = False) -> None:
+        """Print what is currently attached inside the active template page.
+
+        Only runs when UI debugging is on (HANGUL_UI_DEBUG / _DEBUG_JAMO_BLOCK)
+        or when the caller opts in with `force=True`.
+        """
+        if not (self._debug or force):
+            return
         try:
             stacked = self._stacked
             if stacked is None:
@@ -230,72 +305,54 @@ class JamoBlock(QWidget):
                     continue
 
                 lay = frame.layout()
-                lay_type = type(lay).__name__ if lay is not None else "None"
                 count = lay.count() if lay is not None else -1
-                sr = frame.property("segmentRole")
+                fgeo = frame.geometry()
                 print(
                     "{}  segment role={} propRole={} objName={} layout={} items={} frame_geo={}x{}+{}+{}".format(
                         prefix,
                         role,
-                        sr,
+                        frame.property("segmentRole"),
                         frame.objectName(),
-                        lay_type,
+                        type(lay).__name__ if lay is not None else "None",
                         count,
-                        frame.geometry().width(),
-                        frame.geometry().height(),
-                        frame.geometry().x(),
-                        frame.geometry().y(),
+                        fgeo.width(),
+                        fgeo.height(),
+                        fgeo.x(),
+                        fgeo.y(),
                     )
                 )
 
-                if lay is None:
-                    continue
-
-                for i in range(lay.count()):
+                for i in range(count):
                     item = lay.itemAt(i)
                     w = item.widget() if item is not None else None
                     if w is None:
                         print("{}    [{}] <no-widget>".format(prefix, i))
                         continue
 
-                    desc = type(w).__name__
                     text = ""
-                    try:
-                        if hasattr(w, "text"):
-                            text = str(w.text() or "")
-                    except Exception:
-                        text = ""
+                    text_fn = getattr(w, "text", None)
+                    if text_fn is not None:
+                        try:
+                            text = str(text_fn() or "")
+                        except Exception:
+                            text = ""
 
                     geo = w.geometry()
-                    if text:
-                        print(
-                            "{}    [{}] {} text='{}' visible={} geo={}x{}+{}+{} parent={}".format(
-                                prefix,
-                                i,
-                                desc,
-                                text,
-                                w.isVisible(),
-                                geo.width(),
-                                geo.height(),
-                                geo.x(),
-                                geo.y(),
-                                type(w.parent()).__name__ if w.parent() is not None else "None",
-                            )
-                        )
-                    else:
-                        print(
-                            "{}    [{}] {} visible={} geo={}x{}+{}+{} parent={}".format(
-                                prefix,
-                                i,
-                                desc,
-                                w.isVisible(),
-                                geo.width(),
-                                geo.height(),
-                                geo.x(),
-                                geo.y(),
-                                type(w.parent()).__name__ if w.parent() is not None else "None",
-                            )
+                    parent = w.parent()
+                    print(
+                        "{}    [{}] {}{} visible={} geo={}x{}+{}+{} parent={}".format(
+                            prefix,
+                            i,
+                            type(w).__name__,
+                            " text='{}'".format(text) if text else "",
+                            w.isVisible(),
+                            geo.width(),
+                            geo.height(),
+                            geo.x(),
+                            geo.y(),
+                            type(parent).__name__ if parent is not None else "None",
                         )
+                    )
         except Exception as e:
             print("{} JamoBlock debug_dump_current_template failed: {}".format(prefix, e))
 
@@ -311,6 +368,12 @@ class JamoBlock(QWidget):
     def minimumSizeHint(self) -> QSize:
         return QSize(200 + self._EXTRA_WIDTH, 200)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._demo_pending:
+            self._demo_pending = False
+            QTimer.singleShot(0, self.render_demo_on_current_page)
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
         item = self._inner_layout.itemAt(0)
@@ -323,6 +386,12 @@ class JamoBlock(QWidget):
         width = height + self._EXTRA_WIDTH
         left = (self.width() - width) // 2
         top = (self.height() - height) // 2
+        # Each setter below invalidates the layout; skip them when a resize
+        # (e.g. a drag micro-step) lands on the same square geometry.
+        geom = (width, height, left, top)
+        if geom == self._last_square_geom:
+            return
+        self._last_square_geom = geom
         self._inner_layout.setContentsMargins(left, top, left, top)
         child.setMinimumSize(width, height)
         child.setMaximumSize(width, height)
@@ -340,16 +409,14 @@ class JamoBlock(QWidget):
         return self._stacked
 
     def next_template(self) -> None:
-        if self._stacked.count() > 0:
-            self._stacked.setCurrentIndex(
-                (self._stacked.currentIndex() + 1) % self._stacked.count()
-            )
+        n = self._template_count
+        if n:
+            self._stacked.setCurrentIndex((self._stacked.currentIndex() + 1) % n)
 
     def prev_template(self) -> None:
-        if self._stacked.count() > 0:
-            self._stacked.setCurrentIndex(
-                (self._stacked.currentIndex() - 1) % self._stacked.count()
-            )
+        n = self._template_count
+        if n:
+            self._stacked.setCurrentIndex((self._stacked.currentIndex() - 1) % n)
 
     def render_demo(self) -> None:
         """Public demo renderer (kept for callers that expect render_demo())."""
@@ -364,11 +431,12 @@ class JamoBlock(QWidget):
                 print("[DEBUG] render_demo_on_current_page: stackedTemplates not found")
                 return
 
-            idx = int(stacked.currentIndex())
-            page_name = page.objectName() if page is not None else "None"
-            print("[DEBUG] render_demo_on_current_page: index={} page={}".format(idx, page_name))
-            # If this line never appears, the demo renderer is not being invoked.
-            print("[DEBUG] render_demo_on_current_page: ENTER")
+            if self._debug:
+                idx = int(stacked.currentIndex())
+                page_name = page.objectName() if page is not None else "None"
+                print("[DEBUG] render_demo_on_current_page: index={} page={}".format(idx, page_name))
+                # If this line never appears, the demo renderer is not being invoked.
+                print("[DEBUG] render_demo_on_current_page: ENTER")
 
             # Resolve segment frames from the CURRENT page only.
             top_frame = self._find_segment_frame_on_current_page("Top")
@@ -385,102 +453,100 @@ class JamoBlock(QWidget):
                 return
 
             # [DEBUG] print which frames are being used (object names)
-            print(
-                "[DEBUG] render_demo_on_current_page: using frames top={} mid={} bot={}"
-                .format(top_frame.objectName(), mid_frame.objectName(), bot_frame.objectName())
-            )
-            # Clear existing widgets (layout items) safely.
-            for role, frame in (("Top", top_frame), ("Middle", mid_frame), ("Bottom", bot_frame)):
-                if frame.layout() is None:
-                    layout = QVBoxLayout(frame)
-                    layout.setContentsMargins(0, 0, 0, 0)
-                    layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                    frame.setLayout(layout)
-                    print(
-                        "[DEBUG] render_demo_on_current_page: created layout for role={} objName={}".format(
-                            role, frame.objectName()
+            if self._debug:
+                print(
+                    "[DEBUG] render_demo_on_current_page: using frames top={} mid={} bot={}"
+                    .format(top_frame.objectName(), mid_frame.objectName(), bot_frame.objectName())
+                )
+            # Batch the teardown and repopulation: updates stay off until every
+            # segment is rebuilt, then re-enabling repaints the block once.
+            self.setUpdatesEnabled(False)
+            try:
+                # Clear existing widgets (layout items) safely.
+                for role, frame in (("Top", top_frame), ("Middle", mid_frame), ("Bottom", bot_frame)):
+                    if frame.layout() is None:
+                        _make_center_vbox(frame)
+                        if self._debug:
+                            print(
+                                "[DEBUG] render_demo_on_current_page: created layout for role={} objName={}".format(
+                                    role, frame.objectName()
+                                )
+                            )
+                    elif self._debug:
+                        print(
+                            "[DEBUG] render_demo_on_current_page: existing layout for role={} objName={} type={}".format(
+                                role, frame.objectName(), type(frame.layout()).__name__
+                            )
                         )
-                    )
-                else:
-                    print(
-                        "[DEBUG] render_demo_on_current_page: existing layout for role={} objName={} type={}".format(
-                            role, frame.objectName(), type(frame.layout()).__name__
+
+                for role, frame in (("Top", top_frame), ("Middle", mid_frame), ("Bottom", bot_frame)):
+                    lay = frame.layout()
+                    if lay is None:
+                        print(
+                            "[DEBUG] render_demo_on_current_page: ERROR layout is None after ensure for role={} objName={}".format(
+                                role, frame.objectName()
+                            )
                         )
-                    )
+                        continue
 
-            for role, frame in (("Top", top_frame), ("Middle", mid_frame), ("Bottom", bot_frame)):
-                lay = frame.layout()
-                if lay is None:
+                    # Remove non-test widgets without disturbing stable test-exposure labels.
+                    try:
+                        for i in reversed(range(int(lay.count()))):
+                            it = lay.itemAt(i)
+                            w = it.widget() if it is not None else None
+                            if w is None:
+                                continue
+                            if bool(w.property("_testExposure")):
+                                continue
+                            lay.takeAt(i)
+                            w.setParent(None)
+                    except Exception:
+                        # Best-effort fallback: do nothing.
+                        pass
+
+                # Add demo widgets via frame.layout().addWidget(...)
+                tl = top_frame.layout()
+                ml = mid_frame.layout()
+                bl = bot_frame.layout()
+
+                if tl is None or ml is None or bl is None:
                     print(
-                        "[DEBUG] render_demo_on_current_page: ERROR layout is None after ensure for role={} objName={}".format(
-                            role, frame.objectName()
+                        "[DEBUG] render_demo_on_current_page: ERROR one or more layouts missing (tl={}, ml={}, bl={})".format(
+                            tl is not None, ml is not None, bl is not None
                         )
                     )
-                    continue
-
-                # Remove non-test widgets without disturbing stable test-exposure labels.
-                try:
-                    for i in reversed(range(int(lay.count()))):
-                        it = lay.itemAt(i)
-                        w = it.widget() if it is not None else None
-                        if w is None:
-                            continue
-                        if bool(w.property("_testExposure")):
-                            continue
-                        lay.takeAt(i)
-                        w.setParent(None)
-                except Exception:
-                    # Best-effort fallback: do nothing.
-                    pass
-
-            # Add demo widgets via frame.layout().addWidget(...)
-            tl = top_frame.layout()
-            ml = mid_frame.layout()
-            bl = bot_frame.layout()
-
-            if tl is None or ml is None or bl is None:
-                print(
-                    "[DEBUG] render_demo_on_current_page: ERROR one or more layouts missing (tl={}, ml={}, bl={})".format(
-                        tl is not None, ml is not None, bl is not None
-                    )
-                )
-                self.debug_dump_current_template(prefix="[DEBUG]")
-                return
+                    self.debug_dump_current_template(prefix="[DEBUG]")
+                    return
+
+                # --------------------------------------------------
+                # DEBUG SMOKE RENDER
+                # Use plain labels but fit text to the segment bounds.
+                # --------------------------------------------------
+
+                def _mk_label(text: str, target: QFrame) -> QLabel:
+                    lbl = QLabel(text)
+                    lbl.setAlignment(_ALIGN_CENTER)
+                    lbl.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+                    _fit_label_font_to_label_rect(lbl, target, min_pt=12, max_pt=120, padding_px=8)
+                    return lbl
+
+                top_lbl = _mk_label("ㄱ", top_frame)
+                mid_lbl = _mk_label("ㅏ", mid_frame)
+                bot_lbl = _mk_label("∅", bot_frame)
+
+                tl.addWidget(top_lbl)
+                ml.addWidget(mid_lbl)
+                bl.addWidget(bot_lbl)
+                for frame in (top_frame, mid_frame, bot_frame):
+                    frame._hg_dirty = True
 
-            # --------------------------------------------------
-            # DEBUG SMOKE RENDER
-            # Use plain labels but fit text to the segment bounds.
-            # --------------------------------------------------
-
-            def _mk_label(text: str, target: QFrame) -> QLabel:
-                lbl = QLabel(text)
-                lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                sp = lbl.sizePolicy()
-                sp.setHorizontalPolicy(QSizePolicy.Policy.Expanding)
-                sp.setVerticalPolicy(QSizePolicy.Policy.Expanding)
-                lbl.setSizePolicy(sp)
-                _fit_label_font_to_label_rect(lbl, target, min_pt=12, max_pt=120, padding_px=8)
-                return lbl
-
-            top_lbl = _mk_label("ㄱ", top_frame)
-            mid_lbl = _mk_label("ㅏ", mid_frame)
-            bot_lbl = _mk_label("∅", bot_frame)
-
-            tl.addWidget(top_lbl)
-            ml.addWidget(mid_lbl)
-            bl.addWidget(bot_lbl)
-
-            if self._test_mode:
-                self.set_exposed_glyphs("ㄱ", "ㅏ", "∅")
-
-            # Force a layout pass and repaint, then dump what we actually attached.
+                if self._test_mode:
+                    self.set_exposed_glyphs("ㄱ", "ㅏ", "∅")
+            finally:
+                self.setUpdatesEnabled(True)
+            # Force a layout pass; in debug mode also dump what we actually attached.
             self.updateGeometry()
-            self.update()
-            if page is not None:
-                page.update()
-            top_frame.update()
-            mid_frame.update()
-            bot_frame.update()
-            QTimer.singleShot(0, lambda: self.debug_dump_current_template(prefix="[DEBUG]"))
+            if self._debug:
+                QTimer.singleShot(0, lambda: self.debug_dump_current_template(prefix="[DEBUG]"))
         except Exception as e:
             print("[DEBUG] render_demo_on_current_page failed: {}".format(e))
@@ -18,13 +18,24 @@ from PyQt6.QtWidgets import (
 )
 
 
+_TITLE_FONT_CACHE: dict[tuple[int, bool], QFont] = {}
+
+
+def _title_font(point_size: int, bold: bool) -> QFont:
+    """Return the shared title QFont for (point_size, bold), building it once."""
+    key = (point_size, bold)
+    f = _TITLE_FONT_CACHE.get(key)
+    if f is None:
+        f = _TITLE_FONT_CACHE[key] = QFont()
+        f.setPointSize(point_size)
+        f.setBold(bold)
+    return f
+
+
 def _mk_title_label(text: str, *, point_size: int = 14, bold: bool = True) -> QLabel:
     """Create a standard title label."""
     lbl = QLabel(text)
-    f = QFont()
-    f.setPointSize(int(point_size))
-    f.setBold(bool(bold))
-    lbl.setFont(f)
+    lbl.setFont(_title_font(int(point_size), bool(bold)))
     lbl.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignVCenter)
     lbl.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
     return lbl
@@ -84,6 +95,16 @@ def _make_labeled_column_custom(
         A QWidget containing the title widget above the body.
     """
 
+    # Fast path: new-style (str title, QWidget body) needs no convention or tooltip handling.
+    if body is None and isinstance(title, str) and isinstance(tip_or_body, QWidget):
+        outer = QWidget()
+        layout = QVBoxLayout(outer)
+        layout.setContentsMargins(int(margins[0]), int(margins[1]), int(margins[2]), int(margins[3]))
+        layout.setSpacing(int(spacing))
+        layout.addWidget(_mk_title_label(title, point_size=int(title_point_size), bold=bool(bold)))
+        layout.addWidget(tip_or_body)
+        return outer
+
     # --- Resolve calling convention ---
     tooltip: str | None
     body_widget: QWidget
@@ -112,14 +133,8 @@ def _make_labeled_column_custom(
         title_widget = title
 
     if tooltip:
-        try:
-            title_widget.setToolTip(tooltip)
-        except Exception:
-            pass
-        try:
-            outer.setToolTip(tooltip)
-        except Exception:
-            pass
+        title_widget.setToolTip(tooltip)
+        outer.setToolTip(tooltip)
 
     layout.addWidget(title_widget)
     layout.addWidget(body_widget)
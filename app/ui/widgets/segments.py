@@ -12,6 +12,15 @@ from app.domain.enums import ConsonantPosition
 from app.ui.fit_text import AutoFitLabel
 
 
+# Segment role -> "Top"/"Middle"/"Bottom" (or None), filled on first use.
+_ROLE_NAME_CACHE: dict[Any, Optional[str]] = {}
+
+
+def _resolve_role_name(role: Any) -> Optional[str]:
+    name = role.name if hasattr(role, "name") else role
+    return name if name in ("Top", "Middle", "Bottom") else None
+
+
 class SegmentView(QWidget):
     """A lightweight container widget representing one Hangul block segment.
 
@@ -20,7 +29,8 @@ class SegmentView(QWidget):
 
     1) as an attribute (returned by role()), and
     2) as a dynamic Qt property 'segmentRole' with string values
-       {"Top", "Middle", "Bottom"} when possible.
+       {"Top", "Middle", "Bottom"} when possible, mirrored in the Python-side
+       `_hg_segment_role` attribute so discovery can skip property() calls.
 
     This enables utilities such as `layout._enforce_equal_segment_heights(...)`
     and renderers to discover segment widgets without relying on object names.
@@ -36,21 +46,15 @@ class SegmentView(QWidget):
         super().__init__(parent)
         self._role = role
 
-        # Best-effort: reflect role into a dynamic property for discovery.
+        # Reflect role into a dynamic property for discovery.
         # Accept either enum-like objects (with .name) or strings.
         try:
-            role_name = getattr(role, "name", None)
-            if isinstance(role_name, str):
-                name = role_name
-            elif isinstance(role, str):
-                name = role
-            else:
-                name = None
-
-            if name in ("Top", "Middle", "Bottom"):
-                self.setProperty("segmentRole", name)
-        except (AttributeError, TypeError, ValueError):
-            pass
+            name = _ROLE_NAME_CACHE[role]
+        except KeyError:
+            name = _ROLE_NAME_CACHE[role] = _resolve_role_name(role)
+        if name is not None:
+            self.setProperty("segmentRole", name)
+        self._hg_segment_role = name
 
         # Ensure it always has a layout, because main render code expects one.
         if self.layout() is None:
@@ -93,18 +97,12 @@ class Characters(QWidget, metaclass=_QtABCMeta):
         layout.setContentsMargins(4, 4, 4, 4)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        sp_self = self.sizePolicy()
-        sp_self.setHorizontalPolicy(QSizePolicy.Policy.Expanding)
-        sp_self.setVerticalPolicy(QSizePolicy.Policy.Expanding)
-        self.setSizePolicy(sp_self)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
         self._glyph = AutoFitLabel(grapheme, self, min_pt=min_pt, max_pt=max_pt, padding=padding)
-        try:
-            # Ensure glyphs remain visible even if parent palettes/styles are muted.
-            self._glyph.setStyleSheet("color: #000000; background: transparent;")
-            self._glyph.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        except Exception:
-            pass
+        # Glyph colour/background come from the AutoFitLabel rule in the main
+        # window stylesheet (form.ui), parsed once rather than per presenter.
+        self._glyph.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self._glyph, 1)
 
     @abstractmethod
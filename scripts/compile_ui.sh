@@ -0,0 +1,9 @@
+#!/usr/bin/env bash
+# Regenerate app/ui/generated/ from the Designer files under ui/.
+set -euo pipefail
+
+ROOT_DIR="$(cd "$(dirname "$0")/.." && pwd)"
+cd "$ROOT_DIR"
+
+python -m PyQt6.uic.pyuic ui/form.ui -o app/ui/generated/ui_form.py
+python -m PyQt6.uic.pyuic ui/jamo.ui -o app/ui/generated/jamo_ui.py
@@ -0,0 +1,117 @@
+from PyQt6.QtCore import QTimer
+
+from app.controllers.playback_sequence_controller import PlaybackSequenceController
+from app.domain.enums import DelaysConfig
+
+
+_DELAYS = DelaysConfig(
+    pre_first_ms=3,
+    between_reps_ms=4,
+    before_hints_ms=2,
+    before_extras_ms=3,
+    auto_advance_ms=2,
+)
+
+
+def _make_seq(log: list, *, tts: str = "async", on_hints=None, on_advance=None) -> PlaybackSequenceController:
+    """Sequencer whose callbacks append to `log`; tts is "sync", "async" or "raise"."""
+
+    def _tts_play(glyph: str, done) -> None:
+        log.append(("tts", glyph))
+        if tts == "raise":
+            raise RuntimeError("tts unavailable")
+        if tts == "sync":
+            done()
+        else:
+            QTimer.singleShot(5, done)
+
+    def _hints() -> None:
+        log.append("hints")
+        if on_hints is not None:
+            on_hints()
+
+    def _advance() -> None:
+        log.append("adv")
+        if on_advance is not None:
+            on_advance()
+
+    seq = PlaybackSequenceController(
+        tts_play=_tts_play,
+        on_reveal_hints=_hints,
+        on_reveal_extras=lambda: log.append("extras"),
+        on_autoadvance=_advance,
+    )
+    seq.set_on_finished(lambda: log.append("fin"))
+    return seq
+
+
+def _settle(qtbot) -> None:
+    # Longer than any full sequence above; lets stale timers fire too.
+    qtbot.wait(150)
+
+
+def test_repeats_then_reveals_for_each_tts_mode(qtbot) -> None:
+    for mode in ("sync", "async", "raise"):
+        log: list = []
+        seq = _make_seq(log, tts=mode)
+        seq.start("가", 3, _DELAYS)
+        _settle(qtbot)
+        assert log == [("tts", "가")] * 3 + ["hints", "extras", "fin"], mode
+        assert not seq.is_running()
+
+
+def test_auto_mode_advances_then_finishes(qtbot) -> None:
+    log: list = []
+    seq = _make_seq(log)
+    seq.start("가", 1, _DELAYS, auto_mode=True)
+    _settle(qtbot)
+    assert log == [("tts", "가"), "hints", "extras", "adv", "fin"]
+
+
+def test_auto_advance_restart_runs_next_item(qtbot) -> None:
+    for mode in ("sync", "async"):
+        log: list = []
+        seq = None
+
+        def _next() -> None:
+            if log.count("adv") < 2:
+                seq.start("나", 1, _DELAYS, auto_mode=True)
+
+        seq = _make_seq(log, tts=mode, on_advance=_next)
+        seq.start("가", 2, _DELAYS, auto_mode=True)
+        _settle(qtbot)
+        assert log == [
+            ("tts", "가"), ("tts", "가"), "hints", "extras", "adv", "fin",
+            ("tts", "나"), "hints", "extras", "adv", "fin",
+        ], mode
+        assert not seq.is_running()
+
+
+def test_cancel_stops_pending_steps(qtbot) -> None:
+    log: list = []
+    seq = _make_seq(log)
+    seq.start("가", 3, _DELAYS)
+    QTimer.singleShot(8, seq.cancel)
+    _settle(qtbot)
+    assert log == [("tts", "가"), "fin"]
+    assert not seq.is_running()
+
+
+def test_restart_from_reveal_callback_is_not_overridden(qtbot) -> None:
+    # A reveal callback that starts a new run must not let the old run queue
+    # its extras step over the new run's steps, or finish the new run early.
+    log: list = []
+    seq = None
+
+    def _restart_once() -> None:
+        if log.count("hints") == 1:
+            seq.start("나", 1, _DELAYS)
+
+    seq = _make_seq(log, on_hints=_restart_once)
+    seq.start("가", 1, _DELAYS)
+    _settle(qtbot)
+    assert log == [
+        ("tts", "가"), "hints", "fin",
+        ("tts", "나"), "hints", "extras", "fin",
+    ]
+    assert not seq.is_running()
@@ -0,0 +1,21 @@
+from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget
+
+from app.ui.utils.qt_find import find_children
+
+
+def test_find_children_tracks_subtree_changes(qtbot):
+    root = QWidget()
+    qtbot.addWidget(root)
+    inner = QWidget(root)
+    QVBoxLayout(inner).addWidget(QLabel("a"))
+
+    first = find_children(root, QLabel)
+    assert len(first) == 1
+    assert find_children(root, QLabel) == first
+
+    # A grandchild added below an already-seen subtree must be found.
+    inner.layout().addWidget(QLabel("b"))
+    assert len(find_children(root, QLabel)) == 2
+
+    first[0].setParent(None)
+    assert len(find_children(root, QLabel)) == 1
@@ -0,0 +1,106 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from app.domain import syllables
+from app.domain.enums import BlockType
+from app.domain.syllables import select_cv_for_block
+
+
+_YAML = """\
+syllables:
+- {glyph: 가, consonant: ㄱ, vowel: ㅏ, block_type: A_RightBranch}
+- {glyph: 나, consonant: ㄴ, vowel: ㅏ, block_type: A_RightBranch}
+- {glyph: 노, consonant: ㄴ, vowel: ㅗ, block_type: B_TopBranch}
+- {glyph: 도, consonant: ㄷ, vowel: ㅗ, block_type: B_TopBranch}
+"""
+
+
+@pytest.fixture
+def syllables_yaml(tmp_path: Path, monkeypatch) -> Path:
+    """Point the loader at a temporary syllables.yaml with an empty module cache."""
+    path = tmp_path / "syllables.yaml"
+    path.write_text(_YAML, encoding="utf-8")
+    monkeypatch.setattr(syllables, "_syllables_yaml_path", lambda: path)
+    monkeypatch.setattr(syllables, "_YAML_CACHE", None)
+    monkeypatch.setattr(syllables, "_SYLL_INDEX", {})
+    return path
+
+
+def test_select_cv_for_block_prefers_consonant(syllables_yaml: Path) -> None:
+    assert select_cv_for_block(BlockType.A_RightBranch, prefer_consonant="ㄴ") == ("ㄴ", "ㅏ", "나")
+
+
+def test_select_cv_for_block_falls_back_to_first_entry(syllables_yaml: Path) -> None:
+    # ㄱ has no B_TopBranch entry, so the block type's first entry is used.
+    assert select_cv_for_block(BlockType.B_TopBranch, prefer_consonant="ㄱ") == ("ㄴ", "ㅗ", "노")
+    assert select_cv_for_block(BlockType.B_TopBranch) == ("ㄴ", "ㅗ", "노")
+
+
+def test_select_cv_for_block_falls_back_without_entries(syllables_yaml: Path) -> None:
+    assert select_cv_for_block(BlockType.D_Horizontal) == ("ㄱ", "ㅡ", "그")
+    assert select_cv_for_block("Z_Unknown") == ("ㄱ", "ㅏ", "가")
+
+    syllables_yaml.write_text("metadata: {version: 1}\n", encoding="utf-8")
+    assert select_cv_for_block(BlockType.C_BottomBranch) == ("ㄱ", "ㅜ", "구")
+
+
+def test_block_container_attach_without_pair(qtbot) -> None:
+    from app.ui.jamo.block_container import BlockContainer
+    from app.ui.widgets.jamo_block import JamoBlock
+
+    block = JamoBlock()
+    qtbot.addWidget(block)
+    # No consonant/vowel: attach picks a sample CV for the type itself.
+    for index, bt in enumerate((BlockType.A_RightBranch, BlockType.B_TopBranch)):
+        BlockContainer(bt).attach(block.stacked)
+        assert block.stacked.currentIndex() == index
+
+
+def _load_fresh() -> dict:
+    """Load through the sidecar/YAML path, bypassing the in-memory cache."""
+    syllables._YAML_CACHE = None
+    return syllables._load_syllables_yaml()
+
+
+def test_json_sidecar_is_used_while_yaml_is_unchanged(syllables_yaml: Path) -> None:
+    _load_fresh()
+    sidecar = syllables_yaml.with_suffix(".json")
+    doc = json.loads(sidecar.read_text(encoding="utf-8"))
+    st = syllables_yaml.stat()
+    assert doc["source"] == [st.st_mtime_ns, st.st_size]
+
+    # A marker only the sidecar carries proves it is served instead of the YAML.
+    doc["data"]["marker"] = "from-json"
+    sidecar.write_text(json.dumps(doc), encoding="utf-8")
+    assert _load_fresh().get("marker") == "from-json"
+
+
+def test_json_sidecar_ignored_when_yaml_is_older(syllables_yaml: Path) -> None:
+    _load_fresh()
+    sidecar = syllables_yaml.with_suffix(".json")
+    old_ns = sidecar.stat().st_mtime_ns - 10_000_000_000
+
+    # Restored/copied YAML with an mtime older than the existing sidecar.
+    syllables_yaml.write_text("syllables: []\nmarker: from-yaml\n", encoding="utf-8")
+    os.utime(syllables_yaml, ns=(old_ns, old_ns))
+    assert _load_fresh().get("marker") == "from-yaml"
+
+
+def test_json_sidecar_rebuilt_after_yaml_edit(syllables_yaml: Path) -> None:
+    _load_fresh()
+    syllables_yaml.write_text(_YAML + "marker: edited\n", encoding="utf-8")
+    assert _load_fresh().get("marker") == "edited"
+
+    doc = json.loads(syllables_yaml.with_suffix(".json").read_text(encoding="utf-8"))
+    st = syllables_yaml.stat()
+    assert doc["source"] == [st.st_mtime_ns, st.st_size]
+    assert doc["data"]["marker"] == "edited"
+
+
+def test_json_sidecar_skipped_for_lossy_data(syllables_yaml: Path) -> None:
+    syllables_yaml.write_text("syllables: []\n1: one\n", encoding="utf-8")
+    assert _load_fresh()[1] == "one"
+    assert not syllables_yaml.with_suffix(".json").exists()
@@ -197,4 +197,32 @@ def test_cache_miss_triggers_synthesis(monkeypatch, main_module):
             out = api(glyph=glyph, voice=voice, wpm=wpm)
 
     assert Path(out).exists(), "Synth should create the file on cache miss."
-    assert created["n"] == 1, "Synth should be called exactly once."
\ No newline at end of file
+    assert created["n"] == 1, "Synth should be called exactly once."
+
+# ------------------------------
+# ensure_cached_wav (app.services.tts_pronouncer)
+# ------------------------------
+
+def test_ensure_cached_wav_resynthesizes_deleted_file(monkeypatch, tmp_path: Path):
+    """A remembered WAV that was deleted must be rebuilt, not returned stale."""
+    from app.services import tts_pronouncer
+
+    monkeypatch.setenv("HANGUL_TTS_CACHE_DIR", str(tmp_path))
+    calls = {"n": 0}
+
+    def _synth(text: str) -> bytes:
+        calls["n"] += 1
+        return b"RIFF....WAVE"
+
+    first = tts_pronouncer.ensure_cached_wav("가", synthesizer=_synth)
+    assert first.exists() and calls["n"] == 1
+
+    # Cache hit: no second synthesis.
+    assert tts_pronouncer.ensure_cached_wav("가", synthesizer=_synth) == first
+    assert calls["n"] == 1
+
+    first.unlink()
+    again = tts_pronouncer.ensure_cached_wav("가", synthesizer=_synth)
+    assert again == first
+    assert again.exists()
+    assert calls["n"] == 2
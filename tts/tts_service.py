@@ -105,7 +105,15 @@ class TTSService:
                 cmd += ["-r", str(self.rate)]
             cmd += [text]
             try:
-                subprocess.Popen(cmd)
+                # No shell; detached with its own session and no inherited stdio,
+                # so a stray `say` never blocks on or writes into the app's streams.
+                subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
             except Exception as e:
                 print(f"[TTS] macOS say failed: {e}")
         else: